@@ -0,0 +1,362 @@
+"""Backtesting forecasts of the final table, by replaying archived seasons
+matchday by matchday, e.g.::
+
+    results = backtest(range(1995, 2025), leagues=DASHBOARD_LEAGUES)
+    summarise_backtest(results)["linear"]["mae"]
+
+A forecaster is any (picklable) function taking the season so far, as from
+:func:`~proggyleg.proggyleg.compute_cumulative_quantities`, and returning a
+dict with:
+
+- ``"points"``: the predicted final points of each team, ordered as
+  ``data["teams"]``,
+- ``"zones"`` (optional): a dict mapping zone labels of
+  :func:`~proggyleg.clinch.get_zones` to the probability of each team
+  finishing in them, as from :func:`~proggyleg.projection.project_season`.
+  Without it, each team is predicted to finish where its predicted points
+  rank it.
+
+After matchday ``k``, i.e. the shortest prefix of the matches after which
+every team has played at least ``k`` games, each forecast is scored against
+the final outcome by the mean absolute error of the points, the Spearman
+rank correlation of the points with the final table, and the Brier score of
+each zone. League-seasons are scored in parallel, and the scores of each
+forecaster for each league-season cached on disk, so only new forecasters
+or seasons are ever replayed.
+"""
+
+import pathlib
+
+import numpy as np
+
+
+def linear_forecaster(data):
+    """Extrapolate every team's points per game so far, as
+    :func:`~proggyleg.proggyleg.plot_extrapolated_performance` does.
+    """
+    games = np.array([data["games_played"][t] - 1 for t in data["teams"]])
+    points = np.array([data["current_points"][t] for t in data["teams"]])
+    return {"points": data["total_games"] * points / np.maximum(games, 1)}
+
+
+def projection_forecaster(data):
+    """The expected final points and zone probabilities of
+    :func:`~proggyleg.projection.project_season`, sampling outcomes.
+    """
+    from .projection import project_season
+
+    projection = project_season(
+        data, method="sample", num_samples=2_000, seed=0
+    )
+    return {
+        "points": projection["expected_points"],
+        "zones": projection["zones"],
+    }
+
+
+FORECASTERS = {
+    "linear": linear_forecaster,
+    "projection": projection_forecaster,
+}
+
+
+def replay_season(data, step=1):
+    """Replay a season matchday by matchday, yielding ``(matchday, data)``
+    pairs for every ``step``-th matchday at which all teams have played,
+    with ``data`` as if only the matches up to then had been played.
+    """
+    from .proggyleg import compute_cumulative_quantities, matchday_ends
+
+    matches = data["matches"]
+    if data["dates"] is not None:
+        matches = [(d, *m) for d, m in zip(data["dates"], matches)]
+    # n.b. penalties are applied from before the first game
+    penalties = {
+        team: -cpts[0] for team, cpts in data["cumpoints"].items() if cpts[0]
+    }
+
+    ends = matchday_ends(data)
+    for matchday in range(step, len(ends) + 1, step):
+        yield (
+            matchday,
+            compute_cumulative_quantities(
+                matches[: ends[matchday - 1]],
+                penalties=penalties,
+                league=data["league"],
+                year=data["year"],
+                rules=data["rules"],
+            ),
+        )
+
+
+def _ranks(x):
+    """The ranks of ``x``, averaging any ties."""
+    x = np.asarray(x, dtype=float)
+    order = np.argsort(x, kind="stable")
+    xs = x[order]
+    # the first and last index of each run of equal values
+    starts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    ends = np.r_[starts[1:], len(xs)] - 1
+    ranks = np.empty(len(x))
+    ranks[order] = np.repeat((starts + ends) / 2, ends - starts + 1)
+    return ranks
+
+
+def spearman(x, y):
+    """The Spearman rank correlation of ``x`` and ``y``."""
+    rx, ry = _ranks(x), _ranks(y)
+    rx, ry = rx - rx.mean(), ry - ry.mean()
+    denominator = np.sqrt((rx**2).sum() * (ry**2).sum())
+    return (rx * ry).sum() / denominator if denominator else np.nan
+
+
+def _zone_masks(positions, zones, num_teams):
+    """Whether each team's position (0 the bottom) is in each zone."""
+    return np.array(
+        [
+            positions >= num_teams + pos if pos < 0 else positions <= pos
+            for _, pos in zones
+        ]
+    )
+
+
+def score_forecast(forecast, snapshot, final):
+    """Score one forecast, made from ``snapshot``, against the ``final``
+    table of the season.
+
+    Returns
+    -------
+    dict
+        With keys ``"mae"``, ``"spearman"`` and ``"brier"``, the last an
+        array over the zones of :func:`~proggyleg.clinch.get_zones`.
+    """
+    from .clinch import get_zones
+
+    teams = final["teams"]
+    n = final["num_teams"]
+    zones = get_zones(final["league"], final["year"])
+    points = np.asarray(forecast["points"], dtype=float)
+    final_points = np.array([final["current_points"][t] for t in teams])
+    final_positions = np.array([final["places"][t] for t in teams])
+
+    if "zones" in forecast:
+        probabilities = np.array(
+            [forecast["zones"][label] for label, _ in zones], dtype=float
+        ).reshape(len(zones), n)
+    else:
+        # rank on predicted points, breaking ties by the current table
+        order = np.lexsort(([snapshot["places"][t] for t in teams], points))
+        positions = np.empty(n, dtype=int)
+        positions[order] = np.arange(n)
+        probabilities = _zone_masks(positions, zones, n).astype(float)
+
+    outcomes = _zone_masks(final_positions, zones, n)
+    return {
+        "mae": np.abs(points - final_points).mean(),
+        "spearman": spearman(points, final_positions),
+        "brier": ((probabilities - outcomes) ** 2).mean(axis=1),
+    }
+
+
+def backtest_season(data, forecasters=FORECASTERS, step=1):
+    """Replay a finished season, see :func:`replay_season`, scoring every
+    forecast of ``forecasters``, a dict of named forecaster functions.
+
+    Returns
+    -------
+    dict
+        Mapping each forecaster name to a dict with keys ``"matchdays"``,
+        and the scores after each, ``"mae"``, ``"spearman"`` and
+        ``"brier"``, the last with shape ``(num_matchdays, num_zones)``.
+    """
+    unfinished = [
+        team
+        for team, games in data["games_played"].items()
+        if games - 1 < data["total_games"]
+    ]
+    if unfinished:
+        raise ValueError(
+            f"Season {data['league']} {data['year']} hasn't finished, "
+            f"{len(unfinished)} teams still have games to play."
+        )
+
+    scores = {name: [] for name in forecasters}
+    matchdays = []
+    for matchday, snapshot in replay_season(data, step):
+        matchdays.append(matchday)
+        for name, fn in forecasters.items():
+            scores[name].append(score_forecast(fn(snapshot), snapshot, data))
+
+    return {
+        name: {
+            "matchdays": np.array(matchdays, dtype=int),
+            **{
+                key: np.array([s[key] for s in season_scores])
+                for key in ("mae", "spearman", "brier")
+            },
+        }
+        for name, season_scores in scores.items()
+    }
+
+
+def _cache_path(cache_dir, name, league, year, step):
+    return pathlib.Path(cache_dir) / f"{name}-{league}-{year}-{step}.npz"
+
+
+def _backtest_key(league, year, forecasters, step, source, cache_dir):
+    """Load and backtest one league-season, reading and writing the cached
+    scores of each forecaster in ``cache_dir``.
+    """
+    from .proggyleg import load_season_data
+
+    results = {}
+    for name in forecasters:
+        path = _cache_path(cache_dir, name, league, year, step)
+        if path.exists():
+            with np.load(path) as f:
+                results[name] = dict(f)
+
+    missing = {
+        name: fn for name, fn in forecasters.items() if name not in results
+    }
+    if missing:
+        data = load_season_data(year=year, league=league, source=source)
+        for name, scores in backtest_season(data, missing, step).items():
+            path = _cache_path(cache_dir, name, league, year, step)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(path, **scores)
+            results[name] = scores
+    return results
+
+
+def backtest(
+    years,
+    leagues=("E0",),
+    forecasters=FORECASTERS,
+    step=1,
+    source="auto",
+    cache_dir=None,
+    executor=None,
+    max_workers=None,
+):
+    """Backtest ``forecasters`` over every finished season of ``leagues`` in
+    ``years``, in parallel, see :func:`backtest_season`. Seasons that fail
+    to load, or haven't finished, are skipped with a warning.
+
+    Parameters
+    ----------
+    years : sequence of int
+        The seasons to replay.
+    leagues : sequence of str, optional
+        The leagues to replay.
+    forecasters : dict, optional
+        Named forecaster functions, which must be picklable, i.e. defined
+        at the top level of a module, to be run in a process pool. Cached
+        scores are keyed by name, so rename a forecaster when changing it.
+    step : int, optional
+        Score every ``step``-th matchday.
+    source : str, optional
+        Where to load the seasons from, see
+        :func:`~proggyleg.proggyleg.load_season_data`.
+    cache_dir : str or pathlib.Path, optional
+        Where to cache the scores, by default ``DATA_DIR / "backtest"``.
+    executor : concurrent.futures.Executor, optional
+        Where to replay the league-seasons, by default a process pool.
+    max_workers : int, optional
+        The size of the default process pool.
+
+    Returns
+    -------
+    dict
+        Mapping each ``(league, year)`` to the scores of
+        :func:`backtest_season`.
+    """
+    import warnings
+
+    from .proggyleg import DATA_DIR, LOAD_ERRORS
+
+    if cache_dir is None:
+        cache_dir = DATA_DIR / "backtest"
+    keys = [(league, int(year)) for year in years for league in leagues]
+
+    shutdown = executor is None
+    if executor is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    results = {}
+    try:
+        futures = [
+            executor.submit(
+                _backtest_key,
+                league,
+                year,
+                forecasters,
+                step,
+                source,
+                cache_dir,
+            )
+            for league, year in keys
+        ]
+        for key, future in zip(keys, futures):
+            try:
+                results[key] = future.result()
+            except LOAD_ERRORS as e:
+                warnings.warn(f"Skipping {key}: {e!r}")
+    finally:
+        if shutdown:
+            executor.shutdown()
+    return results
+
+
+def summarise_backtest(results):
+    """Average the scores of :func:`backtest` over every league-season.
+
+    Returns
+    -------
+    dict
+        Mapping each forecaster name to a dict with the mean ``"mae"``,
+        ``"spearman"`` and ``"brier"`` (over zones too) after each matchday
+        (from 1), ``"count"``, the number of seasons that reached each
+        matchday, and ``"overall"``, the same scores averaged over every
+        matchday of every season.
+    """
+    by_name = {}
+    for scores in results.values():
+        for name, s in scores.items():
+            by_name.setdefault(name, []).append(s)
+
+    summary = {}
+    for name, seasons in by_name.items():
+        num_matchdays = max(s["matchdays"].max(initial=0) for s in seasons)
+        sums = np.zeros((3, num_matchdays + 1))
+        counts = np.zeros(num_matchdays + 1)
+        for s in seasons:
+            values = np.array(
+                [s["mae"], s["spearman"], s["brier"].mean(axis=1)]
+            )
+            np.add.at(sums, (slice(None), s["matchdays"]), values)
+            np.add.at(counts, s["matchdays"], 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums[:, 1:] / counts[1:]
+        flat = np.concatenate(
+            [
+                [s["mae"], s["spearman"], s["brier"].mean(axis=1)]
+                for s in seasons
+            ],
+            axis=1,
+        )
+        summary[name] = {
+            "mae": means[0],
+            "spearman": means[1],
+            "brier": means[2],
+            "count": counts[1:].astype(int),
+            "overall": dict(
+                zip(("mae", "spearman", "brier"), np.nanmean(flat, axis=1))
+            ),
+        }
+    return summary
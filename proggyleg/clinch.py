@@ -0,0 +1,408 @@
+"""Mathematical clinch and elimination, i.e. statements such as "X can no
+longer finish top 4" or "Y is mathematically safe", for every zone, team and
+matchday of a season.
+
+Every zone is either "finish in the top ``k``" or, for relegation and the
+like, "finish in the bottom ``b``", which is the same as *not* finishing in
+the top ``n - b``. So only two questions are needed for each team ``X``:
+
+- can ``X`` still finish in the top ``k``? ``X`` wins all its remaining
+  games, and we ask whether the other games can be decided so that at most
+  ``k - 1`` teams finish above it.
+- is ``X`` sure to finish in the top ``k``? ``X`` loses all its remaining
+  games, and we ask whether ``k`` other teams can all reach its total.
+
+Both are answered with the classic max-flow elimination formulation, in
+which remaining games are sources of points routed to teams with limited
+(or required) capacity. With three points for a win the exact problem is
+NP-hard, so the flows are relaxations: a game hands out 2 points in any
+split when keeping teams down, and 3 points in any split when pushing teams
+up. Every real outcome is dominated by a relaxed one, so a relaxed problem
+having no solution is a proof. Results are therefore never wrong, though a
+few borderline decisions may be reported as still open. Cheap witnesses
+built from real outcomes settle the vast majority of cases before any flow
+is needed, and since the statements can only ever become true as the season
+goes on, decided statuses are carried forward rather than recomputed.
+
+Ties on points are always resolved against the statement being proved,
+unless both teams have finished their season, in which case the table
+tie-breakers decide.
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+CLINCHED = 1
+ELIMINATED = -1
+OPEN = 0
+
+
+class _FlowNetwork:
+    """A minimal Dinic max-flow, the networks here are at most a few
+    hundred nodes and four layers deep.
+    """
+
+    def __init__(self, num_nodes):
+        self.graph = [[] for _ in range(num_nodes)]
+
+    def add_edge(self, u, v, capacity):
+        self.graph[u].append([v, capacity, len(self.graph[v])])
+        self.graph[v].append([u, 0, len(self.graph[u]) - 1])
+
+    def _bfs(self, source, sink):
+        self.level = [-1] * len(self.graph)
+        self.level[source] = 0
+        queue = [source]
+        for u in queue:
+            for v, capacity, _ in self.graph[u]:
+                if capacity > 0 and self.level[v] < 0:
+                    self.level[v] = self.level[u] + 1
+                    queue.append(v)
+        return self.level[sink] >= 0
+
+    def _dfs(self, u, sink, flow):
+        if u == sink:
+            return flow
+        edges = self.graph[u]
+        while self.next[u] < len(edges):
+            edge = edges[self.next[u]]
+            v, capacity, rev = edge
+            if capacity > 0 and self.level[v] == self.level[u] + 1:
+                pushed = self._dfs(v, sink, min(flow, capacity))
+                if pushed > 0:
+                    edge[1] -= pushed
+                    self.graph[v][rev][1] += pushed
+                    return pushed
+            self.next[u] += 1
+        return 0
+
+    def max_flow(self, source, sink):
+        total = 0
+        while self._bfs(source, sink):
+            self.next = [0] * len(self.graph)
+            while True:
+                pushed = self._dfs(source, sink, math.inf)
+                if pushed == 0:
+                    break
+                total += pushed
+        return total
+
+
+def _max_flow(games, points_per_game, capacity):
+    """The max-flow of the points of ``games``, a dict mapping pairs of teams
+    to the number of games between them, to the teams, each of which can
+    absorb ``capacity[team]`` points.
+    """
+    teams = list(capacity)
+    index = {t: 2 + len(games) + i for i, t in enumerate(teams)}
+    network = _FlowNetwork(2 + len(games) + len(teams))
+    for g, ((i, j), c) in enumerate(games.items()):
+        network.add_edge(0, 2 + g, points_per_game * c)
+        network.add_edge(2 + g, index[i], points_per_game * c)
+        network.add_edge(2 + g, index[j], points_per_game * c)
+    for t in teams:
+        if capacity[t] > 0:
+            network.add_edge(index[t], 1, capacity[t])
+    return network.max_flow(0, 1)
+
+
+class _Snapshot:
+    """The table and the remaining games at some point in the season."""
+
+    def __init__(self, points, tiebreak, remaining):
+        self.points = points
+        self.tiebreak = tiebreak
+        self.remaining = remaining
+        self.num_teams = len(points)
+        self.num_remaining = remaining.sum(axis=1)
+
+    def finished(self, t):
+        return self.num_remaining[t] == 0
+
+    def beats(self, t, x):
+        """Whether ``t`` is certain to finish above ``x`` if level on
+        points, i.e. both are finished and ``t`` wins the tie-break.
+        """
+        return (
+            self.finished(t)
+            and self.finished(x)
+            and self.tiebreak[t] > self.tiebreak[x]
+        )
+
+    def games_between(self, teams):
+        teams = sorted(teams)
+        games = {}
+        for a, i in enumerate(teams):
+            for j in teams[a + 1 :]:
+                if self.remaining[i, j]:
+                    games[i, j] = int(self.remaining[i, j])
+        return games
+
+    def can_finish_top(self, x, k, max_combinations):
+        """Return ``False`` only if it's proven that ``x`` cannot finish in
+        the top ``k`` places.
+        """
+        pts, rem = self.points, self.remaining
+        best = pts[x] + 3 * self.num_remaining[x]
+        others = [t for t in range(self.num_teams) if t != x]
+
+        # teams certainly above x
+        forced = [
+            t
+            for t in others
+            if pts[t] > best or (pts[t] == best and self.beats(t, x))
+        ]
+        if len(forced) >= k:
+            return False
+        # teams that could possibly get above x
+        threats = [
+            t
+            for t in others
+            if t not in forced
+            and not self.finished(t)
+            and pts[t] + 3 * (self.num_remaining[t] - rem[t, x]) > best
+        ]
+        r = k - 1 - len(forced)
+        if len(threats) <= r:
+            return True
+
+        # witness: the top threats win all their other games, all others
+        # draw with each other, and x wins all its games
+        threats.sort(key=lambda t: -pts[t])
+        rest = [t for t in others if t not in forced]
+        free = set(threats[:r])
+        if all(
+            pts[t] + sum(rem[t, u] for u in rest if u not in free and u != t)
+            <= best
+            for t in rest
+            if t not in free
+        ):
+            return True
+
+        # proof: for every choice of which threats to let above x, the
+        # remaining games have too many points to share out below it
+        if math.comb(len(threats), r) > max_combinations:
+            return True
+        for free in itertools.combinations(threats, r):
+            below = [t for t in rest if t not in free]
+            capacity = {
+                t: best - pts[t] for t in below if not self.finished(t)
+            }
+            # can every game hand out its (at least) 2 points below x?
+            games = self.games_between(capacity)
+            if _max_flow(games, 2, capacity) == 2 * sum(games.values()):
+                return True
+        return False
+
+    def surely_top(self, x, k, max_combinations):
+        """Return ``True`` only if it's proven that ``x`` will finish in the
+        top ``k`` places.
+        """
+        pts, rem = self.points, self.remaining
+        worst = pts[x]
+        others = [t for t in range(self.num_teams) if t != x]
+
+        def level(t, total):
+            return total > worst or (total == worst and not self.beats(x, t))
+
+        # teams that already reach x, given x loses all its games
+        forced = [t for t in others if level(t, pts[t] + 3 * rem[t, x])]
+        if len(forced) >= k:
+            return False
+        # teams that could possibly reach x
+        chasers = [
+            t
+            for t in others
+            if t not in forced and level(t, pts[t] + 3 * self.num_remaining[t])
+        ]
+        r = k - len(forced)
+        if len(chasers) < r:
+            return True
+
+        def base(t, group):
+            # points from beating x and everyone outside the group
+            return pts[t] + 3 * sum(
+                rem[t, u] for u in range(self.num_teams) if u not in group
+            )
+
+        # witness: the best chasers win all their games against x and
+        # teams outside the group, and draw among themselves
+        chasers.sort(key=lambda t: -(pts[t] + 3 * self.num_remaining[t]))
+        group = set(chasers[:r])
+        if all(
+            level(t, base(t, group) + sum(rem[t, u] for u in group))
+            for t in group
+        ):
+            return False
+
+        # proof: no group of chasers can share out enough points
+        if math.comb(len(chasers), r) > max_combinations:
+            return False
+        for group in itertools.combinations(chasers, r):
+            need = {}
+            for t in group:
+                target = worst + (1 if self.beats(x, t) else 0)
+                need[t] = max(0, target - base(t, group))
+            # can the (at most) 3 points per game within the group make up
+            # every team's shortfall?
+            games = self.games_between(group)
+            if _max_flow(games, 3, need) == sum(need.values()):
+                return False
+        return True
+
+
+def get_zones(league="E0", year=0):
+    """Get the ``(label, pos)`` zones whose status is computed: a title
+    race, then every zone of :func:`~proggyleg.proggyleg.get_spans`.
+    """
+    from .proggyleg import get_spans
+
+    return [("Champions", -1)] + [
+        (label, pos) for label, pos, _ in get_spans(league, year)
+    ]
+
+
+def _zone_status(snapshot, t, k, max_combinations):
+    """The status of team ``t`` of ``snapshot`` for the zone "top ``k``"."""
+    if k <= 0:
+        return ELIMINATED
+    if k >= snapshot.num_teams:
+        return CLINCHED
+    if snapshot.surely_top(t, k, max_combinations):
+        return CLINCHED
+    if not snapshot.can_finish_top(t, k, max_combinations):
+        return ELIMINATED
+    return OPEN
+
+
+def compute_clinch_status(data, zones=None, max_combinations=2000):
+    """Compute, for every team, zone and matchday, whether the team is
+    mathematically certain to finish in the zone (clinched), certain not to
+    (eliminated), or neither.
+
+    Leagues whose rules split the table in two (e.g. the Scottish
+    Premiership) are only decided after the split, from when each half is a
+    separate mini-league, since until then the fixtures aren't known. Only
+    round robins with 3 points for a win and 1 for a draw are supported.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    zones : sequence of (str, int), optional
+        The zones as ``(label, pos)``, see
+        :func:`~proggyleg.proggyleg.get_spans`. Defaults to
+        :func:`get_zones`.
+    max_combinations : int, optional
+        Give up (leaving the status open) rather than try more than this many
+        choices of rival teams in any one proof.
+
+    Returns
+    -------
+    dict
+        With ``"teams"``, ``"zones"`` and ``"status"``, an ``int8`` array of
+        shape ``(max_games, num_teams, num_zones)`` containing
+        :data:`CLINCHED`, :data:`ELIMINATED` or :data:`OPEN`, where matchday
+        ``n`` is the first point at which every team has played at least
+        ``n`` games, matching the x-axis of the position plot.
+    """
+    teams = data["teams"]
+    n = len(teams)
+    index = {team: i for i, team in enumerate(teams)}
+    if zones is None:
+        zones = get_zones(data["league"], data["year"])
+    # every zone as "top k", and whether it is really the complement
+    tops = [
+        (-pos, False) if pos < 0 else (n - pos - 1, True) for _, pos in zones
+    ]
+
+    rules = data["rules"]
+    if rules["format"] != "round_robin" or tuple(rules["points"]) != (3, 1, 0):
+        raise ValueError(
+            "Clinching is only computed for round robins with 3 points for "
+            "a win and 1 for a draw."
+        )
+    rounds = rules["cycles"]
+    split = rounds * (n - 1) if rules["split"] else None
+    halves = None
+
+    # number of games between each pair, so far
+    met = np.zeros((n, n), dtype=int)
+    np.fill_diagonal(met, rounds + (rules["split"] or 0))
+    # penalties are included from the start
+    points = [int(data["cumpoints"][team][0]) for team in teams]
+    goaldiff = [0] * n
+    goalsscored = [0] * n
+    played = [0] * n
+
+    status = np.zeros((data["max_games"], n, len(zones)), dtype=np.int8)
+    matches = iter(data["matches"])
+    for matchday in range(data["max_games"]):
+        if matchday > 0:
+            status[matchday] = status[matchday - 1]
+        # advance until every team has played at least `matchday` games
+        while min(played) < matchday:
+            match = next(matches, None)
+            if match is None:
+                break
+            home, away, home_goals, away_goals = match
+            i, j = index[home], index[away]
+            points[i] += 3 if home_goals > away_goals else 0
+            points[j] += 3 if away_goals > home_goals else 0
+            if home_goals == away_goals:
+                points[i] += 1
+                points[j] += 1
+            goaldiff[i] += home_goals - away_goals
+            goaldiff[j] += away_goals - home_goals
+            goalsscored[i] += home_goals
+            goalsscored[j] += away_goals
+            played[i] += 1
+            played[j] += 1
+            met[i, j] += 1
+            met[j, i] += 1
+        if min(played) < matchday:
+            # no later snapshots, but decisions still hold
+            status[matchday:] = status[matchday - 1]
+            break
+
+        tiebreak = [(goaldiff[t], goalsscored[t], teams[t]) for t in range(n)]
+        if split is None:
+            groups = [(list(range(n)), 0)]
+            remaining = np.clip(rounds - met, 0, None)
+        elif matchday < split:
+            continue
+        else:
+            if halves is None:
+                ranked = sorted(
+                    range(n),
+                    key=lambda t: (points[t], tiebreak[t]),
+                    reverse=True,
+                )
+                halves = [(ranked[: n // 2], 0), (ranked[n // 2 :], n // 2)]
+            groups = halves
+            # more games against each team in the same half
+            remaining = np.clip(rounds + rules["split"] - met, 0, None)
+
+        for group, offset in groups:
+            snapshot = _Snapshot(
+                [points[t] for t in group],
+                [tiebreak[t] for t in group],
+                remaining[np.ix_(group, group)],
+            )
+            for z, (k, complement) in enumerate(tops):
+                for local, t in enumerate(group):
+                    if status[matchday, t, z] != OPEN:
+                        continue
+                    st = _zone_status(
+                        snapshot, local, k - offset, max_combinations
+                    )
+                    status[matchday, t, z] = -st if complement else st
+
+    return {
+        "teams": teams,
+        "zones": list(zones),
+        "status": status,
+    }
@@ -0,0 +1,232 @@
+"""How hard is each team's schedule? Opponent strength gathered through the
+fixture list, for every team after every number of games at once.
+
+Every team's opponents, in the order it plays them (the matches played,
+then any remaining fixtures of a round robin), form a dense
+``(num_teams, num_games)`` index array, and the strength of every team
+after every number of games a ``(num_teams, max_games)`` array. A single
+gather of the one by the other then gives the strength of every opponent
+as it stands after every number of games, from which the difficulty of
+the games already played and still to play are masked means, e.g. for the
+schedule-adjusted projections of
+:func:`~proggyleg.proggyleg.plot_extrapolated_performance` and
+:func:`~proggyleg.proggyleg.plot_form` with ``schedule_adjusted=True``.
+"""
+
+import numpy as np
+
+
+def schedule_matrix(data, fixtures=None):
+    """Every team's opponents, in the order it plays them.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    fixtures : sequence of (str, str), optional
+        The remaining ``(home, away)`` fixtures, by default from
+        :func:`~proggyleg.projection.remaining_fixtures`, or none if they
+        aren't known.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape ``(num_teams, num_games)``, the index into ``data["teams"]``
+        of each team's opponent in each of its games, or -1 if unknown.
+    """
+    from .proggyleg import compute_team_matches
+    from .projection import remaining_fixtures
+
+    teams = data["teams"]
+    n = len(teams)
+    index = {team: i for i, team in enumerate(teams)}
+
+    if fixtures is None:
+        try:
+            fixtures = remaining_fixtures(data)
+        except ValueError:
+            fixtures = []
+
+    # the played matches, then the fixtures, in each team's order
+    home = np.array([index[m[0]] for m in data["matches"]], dtype=int)
+    away = np.array([index[m[1]] for m in data["matches"]], dtype=int)
+    team_ptr, team_matches = data["team_ptr"], data["team_matches"]
+    num_played = np.diff(team_ptr)
+    owner = np.repeat(np.arange(n), num_played)
+    opponents = np.where(
+        home[team_matches] == owner,
+        away[team_matches],
+        home[team_matches],
+    )
+    slots = np.arange(len(team_matches)) - team_ptr[owner]
+
+    fixture_home = np.array([index[h] for h, _ in fixtures], dtype=int)
+    fixture_away = np.array([index[a] for _, a in fixtures], dtype=int)
+    fixture_ptr, fixture_matches, sides = compute_team_matches(
+        fixture_home, fixture_away, n
+    )
+    fixture_owner = np.repeat(np.arange(n), np.diff(fixture_ptr))
+    fixture_opponents = np.where(
+        sides == 0,
+        fixture_away[fixture_matches],
+        fixture_home[fixture_matches],
+    )
+    fixture_slots = (
+        num_played[fixture_owner]
+        + np.arange(len(fixture_matches))
+        - fixture_ptr[fixture_owner]
+    )
+
+    num_games = max(
+        data["total_games"],
+        (num_played + np.diff(fixture_ptr)).max(initial=0),
+    )
+    schedule = np.full((n, num_games), -1, dtype=int)
+    schedule[owner, slots] = opponents
+    schedule[fixture_owner, fixture_slots] = fixture_opponents
+    return schedule
+
+
+def _games_played(data):
+    """The number of games every team had played after each number of
+    games, shape ``(num_teams, max_games)``.
+    """
+    games = np.array([data["games_played"][t] - 1 for t in data["teams"]])
+    return np.minimum(games[:, None], np.arange(data["max_games"]))
+
+
+def compute_strength(data, prior_games=2):
+    """The points per game of every team after each number of games, shape
+    ``(num_teams, max_games)``, shrunk towards the league average by
+    ``prior_games`` games, so it is positive and not too noisy early on.
+    """
+    from .proggyleg import _padded
+
+    cumpoints = _padded(data, "cumpoints")
+    played = _games_played(data)
+    win, _, loss = data["rules"]["points"]
+    total_played = played.sum(axis=0)
+    average = np.where(
+        total_played > 0,
+        cumpoints.sum(axis=0) / np.maximum(total_played, 1),
+        (win + loss) / 2,
+    )
+    strength = (cumpoints + prior_games * average) / (played + prior_games)
+    # n.b. e.g. after a large points penalty
+    return np.clip(strength, 0.0, None)
+
+
+def compute_difficulty(data, strength=None, schedule=None):
+    """Compute the difficulty of every team's games after each number of
+    games, relative to the average strength of the rest of the league then.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    strength : array_like, optional
+        The positive strength of every team after each number of games,
+        shape ``(num_teams, max_games)``, by default from
+        :func:`compute_strength`.
+    schedule : array_like, optional
+        Every team's opponents, by default from :func:`schedule_matrix`.
+
+    Returns
+    -------
+    dict
+        With keys, each with shape ``(num_teams, max_games)``, 1 being
+        average and above 1 harder:
+
+        - ``"remaining"``: the mean relative strength of the opponents
+          still to play,
+        - ``"past"``: the mean relative strength of the opponents already
+          played, as they stand now,
+        - ``"num_remaining"``: the number of known games still to play,
+
+        and ``"opponents"``, shape ``(num_teams, max_games - 1)``, the
+        relative strength of each team's opponent in each game played,
+        before that game.
+    """
+    if strength is None:
+        strength = compute_strength(data)
+    if schedule is None:
+        schedule = schedule_matrix(data)
+    strength = np.asarray(strength, dtype=float)
+    n, num_columns = strength.shape
+
+    # the average strength of every team's possible opponents
+    average = (strength.sum(axis=0) - strength) / max(n - 1, 1)
+    known = schedule >= 0
+    # shape (num_teams, num_columns, num_games), every opponent's strength
+    # after every number of games
+    relative = (
+        strength.T[:, np.where(known, schedule, 0)].transpose(1, 0, 2)
+        / average[:, :, None]
+    )
+
+    # n.b. teams may have played fewer games than a column's number
+    games = np.arange(schedule.shape[1])
+    played = _games_played(data)[:, :, None]
+    ahead = known[:, None, :] & (games >= played)
+    behind = known[:, None, :] & (games < played)
+
+    def masked_mean(mask):
+        count = mask.sum(axis=2)
+        total = np.where(mask, relative, 0.0).sum(axis=2)
+        return np.where(count > 0, total / np.maximum(count, 1), 1.0), count
+
+    remaining, num_remaining = masked_mean(ahead)
+    past, _ = masked_mean(behind)
+
+    # the opponent of game k, as it stood after k games
+    k = np.arange(min(num_columns - 1, schedule.shape[1]))
+    opponents = np.where(known[:, k], relative[:, k, k], 1.0)
+    return {
+        "remaining": remaining,
+        "past": past,
+        "num_remaining": num_remaining,
+        "opponents": opponents,
+    }
+
+
+def schedule_adjusted_points(data, difficulty=None):
+    """Extrapolate every team's final points after each number of games,
+    shape ``(num_teams, max_games)``, adjusting its points per game so far
+    for the difficulty of the games it has played, and then for the
+    difficulty of the games it has left.
+    """
+    from .proggyleg import _padded
+
+    if difficulty is None:
+        difficulty = compute_difficulty(data)
+    cumpoints = _padded(data, "cumpoints")
+    played = _games_played(data)
+    points_per_game = cumpoints / np.maximum(played, 1)
+    return cumpoints + (
+        points_per_game
+        * difficulty["past"]
+        / difficulty["remaining"]
+        * (data["total_games"] - played)
+    )
+
+
+def schedule_adjusted_form(data, window_size=5, difficulty=None):
+    """Every team's exponential form, see
+    :func:`~proggyleg.proggyleg.exponential_form`, with the points of each
+    game weighted by the relative strength of the opponent, shape
+    ``(num_teams, max_games)``.
+    """
+    from .proggyleg import _padded, exponential_form
+
+    if difficulty is None:
+        difficulty = compute_difficulty(data)
+    points = np.diff(_padded(data, "cumpoints"), axis=1)
+    # n.b. penalties are applied before the first game, not in it
+    points[:, 0] -= [data["cumpoints"][t][0] for t in data["teams"]]
+    weighted = points * difficulty["opponents"][:, : points.shape[1]]
+    win, _, loss = data["rules"]["points"]
+    # vectorised over teams, by iterating over games
+    form = exponential_form(weighted.T, window_size, start=(win + loss) / 2)
+    return np.array([np.broadcast_to(f, (data["num_teams"],)) for f in form]).T
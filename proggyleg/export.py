@@ -0,0 +1,204 @@
+"""Export the table after every matchday of many seasons as data, e.g.::
+
+    export_standings(range(1995, 2025), DASHBOARD_LEAGUES, "standings/")
+
+Each season is written to its own ``{league}-{year}.csv`` (or ``.ndjson``)
+file in long format, one row per team per matchday with its position (1 the
+top, ranked as :func:`~proggyleg.proggyleg.plot_positions` does), points,
+goal difference, goals for and games played. Matchday ``g`` is every team's
+first ``g`` games.
+
+Seasons are loaded in parallel but written one at a time as they arrive,
+row by row, with only a few seasons ever in memory. A manifest records a
+fingerprint of the inputs of every season written (its matches, penalties
+and rules), so exporting again only rewrites seasons that have changed,
+e.g. just the live season.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+
+import numpy as np
+
+# bump to rewrite every season, e.g. when the columns change
+EXPORT_VERSION = 1
+
+STANDINGS_COLUMNS = (
+    "league",
+    "year",
+    "matchday",
+    "position",
+    "team",
+    "points",
+    "goal_difference",
+    "goals_for",
+    "played",
+)
+
+
+def iter_standings(data):
+    """Yield the standings of every team after every matchday of a season,
+    as tuples of :data:`STANDINGS_COLUMNS`, ordered by matchday then
+    position.
+    """
+    from .proggyleg import _padded, compute_positions
+
+    teams = data["teams"]
+    num_teams = data["num_teams"]
+    # n.b. column 0 is before any games
+    positions = num_teams - compute_positions(data)
+    points, goal_difference, goals_for = (
+        _padded(data, quantity).astype(int)
+        for quantity in ("cumpoints", "cumgoaldiff", "cumgoalsscored")
+    )
+    games = np.array([data["games_played"][t] - 1 for t in teams])
+
+    for g in range(1, data["max_games"]):
+        played = np.minimum(games, g)
+        for i in np.argsort(positions[:, g], kind="stable"):
+            yield (
+                data["league"],
+                data["year"],
+                g,
+                int(positions[i, g]),
+                teams[i],
+                int(points[i, g]),
+                int(goal_difference[i, g]),
+                int(goals_for[i, g]),
+                int(played[i]),
+            )
+
+
+def season_fingerprint(data, format="csv"):
+    """A hash of everything the exported standings of a season depend on."""
+    dates = None if data["dates"] is None else data["dates"].astype(str)
+    inputs = {
+        "version": EXPORT_VERSION,
+        "format": format,
+        "matches": [list(m) for m in data["matches"]],
+        "dates": None if dates is None else dates.tolist(),
+        "penalties": {
+            team: int(cpts[0]) for team, cpts in data["cumpoints"].items()
+        },
+        "rules": data["rules"],
+    }
+    encoded = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def write_standings(data, path, format="csv"):
+    """Stream the standings of a season, see :func:`iter_standings`, to
+    ``path``, replacing any existing file only once complete.
+    """
+    import csv
+
+    path = pathlib.Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", newline="") as f:
+        if format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(STANDINGS_COLUMNS)
+            writer.writerows(iter_standings(data))
+        elif format == "ndjson":
+            for row in iter_standings(data):
+                f.write(
+                    json.dumps(
+                        dict(zip(STANDINGS_COLUMNS, row)),
+                        separators=(",", ":"),
+                        ensure_ascii=False,
+                    )
+                )
+                f.write("\n")
+        else:
+            raise ValueError(
+                f"Unknown format {format}, should be 'csv' or 'ndjson'."
+            )
+    os.replace(tmp, path)
+
+
+def _load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def export_standings(
+    years,
+    leagues=("E0",),
+    out_dir="standings",
+    format="csv",
+    source="auto",
+    max_workers=8,
+    force=False,
+):
+    """Export the standings after every matchday of every season of
+    ``leagues`` in ``years`` to ``out_dir``. Seasons that fail to load are
+    skipped with a warning.
+
+    Parameters
+    ----------
+    years : sequence of int
+        The seasons to export.
+    leagues : sequence of str, optional
+        The leagues to export.
+    out_dir : str or pathlib.Path, optional
+        Where to write the files, and ``manifest.json``.
+    format : {"csv", "ndjson"}, optional
+        The file format.
+    source : str, optional
+        Where to load the seasons from, see
+        :func:`~proggyleg.proggyleg.load_season_data`.
+    max_workers : int, optional
+        How many seasons to load at once, which also bounds how many are
+        held in memory.
+    force : bool, optional
+        Rewrite every season, even if unchanged.
+
+    Returns
+    -------
+    dict
+        With keys ``"written"`` and ``"unchanged"``, each a list of
+        ``(league, year)`` seasons.
+    """
+    from .proggyleg import iter_all_season_data
+
+    if format not in ("csv", "ndjson"):
+        raise ValueError(
+            f"Unknown format {format}, should be 'csv' or 'ndjson'."
+        )
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    manifest = _load_manifest(manifest_path)
+
+    report = {"written": [], "unchanged": []}
+    # only ever ``max_workers`` seasons loading or waiting to be written
+    for key, data in iter_all_season_data(
+        years, leagues, source, max_workers=max_workers
+    ):
+        name = f"{key[0]}-{key[1]}"
+        filename = f"{name}.{format}"
+        fingerprint = season_fingerprint(data, format)
+        entry = manifest.get(name, {})
+        if (
+            (not force)
+            and (entry.get("fingerprint") == fingerprint)
+            and (entry.get("file") == filename)
+            and (out_dir / filename).exists()
+        ):
+            report["unchanged"].append(key)
+            continue
+
+        write_standings(data, out_dir / filename, format)
+        manifest[name] = {"file": filename, "fingerprint": fingerprint}
+        report["written"].append(key)
+
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, manifest_path)
+    return report
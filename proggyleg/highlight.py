@@ -0,0 +1,294 @@
+"""Highlighted variants of a plot for every team, e.g. one per club page,
+for little more than the cost of rendering the plot once.
+
+Highlighting a team only adds a glow line beneath everything else and
+recolours the background of its label. Since figures are drawn on a
+transparent background, the shared base plot (without any highlight) is
+rendered once, and then for each team just those two artists are rendered
+on an otherwise empty overlay with identical axes, and composited:
+
+- for raster formats, the glow is alpha-composited under the base image and
+  the label over it,
+- for SVG, the overlay's elements are spliced in as the first and last
+  elements of the base document.
+
+Plots where highlighting changes anything else (e.g. the limits of the
+expected points plot, or which teams are shown at all in very large
+leagues) fall back to a full render for the affected teams.
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+# plots whose highlight is only the glow line and label background
+COMPOSITABLE = (
+    "cumulative",
+    "extrapolated",
+    "position",
+    "relative",
+    "form",
+    "shots",
+    "discipline",
+    "comebacks",
+    "ratings",
+)
+
+_SVG_ID = re.compile(r'\bid="([^"]+)"')
+_SVG_URL = re.compile(r"url\(#")
+_SVG_REF = re.compile(r'(href=)"#')
+_SVG_END = re.compile(r"</svg>\s*$")
+
+
+def find_team_artists(ax, team):
+    """Find the main line of ``team``, as drawn by
+    :func:`~proggyleg.proggyleg.speckle_plot`, and its legend label, either
+    of which is ``None`` if not drawn.
+    """
+    line = next((ln for ln in ax.lines if ln.get_label() == team), None)
+    label = next(
+        (
+            text
+            for text in ax.texts
+            if (text.get_text() == team)
+            and (text.get_bbox_patch() is not None)
+        ),
+        None,
+    )
+    return line, label
+
+
+def _overlay_axes(fig, ax):
+    """An empty, transparent figure with axes matching ``ax`` exactly."""
+    from .proggyleg import new_figure
+
+    overlay = new_figure(figsize=fig.get_size_inches(), dpi=fig.dpi)
+    overlay.patch.set_alpha(0.0)
+    oax = overlay.add_axes(ax.get_position())
+    oax.set_xscale(ax.get_xscale())
+    oax.set_yscale(ax.get_yscale())
+    oax.set_xlim(ax.get_xlim())
+    oax.set_ylim(ax.get_ylim())
+    oax.set_axis_off()
+    return overlay, oax
+
+
+def _add_highlight(oax, line, label, highlight_color):
+    """Add the glow and highlighted label, as the plot functions draw them,
+    returning both artists.
+    """
+    xs, ys = line.get_xydata().T
+    glow = oax.plot(
+        xs,
+        ys,
+        color=highlight_color,
+        zorder=-100,
+        linewidth=10,
+        gid="highlight-under",
+    )[0]
+    text = oax.text(
+        *label.get_position(),
+        label.get_text(),
+        ha=label.get_horizontalalignment(),
+        va=label.get_verticalalignment(),
+        fontproperties=label.get_fontproperties(),
+        color=label.get_color(),
+        backgroundcolor=highlight_color,
+        clip_on=False,
+        gid="highlight-over",
+    )
+    return glow, text
+
+
+def _rgba(fig):
+    fig.canvas.draw()
+    return np.array(fig.canvas.buffer_rgba())
+
+
+def alpha_over(src, dst):
+    """Composite the straight alpha RGBA pixels ``src`` over ``dst``, both
+    as uint8 arrays with shape ``(..., 4)``.
+    """
+    src = src / 255
+    dst = dst / 255
+    sa, da = src[..., 3:], dst[..., 3:]
+    a = sa + da * (1 - sa)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rgb = (src[..., :3] * sa + dst[..., :3] * da * (1 - sa)) / a
+    out = np.concatenate([np.where(a > 0, rgb, 0), a], axis=-1)
+    return (out * 255).round().astype(np.uint8)
+
+
+def composite(base, under, over):
+    """Composite the RGBA images ``under`` beneath ``base`` and ``over`` on
+    top, only touching the pixels the layers actually cover.
+    """
+    out = base.copy()
+    mask = under[..., 3] > 0
+    out[mask] = alpha_over(out[mask], under[mask])
+    mask = over[..., 3] > 0
+    out[mask] = alpha_over(over[mask], out[mask])
+    return out
+
+
+def _encode(rgba, format):
+    import matplotlib as mpl
+
+    buffer = io.BytesIO()
+    mpl.image.imsave(buffer, rgba, format=format)
+    return buffer.getvalue()
+
+
+def _svg_fragments(svg):
+    """Split an overlay SVG into its glow and label fragments, each with
+    the definitions (clip paths, glyphs) they use. Every id is prefixed so
+    as not to clash with the base document.
+    """
+    from .svg import SVG_NS
+
+    svg = _SVG_REF.sub(r'\1"#hl-', _SVG_URL.sub("url(#hl-", svg))
+    svg = _SVG_ID.sub(r'id="hl-\1"', svg)
+    root = ET.fromstring(svg)
+
+    defs = "".join(
+        ET.tostring(el, encoding="unicode")
+        for el in root.findall(f"{{{SVG_NS}}}defs")
+        if el.find(f"{{{SVG_NS}}}style") is None
+    )
+    fragments = {
+        el.get("id"): ET.tostring(el, encoding="unicode")
+        for el in root.iter(f"{{{SVG_NS}}}g")
+        if el.get("id") in ("hl-highlight-under", "hl-highlight-over")
+    }
+    return (
+        defs + fragments["hl-highlight-under"],
+        fragments["hl-highlight-over"],
+    )
+
+
+def render_highlight_variants(
+    data,
+    which="cumulative",
+    teams=None,
+    format="png",
+    highlight_color=(0.8, 1.0, 0.0),
+    figsize=(7, 7),
+    compact=True,
+    **kwargs,
+):
+    """Render the ``which`` plot of a season highlighting each of ``teams``
+    (by default all of them), rendering the shared base only once.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    which : str, optional
+        The plot type, see :data:`~proggyleg.proggyleg.PLOTTERS`.
+    teams : sequence of str, optional
+        The teams to highlight, by default all of them.
+    format : str, optional
+        ``"png"`` (or another raster format) or ``"svg"``.
+    highlight_color : color, optional
+        The highlight color.
+    figsize : tuple, optional
+        The figure size.
+    compact : bool, optional
+        Whether to compact SVG output, see
+        :func:`~proggyleg.svg.compact_svg`. Only the base is compacted, the
+        small highlight fragments are spliced in as rendered.
+    kwargs
+        Passed on to the plot function.
+
+    Returns
+    -------
+    dict
+        Mapping each team to its rendered plot, as bytes.
+    """
+    from .proggyleg import (
+        NEUTRAL_STYLE,
+        STATS_PLOTTERS,
+        get_plotter,
+        render_figure,
+        style_context,
+    )
+
+    if teams is None:
+        teams = data["teams"]
+    fn = get_plotter(which)
+    if (which in STATS_PLOTTERS) and ("cumstats" not in data):
+        from .stats import compute_cumulative_stats
+
+        # compute the statistics once, rather than for every variant
+        stats = compute_cumulative_stats(data, kwargs.pop("stats", None))
+        data = dict(data, cumstats=stats)
+    plot_kwargs = dict(
+        highlight_color=highlight_color,
+        figsize=figsize,
+        show_and_close=False,
+        **kwargs,
+    )
+
+    def full_render(team):
+        fig, _ = fn(data, highlight=team, **plot_kwargs)
+        body = render_figure(fig, format=format)
+        if compact and format == "svg":
+            from .svg import compact_svg
+
+            return compact_svg(body).encode("utf-8")
+        return body
+
+    if (which not in COMPOSITABLE) or kwargs.get("jitter"):
+        return {team: full_render(team) for team in teams}
+
+    fig, ax = fn(data, highlight="", **plot_kwargs)
+    if format == "svg":
+        base = render_figure(fig, format="svg").decode("utf-8")
+        if compact:
+            from .svg import compact_svg
+
+            base = compact_svg(base)
+        # elements are drawn in document order, so the glow goes first, just
+        # inside the root element, and the label last
+        start = base.index(">", base.index("<svg")) + 1
+        end = _SVG_END.search(base).start()
+    else:
+        base = _rgba(fig)
+
+    with style_context(NEUTRAL_STYLE):
+        overlay, oax = _overlay_axes(fig, ax)
+
+    rendered = {}
+    for team in teams:
+        line, label = find_team_artists(ax, team)
+        if (line is None) or (label is None):
+            # e.g. not shown in a very large league
+            rendered[team] = full_render(team)
+            continue
+
+        with style_context(NEUTRAL_STYLE):
+            glow, text = _add_highlight(oax, line, label, highlight_color)
+
+        if format == "svg":
+            under, over = _svg_fragments(
+                render_figure(overlay, format="svg").decode("utf-8")
+            )
+            body = base[:start] + under + base[start:end] + over + base[end:]
+            rendered[team] = body.encode("utf-8")
+        else:
+            text.set_visible(False)
+            glow_layer = _rgba(overlay)
+            text.set_visible(True)
+            glow.set_visible(False)
+            label_layer = _rgba(overlay)
+            rendered[team] = _encode(
+                composite(base, glow_layer, label_layer), format
+            )
+
+        glow.remove()
+        text.remove()
+
+    return rendered
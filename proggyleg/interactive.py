@@ -0,0 +1,392 @@
+"""Interactive HTML output, with hover tooltips and teams that can be toggled
+on and off, drawn in the browser from a single compact JSON payload.
+
+The payload holds just the season arrays: every team's cumulative points,
+goal difference and position after each game (and the date of each game),
+each delta-encoded so that it is mostly small integers, plus the teams'
+colours and the league's zones. The cumulative points, position, form and
+relative performance views are all derived from it client-side, which is
+much lighter than embedding four matplotlib SVGs::
+
+    html = render_html(load_season_data(2024, "E0"))
+"""
+
+import html
+import json
+
+import numpy as np
+
+PAYLOAD_VERSION = 1
+
+
+def delta_encode(xs):
+    """Encode ``xs`` as its first value followed by the differences between
+    consecutive values, as plain ints where the values are whole.
+    """
+    xs = np.asarray(xs)
+    deltas = np.diff(xs, prepend=0)
+    if np.issubdtype(xs.dtype, np.floating):
+        if np.all(xs == np.round(xs)):
+            deltas = deltas.astype(int)
+        else:
+            # n.b. rounding the deltas would let errors accumulate
+            return np.round(np.diff(np.round(xs, 6), prepend=0), 6).tolist()
+    return deltas.tolist()
+
+
+def delta_decode(deltas):
+    """The inverse of :func:`delta_encode`."""
+    return np.cumsum(deltas)
+
+
+def season_payload(data, window_size=5):
+    """Build the JSON-able payload of a season for :func:`render_html`.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+
+    Returns
+    -------
+    dict
+        Per team lists, ordered as ``"teams"``, of delta-encoded
+        ``"cumpoints"``, ``"cumgoaldiff"`` and ``"positions"`` (0 the
+        bottom), and ``"days"`` since ``"start"`` if the games are dated,
+        with ``"colors"``, the league's ``"spans"``, the ``"points"`` for a
+        win, draw and loss and the ``"window_size"`` of the form.
+    """
+    import matplotlib as mpl
+
+    from .proggyleg import (
+        LEAGUE_NAMES,
+        compute_positions,
+        get_color0,
+        get_color1,
+        get_spans,
+    )
+
+    teams = data["teams"]
+    games_played = data["games_played"]
+    positions = compute_positions(data)
+
+    payload = {
+        "version": PAYLOAD_VERSION,
+        "league": data["league"],
+        "name": LEAGUE_NAMES.get(data["league"], data["league"]),
+        "year": data["year"],
+        "total_games": data["total_games"],
+        "points": list(data["rules"]["points"]),
+        "window_size": window_size,
+        "teams": teams,
+        "colors": [
+            [
+                mpl.colors.to_hex(get_color0(t)),
+                mpl.colors.to_hex(get_color1(t)),
+            ]
+            for t in teams
+        ],
+        "spans": [
+            [label, pos, mpl.colors.to_hex(color)]
+            for label, pos, color in get_spans(data["league"], data["year"])
+        ],
+        "cumpoints": [delta_encode(data["cumpoints"][t]) for t in teams],
+        "cumgoaldiff": [delta_encode(data["cumgoaldiff"][t]) for t in teams],
+        "positions": [
+            delta_encode(positions[i, : games_played[t]])
+            for i, t in enumerate(teams)
+        ],
+        "start": None,
+        "days": None,
+    }
+
+    if data["cumdates"] is not None:
+        start = min(ds[0] for ds in data["cumdates"].values())
+        payload["start"] = str(start)
+        payload["days"] = [
+            delta_encode((data["cumdates"][t] - start).astype(int))
+            for t in teams
+        ]
+
+    return payload
+
+
+def payload_to_json(payload):
+    """Serialise ``payload`` as compactly as possible."""
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+_RENDERER_JS = r"""
+(function () {
+  "use strict";
+  var SVGNS = "http://www.w3.org/2000/svg";
+  var P = JSON.parse(document.getElementById("proggyleg-data").textContent);
+  var n = P.teams.length;
+
+  function undelta(xs) {
+    var out = [], s = 0;
+    for (var i = 0; i < xs.length; i++) { s += xs[i]; out.push(s); }
+    return out;
+  }
+  var cumpoints = P.cumpoints.map(undelta);
+  var goaldiff = P.cumgoaldiff.map(undelta);
+  var positions = P.positions.map(undelta);
+  var days = P.days ? P.days.map(undelta) : null;
+  var maxGames = Math.max.apply(null, cumpoints.map(function (c) {
+    return c.length;
+  }));
+
+  // points after each game, and the exponentially weighted form
+  var win = P.points[0], loss = P.points[2];
+  var form = cumpoints.map(function (c) {
+    var f = [(win + loss) / 2];
+    for (var k = 1; k < c.length; k++) {
+      f.push(((P.window_size - 1) * f[k - 1] + c[k] - c[k - 1]) / P.window_size);
+    }
+    return f;
+  });
+  // the most points any team had after each number of games
+  var best = [];
+  for (var k = 0; k < maxGames; k++) {
+    var b = -Infinity;
+    for (var t = 0; t < n; t++) {
+      var c = cumpoints[t];
+      b = Math.max(b, c[Math.min(k, c.length - 1)]);
+    }
+    best.push(b);
+  }
+  var relative = cumpoints.map(function (c) {
+    return c.map(function (y, k) { return k ? y / best[k] : null; });
+  });
+
+  var VIEWS = {
+    cumulative: {title: "Points", ys: cumpoints},
+    position: {title: "Position", ys: positions},
+    form: {title: "Average points per game", ys: form},
+    relative: {title: "Relative points", ys: relative}
+  };
+  var view = "cumulative";
+  var hidden = P.teams.map(function () { return false; });
+  var W = 760, H = 560, M = {l: 50, r: 20, t: 20, b: 40};
+
+  var root = document.getElementById("proggyleg");
+  var svg = document.createElementNS(SVGNS, "svg");
+  svg.setAttribute("viewBox", "0 0 " + W + " " + H);
+  var tip = document.createElement("div");
+  tip.className = "pg-tip";
+  root.querySelector(".pg-plot").appendChild(svg);
+  root.querySelector(".pg-plot").appendChild(tip);
+
+  function el(name, attrs, parent) {
+    var e = document.createElementNS(SVGNS, name);
+    for (var a in attrs) { e.setAttribute(a, attrs[a]); }
+    if (parent) { parent.appendChild(e); }
+    return e;
+  }
+  function last(xs) { return xs[xs.length - 1]; }
+  function ordinal(i) {
+    var s = ["th", "st", "nd", "rd"], v = i % 100;
+    return i + (s[(v - 20) % 10] || s[v] || s[0]);
+  }
+
+  var sx, sy, ys;
+  function draw() {
+    while (svg.firstChild) { svg.removeChild(svg.firstChild); }
+    ys = VIEWS[view].ys;
+    var lo = Infinity, hi = -Infinity;
+    ys.forEach(function (y, t) {
+      if (hidden[t]) { return; }
+      y.forEach(function (v) {
+        if (v !== null) { lo = Math.min(lo, v); hi = Math.max(hi, v); }
+      });
+    });
+    if (view === "position") { lo = -0.5; hi = n - 0.5; }
+    if (!isFinite(lo)) { lo = 0; hi = 1; }
+    if (hi === lo) { hi = lo + 1; }
+    var xmax = Math.max(P.total_games, maxGames - 1);
+    sx = function (x) { return M.l + (W - M.l - M.r) * (x + 0.5) / (xmax + 1); };
+    sy = function (y) { return H - M.b - (H - M.t - M.b) * (y - lo) / (hi - lo); };
+
+    var axes = el("g", {"class": "pg-axes"}, svg);
+    el("line", {x1: M.l, x2: W - M.r, y1: H - M.b, y2: H - M.b}, axes);
+    el("line", {x1: M.l, x2: M.l, y1: M.t, y2: H - M.b}, axes);
+    for (var g = 0; g <= xmax; g += 5) {
+      var tx = el("text", {x: sx(g), y: H - M.b + 15, "text-anchor": "middle"}, axes);
+      tx.textContent = g;
+    }
+    var label = el("text", {x: (W + M.l) / 2, y: H - 5, "text-anchor": "middle"}, axes);
+    label.textContent = "Games Played";
+    var ylabel = el("text", {
+      x: 12, y: (H - M.b + M.t) / 2, "text-anchor": "middle",
+      transform: "rotate(-90 12 " + (H - M.b + M.t) / 2 + ")"
+    }, axes);
+    ylabel.textContent = VIEWS[view].title;
+
+    // the league's zones, at the boundary team's current value
+    if (view !== "form") {
+      var order = P.teams.map(function (_, t) { return t; }).sort(function (a, b) {
+        return last(positions[a]) - last(positions[b]);
+      });
+      P.spans.forEach(function (span) {
+        var pos = span[1] < 0 ? n + span[1] : span[1];
+        // below a top zone's lowest place, or above a bottom zone's highest
+        var y = view === "position" ? (span[1] < 0 ? pos - 0.5 : pos + 0.5)
+          : last(ys[order[pos]]);
+        el("line", {
+          x1: sx(0), x2: sx(xmax), y1: sy(y), y2: sy(y),
+          stroke: span[2], "stroke-dasharray": "2 3"
+        }, svg);
+        var st = el("text", {x: sx(0), y: sy(y) - 3, fill: span[2], "class": "pg-span"}, svg);
+        st.textContent = span[0];
+      });
+    }
+
+    ys.forEach(function (y, t) {
+      if (hidden[t]) { return; }
+      var d = "";
+      y.forEach(function (v, k) {
+        if (v === null) { return; }
+        d += (d ? "L" : "M") + sx(k).toFixed(1) + " " + sy(v).toFixed(1);
+      });
+      el("path", {
+        d: d, fill: "none", stroke: P.colors[t][0], "stroke-width": 2.5,
+        "stroke-opacity": 0.75, "class": "pg-line", "data-team": t
+      }, svg);
+      el("path", {
+        d: d, fill: "none", stroke: P.colors[t][1], "stroke-width": 2.5,
+        "stroke-opacity": 0.25, "stroke-dasharray": "1 2"
+      }, svg);
+    });
+  }
+
+  function tooltip(event) {
+    var box = svg.getBoundingClientRect();
+    var px = (event.clientX - box.left) * W / box.width;
+    var py = (event.clientY - box.top) * H / box.height;
+    var bestT = -1, bestK = -1, bestD = 15;
+    ys.forEach(function (y, t) {
+      if (hidden[t]) { return; }
+      for (var k = 0; k < y.length; k++) {
+        if (y[k] === null) { continue; }
+        var dist = Math.hypot(sx(k) - px, sy(y[k]) - py);
+        if (dist < bestD) { bestD = dist; bestT = t; bestK = k; }
+      }
+    });
+    if (bestT < 0) { tip.style.display = "none"; return; }
+    var t = bestT, k = bestK;
+    var lines = [
+      P.teams[t] + ", game " + k,
+      cumpoints[t][k] + " pts, GD " + (goaldiff[t][k] > 0 ? "+" : "") + goaldiff[t][k],
+      ordinal(n - positions[t][Math.min(k, positions[t].length - 1)])
+    ];
+    if (view === "form") { lines.push("form " + form[t][k].toFixed(2)); }
+    if (view === "relative") { lines.push("relative " + relative[t][k].toFixed(3)); }
+    if (days && k) {
+      var date = new Date(Date.parse(P.start) + days[t][k] * 864e5);
+      lines.push(date.toISOString().slice(0, 10));
+    }
+    tip.textContent = lines.join("\n");
+    tip.style.display = "block";
+    tip.style.left = (event.clientX - box.left + 12) + "px";
+    tip.style.top = (event.clientY - box.top + 12) + "px";
+  }
+  svg.addEventListener("mousemove", tooltip);
+  svg.addEventListener("mouseleave", function () { tip.style.display = "none"; });
+
+  var views = root.querySelector(".pg-views");
+  Object.keys(VIEWS).forEach(function (v) {
+    var button = document.createElement("button");
+    button.textContent = v;
+    button.onclick = function () {
+      view = v;
+      views.querySelectorAll("button").forEach(function (b) {
+        b.classList.toggle("pg-active", b === button);
+      });
+      draw();
+    };
+    if (v === view) { button.classList.add("pg-active"); }
+    views.appendChild(button);
+  });
+
+  // the legend, top of the table first, clicking a team toggles it
+  var legend = root.querySelector(".pg-legend");
+  var ranked = P.teams.map(function (_, t) { return t; }).sort(function (a, b) {
+    return last(positions[b]) - last(positions[a]);
+  });
+  ranked.forEach(function (t) {
+    var item = document.createElement("button");
+    item.textContent = P.teams[t];
+    item.style.background = P.colors[t][0];
+    item.style.color = P.colors[t][1];
+    item.onclick = function () {
+      hidden[t] = !hidden[t];
+      item.classList.toggle("pg-hidden", hidden[t]);
+      draw();
+    };
+    legend.appendChild(item);
+  });
+
+  draw();
+})();
+"""
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+#proggyleg {{ font-family: monospace; display: flex; flex-wrap: wrap; }}
+.pg-plot {{ position: relative; flex: 1 1 600px; max-width: 900px; }}
+.pg-plot svg {{ width: 100%; height: auto; }}
+.pg-axes line {{ stroke: #888; }}
+.pg-axes text, .pg-span {{ font-size: 11px; fill: #555; }}
+.pg-tip {{ position: absolute; display: none; white-space: pre;
+  background: #fff; border: 1px solid #aaa; padding: 4px; font-size: 12px;
+  pointer-events: none; }}
+.pg-legend {{ display: flex; flex-direction: column; gap: 2px; }}
+.pg-legend button, .pg-views button {{ font: bold 12px monospace;
+  border: none; padding: 2px 6px; text-align: left; cursor: pointer; }}
+.pg-legend button.pg-hidden {{ opacity: 0.25; }}
+.pg-views button.pg-active {{ background: #333; color: #fff; }}
+</style>
+</head>
+<body>
+<h3>{title}</h3>
+<div id="proggyleg">
+<div class="pg-plot"><div class="pg-views"></div></div>
+<div class="pg-legend"></div>
+</div>
+<script type="application/json" id="proggyleg-data">{payload}</script>
+<script>{renderer}</script>
+</body>
+</html>
+"""
+
+
+def render_html(data, title=None):
+    """Render a standalone interactive HTML page of a season.
+
+    Parameters
+    ----------
+    data : dict
+        Either the output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities` or an
+        already built :func:`season_payload`.
+    title : str, optional
+        The page title, by default the league and season.
+
+    Returns
+    -------
+    str
+    """
+    payload = data if "version" in data else season_payload(data)
+    if title is None:
+        year = int(payload["year"])
+        title = f"{payload['name']} {year} / {year + 1}"
+    # n.b. so that no team name can close the script element
+    blob = payload_to_json(payload).replace("</", "<\\/")
+    return _HTML_TEMPLATE.format(
+        title=html.escape(title), payload=blob, renderer=_RENDERER_JS
+    )
@@ -0,0 +1,348 @@
+"""A cross-league index of every team's seasons, so that a club can be
+followed through promotions and relegations, e.g.::
+
+    index = build_team_index(range(2010, 2025), leagues=("E0", "E1", "E2"))
+    index.history("Leeds")
+    index.promoted(2019)
+
+The index is built once from the season data (the only pass over the
+matches), maps each team to its ``(league, year)`` appearances, ordered by
+year, with the offsets of its rows in that season's match list, and can be
+updated season by season. Queries are then just dictionary lookups.
+"""
+
+import bisect
+import pathlib
+
+# the country and level (1 the top) of each league's division
+LEAGUE_LEVELS = {
+    "E0": ("England", 1),
+    "E1": ("England", 2),
+    "E2": ("England", 3),
+    "E3": ("England", 4),
+    "SC0": ("Scotland", 1),
+    "SC1": ("Scotland", 2),
+    "SC2": ("Scotland", 3),
+    "SC3": ("Scotland", 4),
+    "D1": ("Germany", 1),
+    "D2": ("Germany", 2),
+    "I1": ("Italy", 1),
+    "I2": ("Italy", 2),
+    "SP1": ("Spain", 1),
+    "SP2": ("Spain", 2),
+    "FR1": ("France", 1),
+}
+
+
+def get_league_level(league):
+    """The ``(country, level)`` of ``league``, unknown leagues being the
+    only level of their own country.
+    """
+    return LEAGUE_LEVELS.get(league, (league, 1))
+
+
+def _canonical(team):
+    from .proggyleg import get_team_registry
+
+    registry = get_team_registry()
+    # n.b. lookup, so that querying doesn't register unknown teams
+    i = registry.lookup(team)
+    return team if i is None else registry.names[i]
+
+
+def _sort_key(entry):
+    return (entry["year"], entry["level"], entry["league"])
+
+
+class TeamIndex:
+    """An inverted index from teams to their seasons, in every league."""
+
+    def __init__(self):
+        # (league, year) -> the teams in that season
+        self.seasons = {}
+        # team -> its appearances, ordered by year
+        self.appearances = {}
+        # (country, year) -> {team: (level, league)}
+        self._levels = {}
+        # (year, country) -> promotions and relegations, computed lazily
+        self._moves = {}
+
+    def __contains__(self, key):
+        league, year = key
+        return (league, int(year)) in self.seasons
+
+    def __len__(self):
+        return len(self.seasons)
+
+    def add_entries(self, league, year, entries):
+        """Index the appearance ``entries`` of every team in ``league`` and
+        ``year``, replacing any already indexed for that season.
+        """
+        year = int(year)
+        if (league, year) in self.seasons:
+            self.remove(league, year)
+        country, level = get_league_level(league)
+
+        levels = self._levels.setdefault((country, year), {})
+        for entry in entries:
+            entry = dict(entry, league=league, year=year, level=level)
+            team = entry["team"]
+            appearances = self.appearances.setdefault(team, [])
+            i = bisect.bisect_right(
+                [_sort_key(e) for e in appearances], _sort_key(entry)
+            )
+            appearances.insert(i, entry)
+            levels[team] = (level, league)
+
+        self.seasons[league, year] = [entry["team"] for entry in entries]
+        # either side of this season may have changed
+        for y in (year, year + 1):
+            self._moves.pop((y, country), None)
+
+    def add(self, data):
+        """Index a season, as from
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+        """
+        num_teams = data["num_teams"]
+        team_ptr = data["team_ptr"]
+        team_matches = data["team_matches"]
+        entries = [
+            {
+                "team": team,
+                # 1 the top of the table
+                "position": num_teams - data["places"][team],
+                "num_teams": num_teams,
+                "games": int(data["games_played"][team]) - 1,
+                "points": data["current_points"][team].item(),
+                # the team's rows in ``data["matches"]``
+                "rows": team_matches[team_ptr[i] : team_ptr[i + 1]].tolist(),
+            }
+            for i, team in enumerate(data["teams"])
+        ]
+        self.add_entries(data["league"], data["year"], entries)
+
+    def remove(self, league, year):
+        """Remove a season from the index."""
+        year = int(year)
+        country, _ = get_league_level(league)
+        levels = self._levels[country, year]
+        for team in self.seasons.pop((league, year)):
+            self.appearances[team] = [
+                entry
+                for entry in self.appearances[team]
+                if (entry["league"], entry["year"]) != (league, year)
+            ]
+            if not self.appearances[team]:
+                del self.appearances[team]
+            if levels.get(team, (None, None))[1] == league:
+                del levels[team]
+        for y in (year, year + 1):
+            self._moves.pop((y, country), None)
+
+    def num_teams_above(self, league, year):
+        """The number of indexed teams in higher levels of ``league``'s
+        country in ``year``.
+        """
+        country, level = get_league_level(league)
+        return sum(
+            lvl < level
+            for lvl, _ in self._levels.get((country, int(year)), {}).values()
+        )
+
+    def history(self, team):
+        """Every season of ``team``, in order, each a dict with keys
+        ``"league"``, ``"year"``, ``"level"``, ``"position"``,
+        ``"num_teams"``, ``"games"``, ``"points"`` and ``"rows"``.
+        """
+        return list(self.appearances.get(_canonical(team), ()))
+
+    def _get_moves(self, year, country):
+        key = (year, country)
+        if key not in self._moves:
+            before = self._levels.get((country, year - 1), {})
+            after = self._levels.get((country, year), {})
+            moves = {"promoted": [], "relegated": []}
+            for team in sorted(before.keys() & after.keys()):
+                (level0, league0), (level1, league1) = (
+                    before[team],
+                    after[team],
+                )
+                if level1 != level0:
+                    direction = "promoted" if level1 < level0 else "relegated"
+                    moves[direction].append(
+                        {"team": team, "from": league0, "to": league1}
+                    )
+            self._moves[key] = moves
+        return self._moves[key]
+
+    def _query(self, direction, year, country):
+        year = int(year)
+        if country is None:
+            countries = sorted({c for c, y in self._levels if y == year})
+        else:
+            countries = [country]
+        return [
+            move
+            for c in countries
+            for move in self._get_moves(year, c)[direction]
+        ]
+
+    def promoted(self, year, country=None):
+        """Every team that moved up a level into ``year``'s season, as
+        dicts with keys ``"team"``, ``"from"`` and ``"to"`` (leagues). Only
+        moves between indexed leagues are known.
+        """
+        return self._query("promoted", year, country)
+
+    def relegated(self, year, country=None):
+        """Every team that moved down a level into ``year``'s season, see
+        :meth:`promoted`.
+        """
+        return self._query("relegated", year, country)
+
+    def to_dict(self):
+        return {
+            f"{league}-{year}": [
+                {k: v for k, v in entry.items() if k not in ("league", "year")}
+                for team in teams
+                for entry in self.appearances[team]
+                if (entry["league"], entry["year"]) == (league, year)
+            ]
+            for (league, year), teams in self.seasons.items()
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        self = cls()
+        for key, entries in d.items():
+            league, year = key.rsplit("-", 1)
+            self.add_entries(league, year, entries)
+        return self
+
+    def save(self, path=None):
+        import json
+
+        from .proggyleg import DATA_DIR
+
+        path = pathlib.Path(path or DATA_DIR / "team_index.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path=None):
+        import json
+
+        from .proggyleg import DATA_DIR
+
+        path = pathlib.Path(path or DATA_DIR / "team_index.json")
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def compute_career(team, index, which="cumulative", source="auto"):
+    """Stitch every season of ``team`` in ``index`` into one series.
+
+    Parameters
+    ----------
+    team : str
+        The team.
+    index : TeamIndex
+        The index of the seasons to include.
+    which : {"cumulative", "position"}, optional
+        Either the points accumulated over the whole career, or the
+        position after each game in the whole league pyramid, with 1 the
+        top of the highest indexed level.
+    source : str, optional
+        Where to load the seasons from, see
+        :func:`~proggyleg.proggyleg.load_season_data`.
+
+    Returns
+    -------
+    dict
+        With keys ``"xs"``, the time of each game as the year plus the
+        fraction of that season played, ``"ys"``, ``"which"`` and
+        ``"seasons"``, the appearances from :meth:`TeamIndex.history`.
+    """
+    import numpy as np
+
+    from .proggyleg import compute_positions, load_season_data
+
+    if which not in ("cumulative", "position"):
+        raise ValueError(
+            f"Unknown career {which}, should be 'cumulative' or 'position'."
+        )
+
+    team = _canonical(team)
+    seasons = index.history(team)
+    xs, ys = [], []
+    points = 0
+    for season in seasons:
+        league, year = season["league"], season["year"]
+        data = load_season_data(year=year, league=league, source=source)
+        games = np.arange(1, data["games_played"][team])
+        xs.append(year + games / data["total_games"])
+        if which == "cumulative":
+            ys.append(points + data["cumpoints"][team][1:])
+            points += data["current_points"][team]
+        else:
+            i = data["teams"].index(team)
+            # n.b. 0 is the bottom of this division
+            ys.append(
+                index.num_teams_above(league, year)
+                + data["num_teams"]
+                - compute_positions(data)[i, games]
+            )
+
+    return {
+        "xs": np.concatenate([[]] + xs),
+        "ys": np.concatenate([[]] + ys),
+        "which": which,
+        "seasons": seasons,
+    }
+
+
+def load_careers(
+    teams,
+    years,
+    leagues=("E0", "E1", "E2"),
+    which="cumulative",
+    index=None,
+    source="auto",
+):
+    """Compute the careers of several ``teams``, see :func:`compute_career`,
+    over every season of ``leagues`` in ``years``, building or updating
+    ``index`` first, e.g. to pass to
+    :func:`~proggyleg.proggyleg.plot_career`.
+    """
+    index = build_team_index(years, leagues, index=index, source=source)
+    return {
+        _canonical(team): compute_career(team, index, which, source)
+        for team in teams
+    }
+
+
+def build_team_index(
+    years,
+    leagues=("E0", "E1", "E2"),
+    index=None,
+    source="auto",
+    max_workers=8,
+):
+    """Build, or update, a :class:`TeamIndex` of every season of
+    ``leagues`` in ``years``, loading in parallel. Seasons already in
+    ``index`` are skipped, apart from the current one, which is reloaded
+    since it may have progressed. Seasons that fail to load are skipped
+    with a warning.
+    """
+    from .proggyleg import CURRENT_YEAR, iter_all_season_data
+
+    if index is None:
+        index = TeamIndex()
+
+    loaded = {key for key in index.seasons if key[1] != CURRENT_YEAR}
+    for _, data in iter_all_season_data(
+        years, leagues, source, exclude=loaded, max_workers=max_workers
+    ):
+        index.add(data)
+    return index
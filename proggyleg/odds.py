@@ -0,0 +1,221 @@
+"""Bookmaker odds from football-data, as a columnar store of float arrays,
+converted to margin-free implied probabilities and expected points (xPts).
+
+football-data files carry an ``H``/``D``/``A`` decimal odds triple for each
+of many bookmakers and market summaries (``B365H``, ``AvgH``, ``MaxH``,
+closing ``B365CH`` and so on). Every such triple present is extracted, so
+a store holds an ``(num_matches, num_bookmakers, 3)`` array, with ``nan``
+where a bookmaker didn't price a match. Many seasons can be concatenated
+into one store (the union of their bookmakers), so converting a whole
+archive to probabilities is a single vectorised pass.
+"""
+
+import numpy as np
+
+OUTCOMES = "HDA"
+
+
+def _odds_columns(header):
+    """Find every bookmaker with all of ``{name}H``, ``{name}D`` and
+    ``{name}A`` columns, returning the names and the column indices.
+    """
+    index = {name: i for i, name in enumerate(header)}
+    bookmakers = []
+    columns = []
+    for name in header:
+        if not name.endswith("H"):
+            continue
+        prefix = name[:-1]
+        try:
+            columns.append([index[prefix + o] for o in OUTCOMES])
+        except KeyError:
+            continue
+        bookmakers.append(prefix)
+    return bookmakers, np.array(columns, dtype=int).reshape(-1, 3)
+
+
+def parse_footballdata_odds(contents):
+    """Extract the odds of every played match in a football-data csv, in
+    the same order as
+    :func:`~proggyleg.proggyleg.parse_footballdata_data`.
+
+    Returns
+    -------
+    dict
+        With keys ``"home"`` and ``"away"`` (lists of team names),
+        ``"bookmakers"`` (the odds column prefixes) and ``"odds"``, the
+        decimal odds with shape ``(num_matches, num_bookmakers, 3)``.
+    """
+    from .proggyleg import (
+        canonical_team_name,
+        columns_to_float,
+        read_footballdata_table,
+    )
+
+    rows, col = read_footballdata_table(contents)
+    bookmakers, columns = _odds_columns(list(col))
+    odds = columns_to_float(rows, columns.ravel())
+
+    return {
+        "home": [canonical_team_name(row[col["HomeTeam"]]) for row in rows],
+        "away": [canonical_team_name(row[col["AwayTeam"]]) for row in rows],
+        "bookmakers": bookmakers,
+        "odds": odds.reshape(len(rows), len(bookmakers), 3),
+    }
+
+
+def concatenate_odds(stores, keys):
+    """Concatenate many odds stores into one, with the union of their
+    bookmakers, and ``"seasons"`` (the ``keys``) and ``"season"`` (an index
+    into them for every match) added.
+    """
+    bookmakers = []
+    for store in stores:
+        bookmakers.extend(
+            b for b in store["bookmakers"] if b not in bookmakers
+        )
+    index = {b: i for i, b in enumerate(bookmakers)}
+
+    num_matches = sum(len(store["home"]) for store in stores)
+    odds = np.full((num_matches, len(bookmakers), 3), np.nan)
+    season = np.empty(num_matches, dtype=int)
+    home, away = [], []
+    start = 0
+    for s, store in enumerate(stores):
+        stop = start + len(store["home"])
+        cols = [index[b] for b in store["bookmakers"]]
+        odds[start:stop, cols] = store["odds"]
+        season[start:stop] = s
+        home.extend(store["home"])
+        away.extend(store["away"])
+        start = stop
+
+    return {
+        "home": home,
+        "away": away,
+        "bookmakers": bookmakers,
+        "odds": odds,
+        "seasons": list(keys),
+        "season": season,
+    }
+
+
+def implied_probabilities(odds):
+    """Convert decimal ``odds``, with the ``(home, draw, away)`` outcomes
+    along the last axis, to probabilities with the bookmaker's margin
+    removed (proportionally). Incomplete or invalid triples give ``nan``.
+    """
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = np.where(odds > 1.0, 1.0 / odds, np.nan)
+        return inverse / inverse.sum(axis=-1, keepdims=True)
+
+
+def consensus_probabilities(odds):
+    """The mean margin-free probabilities over all bookmakers that priced
+    each match, shape ``(num_matches, 3)``, ``nan`` where none did.
+    """
+    probs = implied_probabilities(odds)
+    priced = np.isfinite(probs[..., 0])
+    total = np.where(priced[..., None], probs, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return total / priced.sum(axis=1)[:, None]
+
+
+def load_season_odds(year, league="E0"):
+    """Load the odds store of a single season, with ``"probabilities"``."""
+    from .proggyleg import get_footballdata
+
+    store = parse_footballdata_odds(get_footballdata(str(year), league))
+    store["probabilities"] = consensus_probabilities(store["odds"])
+    return store
+
+
+def load_odds_archive(years, leagues=("E0",), max_workers=8):
+    """Load the odds of every season of ``leagues`` in ``years`` into a
+    single store, see :func:`concatenate_odds`, downloading in parallel and
+    computing ``"probabilities"`` for all matches in one pass. Seasons that
+    fail to load are skipped with a warning.
+    """
+    from .proggyleg import get_footballdata, load_all_season_data
+
+    def load(year, league):
+        return parse_footballdata_odds(get_footballdata(year, league))
+
+    stores = load_all_season_data(
+        years, leagues, load=load, max_workers=max_workers
+    )
+    store = concatenate_odds(
+        list(stores.values()),
+        [(str(year), league) for league, year in stores],
+    )
+    store["probabilities"] = consensus_probabilities(store["odds"])
+    return store
+
+
+def compute_expected_points(data, odds=None):
+    """Compute every team's cumulative expected points, from the
+    probabilities implied by the odds of each match.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    odds : dict, optional
+        An odds store with ``"probabilities"``, either of this season or an
+        archive containing it, by default loaded with
+        :func:`load_season_odds`. Matches without odds are given the
+        season's average probabilities.
+
+    Returns
+    -------
+    dict
+        Mapping each team to its cumulative expected points, aligned with
+        ``data["cumpoints"]`` (i.e. starting with 0 before any games).
+    """
+    from .proggyleg import count_meetings
+
+    key = (str(data["year"]), data["league"])
+    if odds is None:
+        odds = load_season_odds(*key)
+
+    probs = odds["probabilities"]
+    pairs = list(zip(odds["home"], odds["away"]))
+    if "seasons" in odds:
+        (rows,) = np.nonzero(odds["season"] == odds["seasons"].index(key))
+        probs = probs[rows]
+        pairs = [pairs[i] for i in rows]
+
+    priced = np.isfinite(probs[:, 0])
+    if not priced.any():
+        raise ValueError(f"No odds for {key}.")
+    default = probs[priced].mean(axis=0)
+    lookup = {
+        k: p if ok else default
+        for k, p, ok in zip(count_meetings(pairs), probs, priced)
+    }
+
+    matches = data["matches"]
+    match_probs = np.array(
+        [
+            lookup.get(k, default)
+            for k in count_meetings([(h, a) for h, a, *_ in matches])
+        ]
+    ).reshape(-1, 3)
+    # points of a home win, draw and away win, for the home team
+    win, draw, loss = data["rules"]["points"]
+    home_points = np.array([win, draw, loss], dtype=float)
+    home_xpts = match_probs @ home_points
+    away_xpts = match_probs @ home_points[::-1]
+
+    xpts = {team: [] for team in data["teams"]}
+    for (home_team, away_team, *_), hx, ax in zip(
+        matches, home_xpts, away_xpts
+    ):
+        xpts[home_team].append(hx)
+        xpts[away_team].append(ax)
+    return {
+        team: np.concatenate([[0.0], np.cumsum(xs)])
+        for team, xs in xpts.items()
+    }
@@ -1,6 +1,11 @@
 import collections
+import contextlib
+import csv
 import functools
+import os
 import pathlib
+import threading
+import warnings
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -39,21 +44,22 @@ def update_data(year=CURRENT_YEAR, source="footballdata"):
     urllib.request.urlretrieve(url, target)
 
 
+LEAGUE_NAMES = {
+    "E0": "Premier League",
+    "E1": "EFL Championship",
+    "E2": "EFL League One",
+    "SP1": "La Liga",
+    "I1": "Serie A",
+    "D1": "Bundesliga",
+    "SC0": "Scottish Premiership",
+    "FR1": "Ligue 1",
+}
+
+
 def generate_notebook_doc(year=CURRENT_YEAR, league="E0", dynamic="auto"):
     import pathlib
     import nbformat as nbf
 
-    fullnames = {
-        "E0": "Premier League",
-        "E1": "EFL Championship",
-        "E2": "EFL League One",
-        "SP1": "La Liga",
-        "I1": "Serie A",
-        "D1": "Bundesliga",
-        "SC0": "Scottish Premiership",
-        "FR1": "Ligue 1",
-    }
-
     if dynamic == "auto":
         dynamic = year == CURRENT_YEAR
 
@@ -71,7 +77,7 @@ def generate_notebook_doc(year=CURRENT_YEAR, league="E0", dynamic="auto"):
                 (
                     f"# {year} / {year + 1}",
                     "",
-                    f"Progress points for the {fullnames[league]} "
+                    f"Progress points for the {LEAGUE_NAMES[league]} "
                     f"{year} / {year + 1} season.",
                 )
             )
@@ -83,6 +89,8 @@ def generate_notebook_doc(year=CURRENT_YEAR, league="E0", dynamic="auto"):
                 (
                     "%config InlineBackend.figure_formats = ['svg']",
                     "from proggyleg import proggyleg",
+                    "from proggyleg.svg import use_compact_svg",
+                    "use_compact_svg()",
                     f"year = {year}",
                     f'league = "{league}"',
                 )
@@ -498,60 +506,275 @@ team_aliases = {
 }
 
 
+DATA_DIR = pathlib.Path(__file__).parent / "data"
+# where anything a user explicitly saves goes, never the package itself
+USER_CACHE_DIR = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "proggyleg"
+)
+
+
+def fold_team_name(name):
+    """Normalize a team name for alias matching: strip accents, case and
+    punctuation, e.g. ``"1. FC Köln" -> "1 fc koln"``.
+    """
+    import re
+    import unicodedata
+
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    return " ".join(re.split(r"\W+", name.casefold())).strip()
+
+
+class TeamRegistry:
+    """Interned set of teams with stable integer ids. Aliases (and any
+    accent or case variants of them) resolve to the canonical id through a
+    precomputed index, and the style of every team is stored as packed
+    arrays indexed by id.
+
+    Ids are assigned in order of registration. The builtin teams are
+    registered first from the shipped ``DATA_DIR / "teams.json"``, so their
+    ids are stable across leagues, seasons, sessions and processes. Unknown
+    teams are only registered in memory, so their ids last only as long as
+    the session, unless the registry is explicitly persisted with
+    :meth:`save`, by default to the user's cache directory, which is then
+    loaded on top of the builtin teams.
+    """
+
+    default_style = ("grey", "white", None)
+
+    def __init__(self):
+        import threading
+
+        self._lock = threading.Lock()
+        self.names = []
+        self.aliases = {}
+        self._index = {}
+        self._color0 = np.empty((0, 4))
+        self._color1 = np.empty((0, 4))
+        self._markers = np.empty(0, dtype=object)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return self.lookup(name) is not None
+
+    @property
+    def color0(self):
+        return self._color0[: len(self)]
+
+    @property
+    def color1(self):
+        return self._color1[: len(self)]
+
+    @property
+    def markers(self):
+        return self._markers[: len(self)]
+
+    def _grow(self):
+        capacity = max(2 * len(self._markers), 64)
+        for attr in ("_color0", "_color1", "_markers"):
+            old = getattr(self, attr)
+            new = np.empty((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, attr, new)
+
+    def _index_name(self, name, i):
+        self._index[name] = i
+        self._index.setdefault(fold_team_name(name), i)
+
+    def add(self, name, team_style=None, aliases=()):
+        """Register ``name`` (if it is not already), with an optional
+        ``(color0, color1, marker)`` style and extra aliases, and return
+        its id.
+        """
+        with self._lock:
+            i = self._index.get(name)
+            if i is None:
+                i = len(self.names)
+                if i == len(self._markers):
+                    self._grow()
+                self.names.append(name)
+                self._index_name(name, i)
+                team_style = team_style or self.default_style
+            if team_style is not None:
+                c0, c1, marker = team_style
+                self._color0[i] = mpl.colors.to_rgba(c0)
+                self._color1[i] = mpl.colors.to_rgba(c1)
+                self._markers[i] = marker or f"${name[0]}$"
+            for alias in aliases:
+                self.aliases[alias] = name
+                self._index_name(alias, i)
+            return i
+
+    def lookup(self, name):
+        """Get the id of ``name`` or any of its aliases, or ``None``."""
+        i = self._index.get(name)
+        if i is None:
+            i = self._index.get(fold_team_name(name))
+            if i is not None:
+                # cache this exact spelling
+                self._index[name] = i
+        return i
+
+    def resolve(self, name):
+        """Get the id of ``name``, registering it with the default style if
+        it is not known yet.
+        """
+        i = self.lookup(name)
+        if i is None:
+            warnings.warn(f"Unknown team {name!r}, using default style.")
+            i = self.add(name)
+        return i
+
+    def canonical(self, name):
+        return self.names[self.resolve(name)]
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "names": list(self.names),
+                "aliases": dict(self.aliases),
+                "style": {
+                    name: (
+                        mpl.colors.to_hex(self._color0[i]),
+                        mpl.colors.to_hex(self._color1[i]),
+                        self._markers[i],
+                    )
+                    for i, name in enumerate(self.names)
+                },
+            }
+
+    def save(self, path=None):
+        """Save the registry to ``path``, by default
+        ``USER_CACHE_DIR / "teams.json"``.
+        """
+        import json
+
+        path = pathlib.Path(path or USER_CACHE_DIR / "teams.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f, indent=1, ensure_ascii=False)
+        # n.b. atomic, so a concurrent reader never sees a partial file
+        os.replace(tmp, path)
+
+    @classmethod
+    def from_style(cls, style, aliases, paths=()):
+        """Build a registry from a ``style`` dict and ``aliases`` dict. The
+        teams saved in each of ``paths`` that exist are registered first,
+        in order, so that their ids are preserved, and any new builtin
+        teams appended after. Nothing is written back.
+        """
+        import json
+
+        self = cls()
+        for path in paths:
+            if not pathlib.Path(path).exists():
+                continue
+            with open(path) as f:
+                saved = json.load(f)
+            for name in saved["names"]:
+                self.add(name, saved["style"].get(name))
+            for alias, name in saved["aliases"].items():
+                self.add(name, aliases=(alias,))
+
+        for name, team_style in style.items():
+            self.add(name, team_style)
+        for alias, name in aliases.items():
+            self.add(name, aliases=(alias,))
+        return self
+
+
+@functools.lru_cache(None)
+def get_team_registry():
+    return TeamRegistry.from_style(
+        style,
+        team_aliases,
+        paths=(DATA_DIR / "teams.json", USER_CACHE_DIR / "teams.json"),
+    )
+
+
+def canonical_team_name(team):
+    return get_team_registry().canonical(team)
+
+
+def get_team_id(team):
+    return get_team_registry().resolve(team)
+
+
 def maker_default_entry(team):
-    style[team] = ("grey", "white", f"${team[0]}$")
+    get_team_registry().add(team)
 
 
 def get_color0(team):
-    if team not in style:
-        print(team)
-        maker_default_entry(team)
-    return style[team][0]
+    i = get_team_id(team)
+    return tuple(get_team_registry().color0[i].tolist())
 
 
 def get_color1(team):
-    if team not in style:
-        print(team)
-        maker_default_entry(team)
-    return style[team][1]
+    i = get_team_id(team)
+    return tuple(get_team_registry().color1[i].tolist())
 
 
 def get_marker(team):
-    if team not in style:
-        print(team)
-        maker_default_entry(team)
-    return style[team][2]
+    i = get_team_id(team)
+    return get_team_registry().markers[i]
 
 
-def parse_fixturedownload_data(contents):
-    import csv
+@functools.lru_cache(None)
+def _marker_style(marker, fontset):
+    from matplotlib.markers import MarkerStyle
+
+    return MarkerStyle(marker)
+
+
+def get_marker_style(team):
+    """Get the ``MarkerStyle`` of ``team``, cached since building the
+    mathtext marker paths is relatively slow and each is drawn many times.
+    """
+    return _marker_style(get_marker(team), mpl.rcParams["mathtext.fontset"])
+
+
+def iter_fixturedownload_rows(lines):
+    """Lazily parse lines of a fixturedownload CSV, yielding the
+    ``(datetime, home_team, away_team, home_goals, away_goals)`` of every
+    played match, in file order.
+    """
     import re
     from datetime import datetime
 
-    reader = list(csv.DictReader(contents.splitlines()))
-    reader.sort(key=lambda x: datetime.strptime(x["Date"], r"%d/%m/%Y %H:%M"))
-
-    data = []
-    for row in reader:
-        home_team = row["Home Team"]
-        home_team = team_aliases.get(home_team, home_team)
-        away_team = row["Away Team"]
-        away_team = team_aliases.get(away_team, away_team)
-        score = row["Result"]
-        match = re.match(r"(\d+)\s?-\s?(\d+)", score)
+    for row in csv.DictReader(lines):
+        home_team = canonical_team_name(row["Home Team"])
+        away_team = canonical_team_name(row["Away Team"])
+        match = re.match(r"(\d+)\s?-\s?(\d+)", row["Result"])
         if match:
-            data.append(
-                (
-                    home_team,
-                    away_team,
-                    int(match.group(1)),
-                    int(match.group(2)),
-                )
+            yield (
+                datetime.strptime(row["Date"], r"%d/%m/%Y %H:%M"),
+                home_team,
+                away_team,
+                int(match.group(1)),
+                int(match.group(2)),
             )
 
+
+def _sorted_matches(rows, with_dates=False):
+    # n.b. stable, so matches at the same time stay in file order
+    data = []
+    for date, *entry in sorted(rows, key=lambda row: row[0]):
+        if with_dates:
+            entry = (date.date(), *entry)
+        data.append(tuple(entry))
     return data
 
 
+def parse_fixturedownload_data(contents, with_dates=False):
+    return _sorted_matches(
+        iter_fixturedownload_rows(contents.splitlines()), with_dates
+    )
+
+
 def parse_datetime(date_str):
     from datetime import datetime
 
@@ -561,81 +784,357 @@ def parse_datetime(date_str):
         return datetime.strptime(date_str, r"%d/%m/%Y")
 
 
-def parse_footballdata_data(contents):
-    import csv
+def iter_footballdata_rows(lines):
+    """Lazily parse lines of a football-data CSV, yielding the
+    ``(datetime, home_team, away_team, home_goals, away_goals)`` of every
+    played match, in file order.
+    """
+    for row in csv.DictReader(lines):
+        if row["FTHG"] and row["FTAG"]:
+            yield (
+                parse_datetime(row["Date"]),
+                canonical_team_name(row["HomeTeam"]),
+                canonical_team_name(row["AwayTeam"]),
+                int(row["FTHG"]),
+                int(row["FTAG"]),
+            )
 
-    reader = [
-        row
-        for row in csv.DictReader(contents.splitlines())
-        if row["FTHG"] and row["FTAG"]
-    ]
-    reader.sort(key=lambda x: parse_datetime(x["Date"]))
-    data = []
-    for row in reader:
-        home_team = row["HomeTeam"]
-        home_team = team_aliases.get(home_team, home_team)
-        away_team = row["AwayTeam"]
-        away_team = team_aliases.get(away_team, away_team)
-        home_score = int(row["FTHG"])
-        away_score = int(row["FTAG"])
-        data.append((home_team, away_team, home_score, away_score))
-    return data
 
+def read_footballdata_table(contents):
+    """Read the played rows of a football-data CSV as lists of strings, in
+    the same order as :func:`parse_footballdata_data`, returning them and
+    a dict mapping each column name to its index in the rows.
+    """
+    rows = csv.reader(contents.splitlines())
+    header = next(rows)
+    col = {name: i for i, name in enumerate(header)}
+    # some files have ragged rows
+    rows = [row + [""] * (len(header) - len(row)) for row in rows]
+    rows = [row for row in rows if row[col["FTHG"]] and row[col["FTAG"]]]
+    # stable, so matching the parser's order
+    dates = [parse_datetime(row[col["Date"]]) for row in rows]
+    order = sorted(range(len(rows)), key=dates.__getitem__)
+    return [rows[i] for i in order], col
+
+
+def _to_float(x):
+    try:
+        return float(x)
+    except ValueError:
+        return np.nan
+
+
+def columns_to_float(rows, columns):
+    """Convert the ``columns`` (indices) of every row of a table, as read by
+    :func:`read_footballdata_table`, to floats all at once, returning shape
+    ``(len(rows), len(columns))``, with ``nan`` for blank entries.
+    """
+    raw = np.array(
+        [[row[i] for i in columns] for row in rows], dtype=object
+    ).reshape(len(rows), len(columns))
+    raw[raw == ""] = "nan"
+    try:
+        return raw.astype(float)
+    except ValueError:
+        # the odd malformed entry, fall back to converting one by one
+        return np.vectorize(_to_float, otypes=[float])(raw)
+
+
+def count_meetings(pairs):
+    """Key each ``(home, away)`` pair by its occurrence, as
+    ``(home, away, k)``, so that a fixture played more than once (e.g. in
+    Scotland) stays distinct.
+    """
+    seen = {}
+    keys = []
+    for pair in pairs:
+        k = seen.get(pair, 0)
+        seen[pair] = k + 1
+        keys.append((*pair, k))
+    return keys
+
+
+def parse_footballdata_data(contents, with_dates=False):
+    return _sorted_matches(
+        iter_footballdata_rows(contents.splitlines()), with_dates
+    )
 
-def compute_cumulative_quantities(data, penalties=None, league="E0", year=0):
-    penalties = penalties or {}
 
-    points = {}
-    cumpoints = {}
-    cumgoaldiff = {}
-    cumgoalsscored = {}
-
-    for home_team, away_team, home_goals, away_goals in data:
-        # points
-        if home_goals > away_goals:
-            home_pts = 3
-            away_pts = 0
-        elif away_goals > home_goals:
-            home_pts = 0
-            away_pts = 3
-        else:
-            home_pts = away_pts = 1
+def _match_key(match):
+    date, home_team, away_team, *_ = match
+    return date, home_team, away_team
 
-        points.setdefault(home_team, []).append(home_pts)
-        points.setdefault(away_team, []).append(away_pts)
 
-        cumpoints.setdefault(home_team, [0]).append(
-            cumpoints[home_team][-1] + home_pts
-        )
-        cumpoints.setdefault(away_team, [0]).append(
-            cumpoints[away_team][-1] + away_pts
-        )
+def _match_meetings(matches):
+    """Key each dated match by ``(home_team, away_team, meeting)``, where
+    ``meeting`` counts earlier matches between the same home and away
+    teams, so that the key doesn't depend on the date itself.
+    """
+    seen = {}
+    keyed = {}
+    # n.b. stable, so the date only breaks ties between meetings
+    for match in sorted(matches, key=lambda m: m[0]):
+        pair = tuple(match[1:3])
+        meeting = seen.get(pair, 0)
+        seen[pair] = meeting + 1
+        keyed[(*pair, meeting)] = match
+    return keyed
 
-        cumgoalsscored.setdefault(home_team, [0]).append(
-            cumgoalsscored[home_team][-1] + home_goals
-        )
-        cumgoalsscored.setdefault(away_team, [0]).append(
-            cumgoalsscored[away_team][-1] + away_goals
-        )
 
-        # goal diff
-        home_goaldiff = home_goals - away_goals
-        away_goaldiff = away_goals - home_goals
+def reconcile_match_data(
+    data_a,
+    data_b,
+    names=("footballdata", "fixturedownload"),
+):
+    """Merge two dated match lists (as produced by the parsers with
+    ``with_dates=True``) into a single list.
+
+    Matches are identified by ``(home_team, away_team, meeting)``, the
+    meeting counting, in date order, earlier matches between the same home
+    and away teams, so a match the sources date differently (e.g. after a
+    rescheduling or a time zone shift) is still counted once. Where both
+    sources have a match but disagree on the score or date, the match from
+    ``data_a`` is kept and the disagreement is reported.
+
+    Returns
+    -------
+    report : dict
+        With keys ``"matches"``, the merged dated match list, sorted by
+        ``(date, home_team, away_team)``, ``"conflicts"``, a list of
+        ``(key, score_a, score_b)``, ``"moved"``, a list of
+        ``(key, date_a, date_b)``, and ``"missing"``, a dict mapping each
+        source name to the matches it lacks but the other source has.
+    """
+    name_a, name_b = names
+    keyed_a = _match_meetings(data_a)
+    keyed_b = _match_meetings(data_b)
+
+    matches = []
+    conflicts = []
+    moved = []
+    missing = {name_a: [], name_b: []}
+
+    for key, match_a in keyed_a.items():
+        matches.append(match_a)
+        match_b = keyed_b.get(key)
+        if match_b is None:
+            missing[name_b].append(match_a)
+            continue
+        if match_a[3:] != match_b[3:]:
+            conflicts.append((key, match_a[3:], match_b[3:]))
+        if match_a[0] != match_b[0]:
+            moved.append((key, match_a[0], match_b[0]))
+
+    for key, match_b in keyed_b.items():
+        if key not in keyed_a:
+            matches.append(match_b)
+            missing[name_a].append(match_b)
+
+    matches.sort(key=_match_key)
+    return {
+        "matches": matches,
+        "conflicts": conflicts,
+        "moved": moved,
+        "missing": missing,
+    }
 
-        cumgoaldiff.setdefault(home_team, [0]).append(
-            cumgoaldiff[home_team][-1] + home_goaldiff
-        )
-        cumgoaldiff.setdefault(away_team, [0]).append(
-            cumgoaldiff[away_team][-1] + away_goaldiff
+
+DEFAULT_RULES = {
+    # points for a win, draw and loss
+    "points": (3, 1, 0),
+    # "round_robin" or "swiss"
+    "format": "round_robin",
+    # for round robins, how many times every pair of teams meets
+    "cycles": 2,
+    # if not None, after the cycles the table splits into a top and bottom
+    # half, and every pair within each half meets this many more times
+    "split": None,
+    # for swiss formats, how many rounds there are
+    "rounds": None,
+}
+
+# any changes from the default rules, in order of the year they start
+LEAGUE_RULES = {
+    "SC0": [
+        (0, {"cycles": 4}),
+        (2000, {"cycles": 3, "split": 1}),
+    ],
+    "SC1": [(0, {"cycles": 4})],
+    "SC2": [(0, {"cycles": 4})],
+    "SC3": [(0, {"cycles": 4})],
+}
+
+
+def get_rules(league="E0", year=0, **overrides):
+    """Get the competition rules of ``league`` in ``year``, see
+    :data:`DEFAULT_RULES`, with any ``overrides``, e.g.
+    ``get_rules("chess", format="swiss", rounds=9, points=(1, 0.5, 0))``.
+    """
+    rules = dict(DEFAULT_RULES)
+    for start, changes in LEAGUE_RULES.get(league, ()):
+        # an unknown year (0) takes the latest rules
+        if (int(year) >= start) or not int(year):
+            rules.update(changes)
+    rules.update(overrides)
+    return rules
+
+
+def count_total_games(rules, num_teams):
+    """The number of games each team plays in a season with ``rules``."""
+    if rules["format"] == "swiss":
+        return rules["rounds"]
+    if rules["format"] != "round_robin":
+        raise ValueError(
+            f"Unknown format {rules['format']}, should be "
+            "'round_robin' or 'swiss'."
         )
+    total_games = rules["cycles"] * (num_teams - 1)
+    if rules["split"]:
+        # the larger half, if uneven
+        total_games += rules["split"] * (num_teams - num_teams // 2 - 1)
+    return total_games
+
+
+def compute_team_matches(home, away, num_teams):
+    """Compute the sparse incidence of teams and matches, i.e. for each
+    team the indices of its matches, in order.
+
+    Parameters
+    ----------
+    home, away : numpy.ndarray
+        The index of the home and away team of each match.
+    num_teams : int
+        The number of teams.
+
+    Returns
+    -------
+    team_ptr : numpy.ndarray
+        Shape ``(num_teams + 1,)``, team ``i``'s matches are
+        ``team_matches[team_ptr[i] : team_ptr[i + 1]]``.
+    team_matches : numpy.ndarray
+        Shape ``(2 * num_matches,)``, the match indices.
+    sides : numpy.ndarray
+        Shape ``(2 * num_matches,)``, whether each team was home (0) or away
+        (1) in each of its matches.
+    """
+    num_matches = len(home)
+    team = np.concatenate([home, away])
+    match = np.tile(np.arange(num_matches), 2)
+    order = np.lexsort((match, team))
+    team_ptr = np.zeros(num_teams + 1, dtype=int)
+    np.cumsum(np.bincount(team, minlength=num_teams), out=team_ptr[1:])
+    return team_ptr, match[order], order // max(num_matches, 1)
+
+
+def games_after_matches(data, num_matches):
+    """The number of games every team had played after the first
+    ``num_matches`` matches, by binary search of the sparse team-match
+    incidence. ``num_matches`` can be an array, in which case the result
+    has an extra last axis over teams.
+    """
+    team_ptr = data["team_ptr"]
+    num_teams = len(team_ptr) - 1
+    stride = len(data["matches"]) + 1
+    # sorted, since matches are sorted within each team
+    keys = (
+        np.repeat(np.arange(num_teams), np.diff(team_ptr)) * stride
+        + data["team_matches"]
+    )
+    queries = (
+        np.arange(num_teams) * stride + np.asarray(num_matches)[..., None]
+    )
+    return np.searchsorted(keys, queries) - team_ptr[:-1]
+
 
-    teams = sorted(cumpoints.keys())
-    points = {team: np.array(ps) for team, ps in points.items()}
-    cumpoints = {team: np.array(ps) for team, ps in cumpoints.items()}
-    cumgoaldiff = {team: np.array(ps) for team, ps in cumgoaldiff.items()}
+def matchday_ends(data):
+    """The number of matches after which every team had first played at
+    least 1, 2, ... games, up to the fewest any team has played so far.
+    """
+    fewest = games_after_matches(
+        data, np.arange(len(data["matches"]) + 1)
+    ).min(axis=1)
+    return np.searchsorted(fewest, np.arange(1, fewest[-1] + 1))
+
+
+def compute_cumulative_quantities(
+    data,
+    penalties=None,
+    league="E0",
+    year=0,
+    rules=None,
+):
+    """Compute every team's cumulative points, goal difference and goals
+    scored, and the table, from a list of ``(home_team, away_team,
+    home_goals, away_goals)`` matches, optionally each with a leading date.
+    ``rules`` are the competition rules, by default from :func:`get_rules`.
+
+    Everything is stored sparsely, i.e. per team arrays and a team-match
+    incidence, so that memory is linear in the number of matches, however
+    many teams there are.
+    """
+    penalties = penalties or {}
+    matches = list(data)
+    if rules is None:
+        rules = get_rules(league, year)
+
+    if matches and len(matches[0]) == 5:
+        # dated matches, as from the parsers with ``with_dates=True``
+        dates = np.array([m[0] for m in matches], dtype="datetime64[D]")
+        matches = [tuple(m[1:]) for m in matches]
+    else:
+        dates = None
+
+    teams = sorted({m[0] for m in matches} | {m[1] for m in matches})
+    num_teams = len(teams)
+    index = {team: i for i, team in enumerate(teams)}
+    home = np.array([index[m[0]] for m in matches], dtype=int)
+    away = np.array([index[m[1]] for m in matches], dtype=int)
+    goals = np.array([m[2:] for m in matches], dtype=int).reshape(-1, 2)
+
+    # points of the (home, away) team in each match
+    win, draw, loss = rules["points"]
+    home_wins = goals[:, 0] > goals[:, 1]
+    away_wins = goals[:, 1] > goals[:, 0]
+    match_points = np.array(
+        [
+            np.where(home_wins, win, np.where(away_wins, loss, draw)),
+            np.where(away_wins, win, np.where(home_wins, loss, draw)),
+        ]
+    ).T
+
+    # gather every team's matches, in order, as flat arrays
+    team_ptr, team_matches, sides = compute_team_matches(home, away, num_teams)
+    flat_points = match_points[team_matches, sides]
+    flat_scored = goals[team_matches, sides]
+    flat_diff = flat_scored - goals[team_matches, 1 - sides]
+
+    def per_team(x, cumulative):
+        out = {}
+        for i, team in enumerate(teams):
+            xs = x[team_ptr[i] : team_ptr[i + 1]]
+            if cumulative:
+                xs = np.concatenate([[0], np.cumsum(xs)])
+            out[team] = xs
+        return out
+
+    points = per_team(flat_points, False)
+    cumpoints = per_team(flat_points, True)
+    cumgoaldiff = per_team(flat_diff, True)
+    cumgoalsscored = per_team(flat_scored, True)
+
+    if dates is not None:
+        # the date of each entry of the cumulative arrays, starting with
+        # the day before the first game of the season
+        cumdates = per_team(dates[team_matches], False)
+        cumdates = {
+            team: np.concatenate([dates[:1] - 1, ds])
+            for team, ds in cumdates.items()
+        }
+    else:
+        cumdates = None
 
     for team, penalty in penalties.items():
-        cumpoints[team] -= penalty
+        cumpoints[team] = cumpoints[team] - penalty
 
     current_points = {team: cpts[-1] for team, cpts in cumpoints.items()}
     max_points = max(current_points.values())
@@ -653,12 +1152,6 @@ def compute_cumulative_quantities(data, penalties=None, league="E0", year=0):
     )
     places = {team: i for i, team in enumerate(ranked_teams)}
 
-    if league[:2] == "SC":
-        # Scottish leagues have 4 games per team
-        total_games = 4 * (len(teams) - 1)
-    else:
-        total_games = 2 * (len(teams) - 1)
-
     return {
         "cumgoaldiff": cumgoaldiff,
         "cumgoalsscored": cumgoalsscored,
@@ -667,12 +1160,19 @@ def compute_cumulative_quantities(data, penalties=None, league="E0", year=0):
         "games_played": games_played,
         "max_games": max_games,
         "max_points": max_points,
-        "num_teams": len(teams),
+        "num_teams": num_teams,
         "places": places,
         "points": points,
         "ranked_teams": ranked_teams,
         "teams": teams,
-        "total_games": total_games,
+        "team_ids": np.array([get_team_id(team) for team in teams]),
+        "matches": matches,
+        "team_ptr": team_ptr,
+        "team_matches": team_matches,
+        "dates": dates,
+        "cumdates": cumdates,
+        "rules": rules,
+        "total_games": count_total_games(rules, num_teams),
         "league": league,
         "year": int(year),
     }
@@ -701,12 +1201,63 @@ NEUTRAL_STYLE = {
 }
 
 
+# matplotlib only has global rc parameters, which artists read as they are
+# created, so figures are built holding this lock to keep concurrent threads
+# from interleaving styles
+RC_LOCK = threading.RLock()
+
+
+@contextlib.contextmanager
+def style_context(style):
+    """Apply the rc parameters ``style`` for the duration, holding
+    :data:`RC_LOCK`, so that building figures is safe from many threads.
+    """
+    with RC_LOCK, mpl.rc_context(style):
+        yield
+
+
+def new_figure(figsize=(7, 7), **kwargs):
+    """Create a figure with an Agg canvas directly, i.e. not managed by
+    pyplot, so that it can be built and rendered from any thread and is
+    garbage collected as normal.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, **kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def render_figure(fig, format="png", **kwargs):
+    """Render ``fig`` to bytes in ``format`` without pyplot. Rasterising
+    doesn't hold :data:`RC_LOCK`, so many figures can be rendered at once,
+    except SVG, whose backend reads its options while drawing.
+    """
+    import io
+
+    buffer = io.BytesIO()
+    if format == "svg":
+        # fixed id salt and no date, so identical figures give identical
+        # bytes
+        kwargs.setdefault("metadata", {"Date": None})
+        with style_context({"svg.hashsalt": "proggyleg"}):
+            fig.savefig(buffer, format=format, **kwargs)
+    else:
+        fig.savefig(buffer, format=format, **kwargs)
+    return buffer.getvalue()
+
+
 def setup_and_handle_figure(fn):
     @functools.wraps(fn)
     def wrapped(*args, figsize=(7, 7), ax=None, show_and_close=True, **kwargs):
-        with mpl.style.context(NEUTRAL_STYLE):
+        with style_context(NEUTRAL_STYLE):
             if ax is None:
-                fig = plt.figure(figsize=figsize)
+                if show_and_close:
+                    fig = plt.figure(figsize=figsize)
+                else:
+                    # not shown, so keep pyplot out of it
+                    fig = new_figure(figsize=figsize)
                 ax = fig.add_subplot(111)
             else:
                 fig = None
@@ -723,6 +1274,38 @@ def setup_and_handle_figure(fn):
     return wrapped
 
 
+def set_date_ax_limits(ax, x_start, x_end):
+    """Like :func:`set_ax_limits` but for an x-axis of dates, given as
+    matplotlib date numbers.
+    """
+    import matplotlib.dates as mdates
+
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    ax.set_xlim(x_start, x_end)
+
+
+def get_xs(data, xaxis="games"):
+    """Get the x-coordinates of every team's cumulative arrays, either by
+    ``"games"`` played, or ``"date"`` as matplotlib date numbers.
+    """
+    if xaxis == "games":
+        return {
+            team: np.arange(len(cpts))
+            for team, cpts in data["cumpoints"].items()
+        }
+    if xaxis == "date":
+        import matplotlib.dates as mdates
+
+        _check_dated(data)
+        return {
+            team: mdates.date2num(dates)
+            for team, dates in data["cumdates"].items()
+        }
+    raise ValueError(f"Unknown xaxis {xaxis}, should be 'games' or 'date'.")
+
+
 def set_ax_limits(ax, max_games, total_games, x_start=-0.5):
     from matplotlib.ticker import MaxNLocator
 
@@ -776,6 +1359,23 @@ _SPANS = {
 }
 
 
+def get_spans(league="E0", year=0):
+    """Get the ``(label, pos, color)`` zones of ``league`` in ``year``,
+    where a negative ``pos`` means the top ``-pos`` places, and otherwise
+    the bottom ``pos + 1`` places.
+    """
+    spans = []
+    for label, pos, color in _SPANS.get(league, ()):
+        if (
+            (label == "Champions League")
+            and (int(year) < 2024)
+            and (league in ("E0", "SP1"))
+        ):
+            pos = -4
+        spans.append((label, pos, color))
+    return spans
+
+
 def plot_spans(
     ax,
     ys,
@@ -783,24 +1383,14 @@ def plot_spans(
     num_teams,
     league="E0",
     year=0,
+    x_start=0,
 ):
-    spans = _SPANS.get(league, None)
-    if spans is None:
-        return
-
-    for label, pos, color in spans:
-        if (
-            (label == "Champions League")
-            and (year < 2024)
-            and (league in ("E0", "SP1"))
-        ):
-            pos = -4
-
+    for label, pos, color in get_spans(league, year):
         if pos < 0:
             pos = num_teams + pos
 
         ax.text(
-            0,
+            x_start,
             ys[pos],
             label,
             va="bottom",
@@ -810,7 +1400,7 @@ def plot_spans(
             fontsize=8,
         )
         ax.plot(
-            [0, max_games],
+            [x_start, max_games],
             [ys[pos]] * 2,
             zorder=-10,
             color=color,
@@ -819,6 +1409,137 @@ def plot_spans(
         )
 
 
+def compute_points_thresholds(seasons, percentiles=(10, 50, 90)):
+    """Compute how many points each position has historically had after
+    each number of games, over many seasons of one league.
+
+    Parameters
+    ----------
+    seasons : sequence of dict
+        Each the output of :func:`compute_cumulative_quantities`. Only
+        seasons with the most common number of teams are used.
+    percentiles : sequence of float, optional
+        The percentiles to compute, over seasons.
+
+    Returns
+    -------
+    dict
+        With keys ``"points"``, shape ``(len(percentiles), num_teams,
+        max_games)`` with positions ordered as ``data["places"]`` (0 the
+        bottom), and ``"league"``, ``"years"``, ``"num_teams"`` and
+        ``"percentiles"``.
+    """
+    sizes = collections.Counter(data["num_teams"] for data in seasons)
+    num_teams = sizes.most_common(1)[0][0]
+    seasons = [data for data in seasons if data["num_teams"] == num_teams]
+    max_games = max(data["max_games"] for data in seasons)
+
+    # games not yet played by anyone are missing
+    points = np.full((len(seasons), num_teams, max_games), np.nan)
+    for s, data in enumerate(seasons):
+        points[s, :, : data["max_games"]] = _padded(data, "cumpoints")
+    # the points of whoever was in each position, as for compute_positions
+    points.sort(axis=1)
+
+    return {
+        "league": seasons[0]["league"],
+        "years": [data["year"] for data in seasons],
+        "num_teams": num_teams,
+        "percentiles": np.asarray(percentiles, dtype=float),
+        "points": np.nanpercentile(points, percentiles, axis=0),
+    }
+
+
+def build_points_thresholds(
+    league="E0",
+    years=range(2000, CURRENT_YEAR),
+    percentiles=(10, 50, 90),
+    save=True,
+    max_workers=8,
+):
+    """Load every season of ``league`` in ``years`` and compute its points
+    thresholds, see :func:`compute_points_thresholds`, by default saving
+    them with the data. Seasons that fail to load are skipped with a
+    warning.
+    """
+    seasons = load_all_season_data(years, league, max_workers=max_workers)
+    thresholds = compute_points_thresholds(list(seasons.values()), percentiles)
+    if save:
+        save_points_thresholds(thresholds)
+    return thresholds
+
+
+def save_points_thresholds(thresholds, path=None):
+    league = thresholds["league"]
+    path = pathlib.Path(path or DATA_DIR / f"thresholds-{league}.npz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path,
+        league=league,
+        years=np.asarray(thresholds["years"]),
+        num_teams=thresholds["num_teams"],
+        percentiles=thresholds["percentiles"],
+        points=thresholds["points"],
+    )
+    # n.b. so that the new thresholds are plotted from now on
+    load_points_thresholds.cache_clear()
+
+
+@functools.lru_cache(None)
+def load_points_thresholds(league="E0", path=None):
+    """Load the points thresholds saved by :func:`build_points_thresholds`,
+    cached, so that plotting them costs nothing extra.
+    """
+    path = pathlib.Path(path or DATA_DIR / f"thresholds-{league}.npz")
+    with np.load(path) as f:
+        return {
+            "league": str(f["league"]),
+            "years": f["years"].tolist(),
+            "num_teams": int(f["num_teams"]),
+            "percentiles": f["percentiles"],
+            "points": f["points"],
+        }
+
+
+def plot_threshold_bands(ax, thresholds, num_teams, league="E0", year=0):
+    """Shade, for each of the league's zones, the band between the lowest
+    and highest percentiles of the points its boundary position has
+    historically had after each game, with the median dotted.
+    """
+    if thresholds["num_teams"] != num_teams:
+        raise ValueError(
+            f"The thresholds are for {thresholds['num_teams']} teams, "
+            f"not {num_teams}."
+        )
+    points = thresholds["points"]
+    xs = np.arange(points.shape[2])
+    percentiles = thresholds["percentiles"]
+    median = np.searchsorted(percentiles, 50)
+    has_median = (median < len(percentiles)) and (percentiles[median] == 50)
+    for _, pos, color in get_spans(league, year):
+        if pos < 0:
+            pos = num_teams + pos
+        ax.fill_between(
+            xs,
+            points[0, pos],
+            points[-1, pos],
+            color=color,
+            alpha=0.15,
+            linewidth=0,
+            zorder=-20,
+        )
+        if has_median:
+            ax.plot(
+                xs,
+                points[median, pos],
+                color=color,
+                linestyle=":",
+                linewidth=1,
+                alpha=0.5,
+                zorder=-20,
+            )
+
+
 def speckle_plot(ax, *args, team, jitter=0.0, **kwargs):
     kwargs.setdefault("markersize", 5)
     kwargs.setdefault("markeredgewidth", 0.25)
@@ -836,9 +1557,11 @@ def speckle_plot(ax, *args, team, jitter=0.0, **kwargs):
         )
         # ys = np.array(ys) + np.random.uniform(low=-jitter, high=jitter, size=len(ys))
 
-    for color, linestyle, marker, alpha in [
-        (get_color0(team), "-", get_marker(team), 0.75),
-        (get_color1(team), (0, (1, 2)), "", 0.25),
+    # the main line is labelled with the team, so it can be found again,
+    # e.g. by :mod:`proggyleg.highlight`
+    for color, linestyle, marker, alpha, label in [
+        (get_color0(team), "-", get_marker_style(team), 0.75, team),
+        (get_color1(team), (0, (1, 2)), "", 0.25, "_nolegend_"),
     ]:
         ax.plot(
             xs,
@@ -848,39 +1571,148 @@ def speckle_plot(ax, *args, team, jitter=0.0, **kwargs):
             markeredgecolor=get_color1(team),
             alpha=alpha,
             marker=marker,
+            label=label,
             **kwargs,
         )
 
 
+def lttb_indices(xs, ys, num_points):
+    """Choose ``num_points`` of the line ``xs, ys`` that preserve its shape,
+    with the Largest-Triangle-Three-Buckets algorithm: the first and last
+    points are kept, and from each of ``num_points - 2`` equal buckets in
+    between the point making the largest triangle with the previously chosen
+    point and the average of the next bucket. Returns the chosen indices.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    n = len(xs)
+    if (num_points >= n) or (num_points < 3):
+        return np.arange(n)
+
+    # n.b. each bucket has at least one point, since num_points < n
+    edges = np.linspace(1, n - 1, num_points - 1).astype(int)
+    chosen = np.empty(num_points, dtype=int)
+    chosen[0], chosen[-1] = 0, n - 1
+    a = 0
+    for b in range(num_points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nlo, nhi = (hi, edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        cx, cy = xs[nlo:nhi].mean(), ys[nlo:nhi].mean()
+        # twice the area of each triangle
+        areas = np.abs(
+            (xs[a] - cx) * (ys[lo:hi] - ys[a])
+            - (xs[a] - xs[lo:hi]) * (cy - ys[a])
+        )
+        a = lo + areas.argmax()
+        chosen[b + 1] = a
+    return chosen
+
+
+# with more teams than this, plots draw only the top and bottom teams (and
+# any highlighted one) individually, and the rest as an aggregate band
+MAX_TEAM_LINES = 40
+
+
+def select_teams(ranked_teams, highlight="", max_lines=MAX_TEAM_LINES):
+    """Split ``ranked_teams`` (bottom first) into those to draw individually
+    and the rest, both still ranked. If there are more than ``max_lines``
+    (at least 2) teams, only the top and bottom ones, plus ``highlight``,
+    are drawn.
+    """
+    if (max_lines is not None) and (max_lines < 2):
+        raise ValueError(f"max_lines should be at least 2, not {max_lines}.")
+    if (max_lines is None) or (len(ranked_teams) <= max_lines):
+        return list(ranked_teams), []
+    num_bottom = max_lines // 2
+    num_top = max_lines - num_bottom
+    shown = {*ranked_teams[:num_bottom], *ranked_teams[-num_top:], highlight}
+    return (
+        [team for team in ranked_teams if team in shown],
+        [team for team in ranked_teams if team not in shown],
+    )
+
+
+def plot_team_band(
+    ax,
+    ys,
+    x_start=0,
+    quantiles=(0.1, 0.9),
+    color=(0.5, 0.5, 0.5),
+):
+    """Draw the series ``ys`` of many teams in aggregate, as the band
+    between ``quantiles`` and the median after each game.
+    """
+    if not ys:
+        return
+    padded = np.full((len(ys), max(map(len, ys))), np.nan)
+    for i, y in enumerate(ys):
+        padded[i, : len(y)] = y
+    lo, median, hi = np.nanquantile(
+        padded, [quantiles[0], 0.5, quantiles[1]], axis=0
+    )
+    xs = np.arange(x_start, x_start + padded.shape[1])
+    ax.fill_between(
+        xs, lo, hi, color=color, alpha=0.25, linewidth=0, zorder=-50
+    )
+    ax.plot(xs, median, color=color, linewidth=1, zorder=-50)
+    ax.text(
+        xs[-1] + 0.25,
+        median[-1],
+        f"{len(ys)} others",
+        ha="left",
+        va="center",
+        color=color,
+        family=fontfamily,
+        fontsize=8,
+    )
+
+
 @setup_and_handle_figure
 def plot_cumulative_points(
     data,
     ax,
     highlight="",
     highlight_color=(0.8, 1.0, 0.0),
+    xaxis="games",
+    max_lines=MAX_TEAM_LINES,
+    thresholds=None,
     **kwargs,
 ):
+    """Plot every team's cumulative points after each game, or date. If
+    ``thresholds`` are given, from :func:`compute_points_thresholds` or
+    ``True`` to load the league's saved ones, the historical points of each
+    zone's boundary position are shaded too.
+    """
     ranked_teams = data["ranked_teams"]
     cumpoints = data["cumpoints"]
     max_points = data["max_points"]
     max_games = data["max_games"]
-    games_played = data["games_played"]
-    places = data["places"]
     current_points = data["current_points"]
 
-    for team in ranked_teams:
-        speckle_plot(ax, cumpoints[team], team=team, **kwargs)
+    xs = get_xs(data, xaxis)
+    x_start = min(x[0] for x in xs.values())
+    x_end = max(x[-1] for x in xs.values())
+
+    shown, hidden = select_teams(ranked_teams, highlight, max_lines)
+    if xaxis == "games":
+        # with dates the teams' games don't line up, so just skip them
+        plot_team_band(ax, [cumpoints[team] for team in hidden])
+
+    for team in shown:
+        speckle_plot(ax, xs[team], cumpoints[team], team=team, **kwargs)
         if team == highlight:
             ax.plot(
+                xs[team],
                 cumpoints[team],
                 color=highlight_color,
                 zorder=-100,
                 linewidth=10,
             )
 
-    for team in ranked_teams:
-        legend_xloc = games_played[team] * 1.05
-        legend_yloc = max_points * places[team] / (data["num_teams"] - 1)
+    for place, team in enumerate(shown):
+        # n.b. a step of one is a game or a day
+        legend_xloc = x_start + 1.05 * (xs[team][-1] + 1 - x_start)
+        legend_yloc = max_points * place / max(len(shown) - 1, 1)
 
         # make legend labels
         ax.text(
@@ -899,7 +1731,7 @@ def plot_cumulative_points(
 
         # link legend labels to last point
         ax.plot(
-            [games_played[team] - 0.75, legend_xloc],
+            [xs[team][-1] + 0.25, legend_xloc],
             [current_points[team], legend_yloc],
             color=get_color0(team),
             linestyle="--",
@@ -908,18 +1740,36 @@ def plot_cumulative_points(
             clip_on=False,
         )
 
+    if thresholds is not None:
+        if xaxis != "games":
+            raise ValueError("Thresholds need ``xaxis='games'``.")
+        if thresholds is True:
+            thresholds = load_points_thresholds(data["league"])
+        plot_threshold_bands(
+            ax,
+            thresholds,
+            data["num_teams"],
+            league=data["league"],
+            year=data["year"],
+        )
+
     plot_spans(
         ax,
         [current_points[team] for team in ranked_teams],
-        max_games,
+        x_end + 1,
         num_teams=data["num_teams"],
         league=data["league"],
         year=data["year"],
+        x_start=x_start,
     )
 
-    set_ax_limits(ax, max_games, data["total_games"])
+    if xaxis == "date":
+        set_date_ax_limits(ax, x_start, x_end + 1)
+        ax.set_xlabel("Date")
+    else:
+        set_ax_limits(ax, max_games, data["total_games"])
+        ax.set_xlabel("Games Played")
     ax.set_ylim(-1, max_points + 1)
-    ax.set_xlabel("Games Played")
     ax.set_ylabel("Points")
 
 
@@ -941,46 +1791,239 @@ def goalsscored_after_ngames(data, team, n):
     return data["cumgoalsscored"][team][: n + 1][-1]
 
 
+def _padded(data, quantity):
+    """The cumulative ``quantity`` of every team as an array with shape
+    ``(num_teams, max_games)``, padded with each team's latest value.
+    """
+    teams = data["teams"]
+    max_games = data["max_games"]
+    x = np.empty((len(teams), max_games))
+    for i, team in enumerate(teams):
+        ys = np.asarray(data[quantity][team][:max_games])
+        x[i, : len(ys)] = ys
+        x[i, len(ys) :] = ys[-1]
+    # i.e. before any games, ignoring penalties
+    x[:, 0] = 0
+    return x
+
+
+def _rank_columns(cumpoints, cumgoaldiff, cumgoalsscored):
+    """Rank the rows of each column, with 0 the bottom. Rows are teams in
+    name order, and ties are broken by reverse name.
+    """
+    num_teams, num_columns = cumpoints.shape
+    names = np.broadcast_to(
+        -np.arange(num_teams)[:, None], (num_teams, num_columns)
+    )
+    order = np.lexsort((names, cumgoalsscored, cumgoaldiff, cumpoints), axis=0)
+    ranks = np.empty((num_teams, num_columns), dtype=int)
+    ranks[order, np.arange(num_columns)] = np.arange(num_teams)[:, None]
+    return ranks
+
+
+def compute_positions(data, start=0, positions=None):
+    """Compute the position of every team after each number of games, as an
+    array with shape ``(num_teams, max_games)``, rows ordered as
+    ``data["teams"]`` and with 0 the bottom of the table.
+
+    If ``data`` already has ``"positions"`` (e.g. a what-if scenario, see
+    :mod:`proggyleg.scenario`) those are returned. Otherwise, if only
+    columns from ``start`` onwards have changed, the rest can be copied from
+    ``positions`` rather than recomputed.
+    """
+    if "positions" in data:
+        return data["positions"]
+
+    # e.g. the scenario may have added games
+    start = 0 if positions is None else min(start, positions.shape[1])
+
+    new_positions = np.empty((data["num_teams"], data["max_games"]), int)
+    if start:
+        new_positions[:, :start] = positions[:, :start]
+    new_positions[:, start:] = _rank_columns(
+        *(
+            _padded(data, quantity)[:, start:]
+            for quantity in ("cumpoints", "cumgoaldiff", "cumgoalsscored")
+        )
+    )
+    return new_positions
+
+
+def _check_dated(data):
+    if data.get("dates") is None:
+        raise ValueError(
+            "The season has no match dates, load it with "
+            "``load_season_data`` or pass dated matches to "
+            "``compute_cumulative_quantities``."
+        )
+
+
+def table_as_of(data, date):
+    """Get the table as it stood at the end of ``date``.
+
+    Parameters
+    ----------
+    data : dict
+        The output of :func:`compute_cumulative_quantities`, with dates.
+    date : str, datetime.date or numpy.datetime64
+        The date.
+
+    Returns
+    -------
+    dict
+        With keys ``"ranked_teams"`` and ``"places"`` (as for ``data``,
+        bottom first), and ``"games"``, ``"points"``, ``"goaldiff"`` and
+        ``"goalsscored"``, each a dict mapping team to its value.
+    """
+    _check_dated(data)
+    # number of matches played by the end of the day
+    m = np.searchsorted(data["dates"], np.datetime64(date, "D"), side="right")
+    games = dict(zip(data["teams"], games_after_matches(data, m).tolist()))
+
+    table = {"games": games}
+    for key, quantity in [
+        ("points", "cumpoints"),
+        ("goaldiff", "cumgoaldiff"),
+        ("goalsscored", "cumgoalsscored"),
+    ]:
+        table[key] = {
+            team: data[quantity][team][g] for team, g in games.items()
+        }
+    ranked_teams = sorted(
+        data["teams"],
+        key=lambda team: (
+            table["points"][team],
+            table["goaldiff"][team],
+            table["goalsscored"][team],
+            team,
+        ),
+    )
+    table["ranked_teams"] = ranked_teams
+    table["places"] = {team: i for i, team in enumerate(ranked_teams)}
+    return table
+
+
+def compute_positions_by_date(data):
+    """Compute the position of every team at the end of each matchday,
+    i.e. on the calendar rather than by games played.
+
+    Returns
+    -------
+    dates : numpy.ndarray
+        The dates, starting with the day before the season.
+    positions : numpy.ndarray
+        With shape ``(num_teams, len(dates))``, rows ordered as
+        ``data["teams"]`` and with 0 the bottom of the table.
+    """
+    _check_dated(data)
+    dates = np.unique(data["dates"])
+    dates = np.concatenate([dates[:1] - 1, dates])
+    ms = np.searchsorted(data["dates"], dates, side="right")
+    # shape (num_teams, len(dates))
+    games = games_after_matches(data, ms).T
+    return dates, _rank_columns(
+        *(
+            np.take_along_axis(_padded(data, quantity), games, axis=1)
+            for quantity in ("cumpoints", "cumgoaldiff", "cumgoalsscored")
+        )
+    )
+
+
+def plot_clinched(ax, data, positions):
+    """Mark, on a position plot, the matchday each team mathematically
+    clinches each zone with a star, and for bottom zones (i.e. relegation)
+    when each team becomes safe with a ring.
+    """
+    from .clinch import CLINCHED, ELIMINATED, compute_clinch_status
+
+    result = compute_clinch_status(data)
+    colors = {
+        label: color
+        for label, _, color in get_spans(data["league"], data["year"])
+    }
+    colors["Champions"] = (0.85, 0.65, 0.0)
+
+    for z, (label, pos) in enumerate(result["zones"]):
+        status = result["status"][:, :, z]
+        events = [(CLINCHED, "*", colors[label])]
+        if pos >= 0:
+            events.append((ELIMINATED, "o", "none"))
+
+        for value, marker, facecolor in events:
+            decided = status == value
+            for i, team in enumerate(result["teams"]):
+                if not decided[:, i].any():
+                    continue
+                n = decided[:, i].argmax()
+                ax.plot(
+                    n,
+                    positions[team][n],
+                    marker=marker,
+                    markersize=10,
+                    markerfacecolor=facecolor,
+                    markeredgecolor=colors[label],
+                    markeredgewidth=1.5,
+                    zorder=10,
+                )
+
+
 @setup_and_handle_figure
 def plot_positions(
     data,
     ax,
     highlight="",
     highlight_color=(0.8, 1.0, 0.0),
+    clinched=False,
+    xaxis="games",
+    max_lines=MAX_TEAM_LINES,
     **kwargs,
 ):
+    """Plot every team's league position after each game. With more than
+    ``max_lines`` teams only the top, bottom and highlighted ones are drawn.
+    """
     teams = data["teams"]
     ranked_teams = data["ranked_teams"]
     max_games = data["max_games"]
     games_played = data["games_played"]
 
-    positions = {}
-    for n in range(max_games):
-        ranked_teams_n = sorted(
-            teams,
-            key=lambda team: (
-                -pts_after_ngames(data, team, n),
-                -goaldiff_after_ngames(data, team, n),
-                -goalsscored_after_ngames(data, team, n),
-                team,
-            ),
-            reverse=True,
+    if xaxis == "date":
+        import matplotlib.dates as mdates
+
+        if clinched:
+            raise ValueError("Clinch markers need ``xaxis='games'``.")
+        dates, positions = compute_positions_by_date(data)
+        positions = dict(zip(teams, positions))
+        x = mdates.date2num(dates)
+        xs = dict.fromkeys(teams, x)
+        # everyone's latest position is at the last date
+        x_last = dict.fromkeys(teams, x[-1])
+        x_start, x_end = x[0], x[-1] + 1
+    elif xaxis == "games":
+        positions = dict(zip(teams, compute_positions(data)))
+        xs = dict.fromkeys(teams, np.arange(max_games))
+        x_last = {team: games_played[team] - 1 for team in teams}
+        x_start, x_end = 0, max_games
+    else:
+        raise ValueError(
+            f"Unknown xaxis {xaxis}, should be 'games' or 'date'."
         )
-        for i, team in enumerate(ranked_teams_n):
-            positions.setdefault(team, []).append(i)
 
-    for team in ranked_teams:
-        speckle_plot(ax, positions[team], team=team, **kwargs)
+    shown, _ = select_teams(ranked_teams, highlight, max_lines)
+
+    for team in shown:
+        speckle_plot(ax, xs[team], positions[team], team=team, **kwargs)
         if team == highlight:
             ax.plot(
+                xs[team],
                 positions[team],
                 color=highlight_color,
                 zorder=-100,
                 linewidth=10,
             )
 
-    for team in ranked_teams:
-        legend_xloc = games_played[team] * 1.05
+    for team in shown:
+        # n.b. a step of one is a game or a day
+        legend_xloc = x_start + 1.05 * (x_last[team] + 1 - x_start)
         legend_yloc = positions[team][-1]
 
         ax.text(
@@ -997,11 +2040,11 @@ def plot_positions(
             ),
         )
 
-        xs = [games_played[team] - 0.75, legend_xloc]
-        ys = [positions[team][-1], legend_yloc]
+        xs_link = [x_last[team] + 0.25, legend_xloc]
+        ys_link = [positions[team][-1], legend_yloc]
         ax.plot(
-            xs,
-            ys,
+            xs_link,
+            ys_link,
             color=get_color0(team),
             linestyle="--",
             alpha=0.25,
@@ -1013,41 +2056,57 @@ def plot_positions(
         ax,
         # want relegation lines to appear above
         [i + 0.5 if i <= 3 else i - 0.5 for i in range(data["num_teams"])],
-        max_games,
+        x_end,
         num_teams=data["num_teams"],
         league=data["league"],
         year=data["year"],
+        x_start=x_start,
     )
 
-    ax.set_xlabel("Games Played")
-    ax.set_ylabel("Position")
+    if clinched:
+        plot_clinched(ax, data, positions)
 
-    set_ax_limits(ax, max_games, data["total_games"])
+    ax.set_ylabel("Position")
+    if xaxis == "date":
+        set_date_ax_limits(ax, x_start, x_end)
+        ax.set_xlabel("Date")
+    else:
+        set_ax_limits(ax, max_games, data["total_games"])
+        ax.set_xlabel("Games Played")
     ax.set_ylim(-0.5, data["num_teams"] - 0.5)
     ax.set_yticks([])
 
 
 @setup_and_handle_figure
 def plot_relative_performance(
-    data, ax, highlight="", highlight_color=(0.8, 1.0, 0.0), **kwargs
+    data,
+    ax,
+    highlight="",
+    highlight_color=(0.8, 1.0, 0.0),
+    max_lines=MAX_TEAM_LINES,
+    **kwargs,
 ):
-    teams = data["teams"]
     ranked_teams = data["ranked_teams"]
     cumpoints = data["cumpoints"]
     max_points = data["max_points"]
     max_games = data["max_games"]
     games_played = data["games_played"]
-    places = data["places"]
     current_points = data["current_points"]
 
-    best_pts = np.array(
+    # the most points any team had after each number of games
+    best_pts = _padded(data, "cumpoints").max(axis=0)
+
+    shown, hidden = select_teams(ranked_teams, highlight, max_lines)
+    plot_team_band(
+        ax,
         [
-            max(pts_after_ngames(data, team, n) for team in teams)
-            for n in range(max_games)
-        ]
+            cumpoints[team][1:] / best_pts[1 : games_played[team]]
+            for team in hidden
+        ],
+        x_start=1,
     )
 
-    for team in ranked_teams:
+    for team in shown:
         xs = np.arange(1, games_played[team])
         ys = cumpoints[team][1:] / best_pts[1 : games_played[team]]
         speckle_plot(ax, xs, ys, team=team, **kwargs)
@@ -1060,9 +2119,9 @@ def plot_relative_performance(
                 linewidth=10,
             )
 
-    for team in ranked_teams:
+    for place, team in enumerate(shown):
         legend_xloc = games_played[team] * 1.05
-        legend_yloc = places[team] / (data["num_teams"] - 1)
+        legend_yloc = place / max(len(shown) - 1, 1)
 
         ax.text(
             legend_xloc,
@@ -1108,23 +2167,48 @@ def plot_relative_performance(
 
 @setup_and_handle_figure
 def plot_extrapolated_performance(
-    data, ax, highlight="", highlight_color=(0.8, 1.0, 0.0), **kwargs
+    data,
+    ax,
+    highlight="",
+    highlight_color=(0.8, 1.0, 0.0),
+    max_lines=MAX_TEAM_LINES,
+    schedule_adjusted=False,
+    **kwargs,
 ):
-    ranked_teams = data["ranked_teams"]
+    """Plot every team's final points extrapolated from its points per game
+    after each game. With ``schedule_adjusted=True`` the extrapolation also
+    accounts for the difficulty of the games played and remaining, see
+    :func:`~proggyleg.difficulty.schedule_adjusted_points`.
+    """
     cumpoints = data["cumpoints"]
     games_played = data["games_played"]
     max_games = data["max_games"]
-    extrap_points = {
-        team: 3
-        * data["total_games"]
-        * cumpoints[team][1:]
-        / (3 * np.arange(1, games_played[team]))
-        for team in ranked_teams
-    }
-    ranked_teams.sort(key=lambda team: extrap_points[team][-1])
-    places = {team: i for i, team in enumerate(ranked_teams)}
+    win = max(data["rules"]["points"])
+    if schedule_adjusted:
+        from .difficulty import schedule_adjusted_points
+
+        adjusted = schedule_adjusted_points(data)
+        extrap_points = {
+            team: adjusted[i, 1 : games_played[team]]
+            for i, team in enumerate(data["teams"])
+        }
+    else:
+        extrap_points = {
+            team: win
+            * data["total_games"]
+            * cumpoints[team][1:]
+            / (win * np.arange(1, games_played[team]))
+            for team in data["ranked_teams"]
+        }
+    ranked_teams = sorted(
+        data["ranked_teams"], key=lambda team: extrap_points[team][-1]
+    )
+
+    shown, hidden = select_teams(ranked_teams, highlight, max_lines)
+    plot_team_band(ax, [extrap_points[team] for team in hidden], x_start=1)
+    places = {team: i for i, team in enumerate(shown)}
 
-    for i, team in enumerate(ranked_teams):
+    for team in shown:
         xs = np.arange(1, games_played[team])
         ys = extrap_points[team]
         speckle_plot(ax, xs, ys, team=team, **kwargs)
@@ -1137,10 +2221,10 @@ def plot_extrapolated_performance(
                 linewidth=10,
             )
 
-    for team in ranked_teams:
+    for team in shown:
         legend_xloc = games_played[team] * 1.05
         legend_yloc = (
-            3 * data["total_games"] * places[team] / (data["num_teams"] - 1)
+            win * data["total_games"] * places[team] / max(len(shown) - 1, 1)
         )
 
         ax.text(
@@ -1180,16 +2264,20 @@ def plot_extrapolated_performance(
 
     set_ax_limits(ax, max_games, data["total_games"], x_start=0.5)
     ax.set_xlabel("Games Played")
-    ax.set_ylabel("Extrapolated Points")
-    ax.set_ylim(-2, 3 * (data["total_games"] + 1))
+    ax.set_ylabel(
+        "Schedule-adjusted Extrapolated Points"
+        if schedule_adjusted
+        else "Extrapolated Points"
+    )
+    ax.set_ylim(-2, win * (data["total_games"] + 1))
 
 
 def window_form(points, window_size=5):
     return np.convolve(points, np.ones(window_size), "valid") / window_size
 
 
-def exponential_form(points, window_size=5):
-    form = [1.5]
+def exponential_form(points, window_size=5, start=1.5):
+    form = [start]
     for p in points:
         f_prev = form[-1]
         form.append(
@@ -1198,6 +2286,98 @@ def exponential_form(points, window_size=5):
     return form
 
 
+@setup_and_handle_figure
+def plot_expected_points(
+    data,
+    ax,
+    highlight="",
+    highlight_color=(0.8, 1.0, 0.0),
+    odds=None,
+    max_lines=MAX_TEAM_LINES,
+    **kwargs,
+):
+    """Plot every team's cumulative expected points (xPts), from the
+    probabilities implied by the bookmakers' odds, with the highlighted
+    team's actual points dashed for comparison. ``odds`` is an optional
+    store from :mod:`proggyleg.odds`, else the season's is loaded.
+    """
+    from .odds import compute_expected_points
+
+    cumxpts = data.get("cumxpts")
+    if cumxpts is None:
+        cumxpts = compute_expected_points(data, odds)
+
+    max_games = data["max_games"]
+    games_played = data["games_played"]
+    current_xpts = {team: xs[-1] for team, xs in cumxpts.items()}
+    max_xpts = max(current_xpts.values())
+    ranked_teams = sorted(data["teams"], key=current_xpts.__getitem__)
+
+    shown, hidden = select_teams(ranked_teams, highlight, max_lines)
+    plot_team_band(ax, [cumxpts[team] for team in hidden])
+
+    for team in shown:
+        speckle_plot(ax, cumxpts[team], team=team, **kwargs)
+        if team == highlight:
+            ax.plot(
+                cumxpts[team],
+                color=highlight_color,
+                zorder=-100,
+                linewidth=10,
+            )
+            ax.plot(
+                data["cumpoints"][team],
+                color=get_color0(team),
+                linestyle="--",
+                linewidth=1,
+            )
+
+    for place, team in enumerate(shown):
+        legend_xloc = games_played[team] * 1.05
+        legend_yloc = max_xpts * place / max(len(shown) - 1, 1)
+
+        ax.text(
+            legend_xloc,
+            legend_yloc,
+            team,
+            ha="left",
+            va="bottom",
+            weight="bold",
+            family=fontfamily,
+            color=get_color1(team),
+            backgroundcolor=(
+                highlight_color if team == highlight else get_color0(team)
+            ),
+        )
+
+        ax.plot(
+            [games_played[team] - 0.75, legend_xloc],
+            [current_xpts[team], legend_yloc],
+            color=get_color0(team),
+            linestyle="--",
+            alpha=0.25,
+            linewidth=2 / 3,
+            clip_on=False,
+        )
+
+    plot_spans(
+        ax,
+        [current_xpts[team] for team in ranked_teams],
+        max_games,
+        num_teams=data["num_teams"],
+        league=data["league"],
+        year=data["year"],
+    )
+
+    set_ax_limits(ax, max_games, data["total_games"])
+    top = max_xpts
+    if highlight in data["current_points"]:
+        top = max(top, data["current_points"][highlight])
+    ax.set_ylim(-1, top + 1)
+    ax.set_xlabel("Games Played")
+    ax.set_ylabel("Expected points")
+
+
 @setup_and_handle_figure
 def plot_form(
     data,
@@ -1205,17 +2385,38 @@ def plot_form(
     window_size=5,
     highlight="",
     highlight_color=(0.8, 1.0, 0.0),
+    max_lines=MAX_TEAM_LINES,
+    schedule_adjusted=False,
     **kwargs,
 ):
+    """Plot every team's exponentially weighted points per game. With
+    ``schedule_adjusted=True`` each game's points are weighted by the
+    strength of the opponent, see
+    :func:`~proggyleg.difficulty.schedule_adjusted_form`.
+    """
     ranked_teams = data["ranked_teams"]
     games_played = data["games_played"]
     max_games = data["max_games"]
     current_points = data["current_points"]
 
-    form = {
-        team: exponential_form(data["points"][team], window_size)
-        for team in ranked_teams
-    }
+    # everyone starts halfway between a win and a loss every game
+    win, _, loss = data["rules"]["points"]
+    max_pts = max(win, loss)
+    if schedule_adjusted:
+        from .difficulty import schedule_adjusted_form
+
+        adjusted = schedule_adjusted_form(data, window_size)
+        form = {
+            team: adjusted[i, : games_played[team]]
+            for i, team in enumerate(data["teams"])
+        }
+    else:
+        form = {
+            team: exponential_form(
+                data["points"][team], window_size, start=(win + loss) / 2
+            )
+            for team in ranked_teams
+        }
     ranked_by_form_teams = sorted(
         ranked_teams,
         key=lambda team: (
@@ -1225,7 +2426,10 @@ def plot_form(
         ),
     )
 
-    for team in ranked_by_form_teams:
+    shown, hidden = select_teams(ranked_by_form_teams, highlight, max_lines)
+    plot_team_band(ax, [form[team] for team in hidden])
+
+    for team in shown:
         ys = form[team]
         xs = np.arange(len(ys))
         speckle_plot(ax, xs, ys, team=team, **kwargs)
@@ -1238,9 +2442,9 @@ def plot_form(
                 linewidth=10,
             )
 
-    for i, team in enumerate(ranked_by_form_teams):
+    for i, team in enumerate(shown):
         legend_xloc = games_played[team] * 1.05
-        legend_yloc = 3 * i / (data["num_teams"] - 1)
+        legend_yloc = max_pts * i / max(len(shown) - 1, 1)
 
         ax.text(
             legend_xloc,
@@ -1292,7 +2496,232 @@ def plot_form(
     set_ax_limits(ax, max_games, data["total_games"], x_start=-0.5)
     ax.set_xlabel("Games Played")
     ax.set_ylabel("Average points per game")
-    ax.set_ylim(-0.1, 3.1)
+    ax.set_ylim(-0.1, max_pts + 0.1)
+
+
+def get_cumulative_stats(data, names, stats=None):
+    """Get the cumulative statistics of a season, see
+    :func:`~proggyleg.stats.compute_cumulative_stats`, from
+    ``data["cumstats"]`` if present (e.g. if loaded by
+    :func:`load_season_data` with ``with_stats=True``), else from the store
+    ``stats`` or the season's own, checking all of ``names`` were recorded.
+    """
+    from .stats import compute_cumulative_stats
+
+    cumstats = data.get("cumstats")
+    if cumstats is None:
+        cumstats = compute_cumulative_stats(data, stats)
+    missing = [name for name in names if name not in cumstats]
+    if missing:
+        raise ValueError(
+            f"No {', '.join(missing)} recorded for "
+            f"{data['league']} {data['year']}."
+        )
+    return cumstats
+
+
+def plot_team_lines(
+    data,
+    ax,
+    values,
+    x_start=0,
+    highlight="",
+    highlight_color=(0.8, 1.0, 0.0),
+    max_lines=MAX_TEAM_LINES,
+    **kwargs,
+):
+    """Plot a line per team of ``values``, mapping each team to an array
+    starting at game ``x_start``, labelled in order of the latest value.
+    """
+    # n.b. one past the end of each line, e.g. the games played
+    ends = {team: x_start + len(ys) for team, ys in values.items()}
+    current = {team: ys[-1] for team, ys in values.items()}
+    ranked_teams = sorted(data["teams"], key=lambda t: (current[t], t))
+    lo = min(np.min(ys) for ys in values.values())
+    hi = max(np.max(ys) for ys in values.values())
+
+    shown, hidden = select_teams(ranked_teams, highlight, max_lines)
+    plot_team_band(ax, [values[team] for team in hidden], x_start=x_start)
+
+    for team in shown:
+        ys = values[team]
+        xs = np.arange(x_start, x_start + len(ys))
+        speckle_plot(ax, xs, ys, team=team, **kwargs)
+        if team == highlight:
+            ax.plot(
+                xs,
+                ys,
+                color=highlight_color,
+                zorder=-100,
+                linewidth=10,
+            )
+
+    for place, team in enumerate(shown):
+        legend_xloc = ends[team] * 1.05
+        legend_yloc = lo + (hi - lo) * place / max(len(shown) - 1, 1)
+
+        ax.text(
+            legend_xloc,
+            legend_yloc,
+            team,
+            ha="left",
+            va="bottom",
+            weight="bold",
+            family=fontfamily,
+            color=get_color1(team),
+            backgroundcolor=(
+                highlight_color if team == highlight else get_color0(team)
+            ),
+        )
+
+        ax.plot(
+            [ends[team] - 0.75, legend_xloc],
+            [current[team], legend_yloc],
+            color=get_color0(team),
+            linestyle="--",
+            alpha=0.25,
+            linewidth=2 / 3,
+            clip_on=False,
+        )
+
+    set_ax_limits(
+        ax,
+        max(ends.values()),
+        data["total_games"],
+        x_start=x_start - 0.5,
+    )
+    pad = max(0.05 * (hi - lo), 0.1)
+    ax.set_ylim(lo - pad, hi + pad)
+    ax.set_xlabel("Games Played")
+
+
+@setup_and_handle_figure
+def plot_shots(data, ax, window_size=5, stats=None, **kwargs):
+    """Plot every team's shots on target minus those it faced per game,
+    averaged over the last ``window_size`` games. ``stats`` is an optional
+    store from :mod:`proggyleg.stats`, else the season's is loaded.
+    """
+    from .stats import rolling
+
+    shots = get_cumulative_stats(data, ["shots_on_target"], stats)[
+        "shots_on_target"
+    ]
+    values = {
+        team: rolling(shots["for"][team], window_size)
+        - rolling(shots["against"][team], window_size)
+        for team in data["teams"]
+    }
+    plot_team_lines(data, ax, values, x_start=1, **kwargs)
+    ax.axhline(0, color="grey", linewidth=1, zorder=-60)
+    ax.set_ylabel(f"Shots on target difference per game (last {window_size})")
+
+
+# the booking points of each yellow and red card
+BOOKING_POINTS = (10, 25)
+
+
+@setup_and_handle_figure
+def plot_discipline(data, ax, stats=None, **kwargs):
+    """Plot every team's cumulative booking points, see
+    :data:`BOOKING_POINTS`. ``stats`` is an optional store from
+    :mod:`proggyleg.stats`, else the season's is loaded.
+    """
+    cumstats = get_cumulative_stats(data, ["yellow_cards", "red_cards"], stats)
+    yellow, red = BOOKING_POINTS
+    values = {
+        team: yellow * cumstats["yellow_cards"]["for"][team]
+        + red * cumstats["red_cards"]["for"][team]
+        for team in data["teams"]
+    }
+    plot_team_lines(data, ax, values, **kwargs)
+    ax.set_ylabel(f"Booking points (yellow {yellow}, red {red})")
+
+
+@setup_and_handle_figure
+def plot_comebacks(data, ax, stats=None, **kwargs):
+    """Plot every team's cumulative points gained (or lost) after
+    half-time, relative to the half-time scores. ``stats`` is an optional
+    store from :mod:`proggyleg.stats`, else the season's is loaded.
+    """
+    cumstats = get_cumulative_stats(data, ["second_half_points"], stats)
+    values = cumstats["second_half_points"]["for"]
+    plot_team_lines(data, ax, values, **kwargs)
+    ax.axhline(0, color="grey", linewidth=1, zorder=-60)
+    ax.set_ylabel("Points gained after half-time")
+
+
+@setup_and_handle_figure
+def plot_ratings(data, ax, method="massey", **kwargs):
+    """Plot every team's Massey or Colley rating after every matchday, see
+    :func:`~proggyleg.ratings.compute_ratings`, the last point being the
+    current rating if any teams have games in hand.
+    """
+    from .ratings import compute_ratings
+
+    values = compute_ratings(data, method)
+    plot_team_lines(data, ax, values, **kwargs)
+    if method == "massey":
+        ax.axhline(0, color="grey", linewidth=1, zorder=-60)
+    ax.set_xlabel("Matchday")
+    ax.set_ylabel(f"{method.capitalize()} rating")
+
+
+@setup_and_handle_figure
+def plot_career(
+    careers,
+    ax,
+    num_points=None,
+    highlight="",
+    highlight_color=(0.8, 1.0, 0.0),
+    **kwargs,
+):
+    """Plot the careers of one or more teams across many seasons, see
+    :func:`~proggyleg.lineage.load_careers`. Each line is first downsampled
+    with :func:`lttb_indices` to ``num_points``, by default the width of the
+    axes in pixels, so that even decades of games render about as quickly
+    as a single season.
+    """
+    if num_points is None:
+        num_points = max(3, int(ax.bbox.width))
+
+    which = None
+    years = set()
+    for team, career in careers.items():
+        which = career["which"]
+        years.update(season["year"] for season in career["seasons"])
+
+        keep = lttb_indices(career["xs"], career["ys"], num_points)
+        xs, ys = career["xs"][keep], career["ys"][keep]
+        speckle_plot(ax, xs, ys, team=team, **kwargs)
+        if team == highlight:
+            ax.plot(xs, ys, color=highlight_color, zorder=-100, linewidth=10)
+
+        if len(xs):
+            ax.text(
+                xs[-1] + 0.25,
+                ys[-1],
+                team,
+                ha="left",
+                va="center",
+                weight="bold",
+                family=fontfamily,
+                color=get_color1(team),
+                backgroundcolor=(
+                    highlight_color if team == highlight else get_color0(team)
+                ),
+            )
+
+    # mark the start of every season
+    for year in sorted(years):
+        ax.axvline(year, color=(0.5, 0.5, 0.5), linestyle=":", alpha=0.25)
+
+    ax.set_xlabel("Season")
+    if which == "position":
+        # 1, the top of the pyramid, at the top
+        ax.invert_yaxis()
+        ax.set_ylabel("Position in the league pyramid")
+    else:
+        ax.set_ylabel("Career points")
 
 
 def download_file_content(url):
@@ -1303,14 +2732,50 @@ def download_file_content(url):
     return response.text
 
 
-@functools.lru_cache
-def get_footballdata(year, league="E0"):
-    return download_file_content(
+# the errors expected when downloading or parsing a season, e.g. network
+# and http errors (``requests`` errors are ``OSError``), or malformed files
+LOAD_ERRORS = (OSError, ValueError, KeyError, IndexError, csv.Error)
+
+
+def footballdata_url(year, league="E0"):
+    year = str(year)
+    return (
         "https://www.football-data.co.uk/mmz4281/"
         f"{year[-2:]}{str(int(year) + 1)[-2:]}/{league}.csv"
     )
 
 
+# how many seconds downloads of the live season are cached for
+DOWNLOAD_TTL = 600.0
+
+
+def download_epoch(year, ttl=None):
+    """The cache epoch of downloads of season ``year``. Past seasons don't
+    change, so are always in epoch 0, while the live season's epoch is the
+    number of whole ``ttl`` (by default :data:`DOWNLOAD_TTL`) seconds since
+    the unix epoch, so that every process agrees on when its cached
+    downloads expire.
+    """
+    import time
+
+    if str(year) != str(CURRENT_YEAR):
+        return 0
+    return int(time.time() // (ttl or DOWNLOAD_TTL))
+
+
+@functools.lru_cache(256)
+def _get_footballdata(year, league, epoch):
+    return download_file_content(footballdata_url(year, league))
+
+
+def get_footballdata(year, league="E0"):
+    """Download a season of football-data, cached for the current
+    :func:`download_epoch`.
+    """
+    year = str(year)
+    return _get_footballdata(year, league, download_epoch(year))
+
+
 FIXTUREDOWNLOAD_LEAGUE_ALIASES = {
     "E0": "epl",
     "E1": "championship",
@@ -1320,12 +2785,22 @@ FIXTUREDOWNLOAD_LEAGUE_ALIASES = {
 }
 
 
-@functools.lru_cache
-def get_fixturedownload(year, league="E0"):
+def fixturedownload_url(year, league="E0"):
     identifier = FIXTUREDOWNLOAD_LEAGUE_ALIASES[league]
-    return download_file_content(
-        f"https://fixturedownload.com/download/{identifier}-{year}-UTC.csv"
-    )
+    return f"https://fixturedownload.com/download/{identifier}-{year}-UTC.csv"
+
+
+@functools.lru_cache(256)
+def _get_fixturedownload(year, league, epoch):
+    return download_file_content(fixturedownload_url(year, league))
+
+
+def get_fixturedownload(year, league="E0"):
+    """Download a season of fixturedownload, cached for the current
+    :func:`download_epoch`.
+    """
+    year = str(year)
+    return _get_fixturedownload(year, league, download_epoch(year))
 
 
 PENALTIES = {
@@ -1340,18 +2815,68 @@ PENALTIES = {
 }
 
 
-def autoplot(
+def fetch_and_reconcile(year=CURRENT_YEAR, league="E0"):
+    """Download football-data and fixturedownload concurrently, and merge
+    them with :func:`reconcile_match_data`. If one of the sources fails
+    the other is used alone.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    year = str(year)
+    parsers = {
+        "footballdata": (get_footballdata, parse_footballdata_data),
+        "fixturedownload": (get_fixturedownload, parse_fixturedownload_data),
+    }
+
+    with ThreadPoolExecutor(len(parsers)) as pool:
+        futures = {
+            pool.submit(getter, year=year, league=league): name
+            for name, (getter, _) in parsers.items()
+        }
+        # parse each source as soon as it arrives
+        datas = {}
+        errors = {}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                datas[name] = parsers[name][1](
+                    future.result(), with_dates=True
+                )
+            except LOAD_ERRORS as e:
+                errors[name] = e
+
+    if not datas:
+        raise errors["footballdata"]
+    for name, e in errors.items():
+        warnings.warn(f"Failed to get {name} data, ignoring it: {e!r}")
+
+    report = reconcile_match_data(
+        datas.get("footballdata", []),
+        datas.get("fixturedownload", []),
+    )
+    if report["conflicts"]:
+        warnings.warn(
+            f"{len(report['conflicts'])} conflicting scores between "
+            f"footballdata and fixturedownload for {league} {year}, using "
+            f"footballdata: {report['conflicts'][:3]}"
+        )
+    if len(datas) == len(parsers):
+        for name, lacking in report["missing"].items():
+            if lacking:
+                warnings.warn(
+                    f"{len(lacking)} matches missing from {name} for "
+                    f"{league} {year}, using the other source: {lacking[:3]}"
+                )
+    return report
+
+
+def load_season_matches(
     year=CURRENT_YEAR,
     league="E0",
-    which="cumulative",
-    highlight=None,
     source="auto",
-    **kwargs,
+    with_dates=False,
 ):
-    # import pathlib
-
     year = str(year)
-    penalties = PENALTIES.get((year, league), None)
 
     if source == "auto":
         if (league in FIXTUREDOWNLOAD_LEAGUE_ALIASES) and (
@@ -1362,51 +2887,369 @@ def autoplot(
             source = "footballdata"
 
     if source == "choose":
-        # use whichever has more data
-        data_footballdata = parse_footballdata_data(
-            get_footballdata(year=year, league=league)
-        )
-        data_fixturedownload = parse_fixturedownload_data(
-            get_fixturedownload(year=year, league=league)
-        )
-        if len(data_footballdata) > len(data_fixturedownload):
-            data = data_footballdata
-        else:
-            data = data_fixturedownload
+        # merge both sources, so whichever is more up to date wins
+        data = fetch_and_reconcile(year=year, league=league)["matches"]
+        if not with_dates:
+            data = [match[1:] for match in data]
     elif source == "footballdata":
         data = parse_footballdata_data(
-            get_footballdata(year=year, league=league)
+            get_footballdata(year=year, league=league),
+            with_dates=with_dates,
         )
     elif source == "fixturedownload":
         data = parse_fixturedownload_data(
-            get_fixturedownload(year=year, league=league)
+            get_fixturedownload(year=year, league=league),
+            with_dates=with_dates,
+        )
+    else:
+        raise ValueError(
+            f"Unknown source {source}, should be one of "
+            "'auto', 'choose', 'footballdata', 'fixturedownload'"
         )
 
+    return data
+
+
+PLOTTERS = {
+    "cumulative": plot_cumulative_points,
+    "extrapolated": plot_extrapolated_performance,
+    "position": plot_positions,
+    "relative": plot_relative_performance,
+    "form": plot_form,
+    "xpts": plot_expected_points,
+    "shots": plot_shots,
+    "discipline": plot_discipline,
+    "comebacks": plot_comebacks,
+    "ratings": plot_ratings,
+}
+
+# the plots of match statistics, which need ``data["cumstats"]``
+STATS_PLOTTERS = ("shots", "discipline", "comebacks")
+
+
+def get_plotter(which):
+    try:
+        return PLOTTERS[which]
+    except KeyError:
+        raise ValueError(
+            f"Unknown plot type {which}, should be one of "
+            + ", ".join(f"'{w}'" for w in PLOTTERS)
+        ) from None
+
+
+def load_season_data(
+    year=CURRENT_YEAR,
+    league="E0",
+    source="auto",
+    with_stats=False,
+):
+    """Load the matches of a season and compute all the cumulative
+    quantities, including any points penalties. If ``with_stats=True``,
+    also compute the cumulative match statistics, as ``"cumstats"``, see
+    :func:`~proggyleg.stats.compute_cumulative_stats`.
+    """
+    year = str(year)
     data = compute_cumulative_quantities(
-        data,
-        penalties=penalties,
+        load_season_matches(
+            year=year, league=league, source=source, with_dates=True
+        ),
+        penalties=PENALTIES.get((year, league), None),
         league=league,
         year=year,
     )
+    if with_stats:
+        from .stats import compute_cumulative_stats
+
+        data["cumstats"] = compute_cumulative_stats(data)
+    return data
+
 
-    with mpl.style.context(NEUTRAL_STYLE):
-        height = 7 * (data["num_teams"] / 20) ** 0.5
+def autoplot(
+    year=CURRENT_YEAR,
+    league="E0",
+    which="cumulative",
+    highlight=None,
+    source="auto",
+    **kwargs,
+):
+    data = load_season_data(
+        year=year,
+        league=league,
+        source=source,
+        with_stats=which in STATS_PLOTTERS,
+    )
+
+    with style_context(NEUTRAL_STYLE):
+        # beyond this many teams only some are drawn individually
+        num_lines = min(data["num_teams"], MAX_TEAM_LINES)
+        height = 7 * (num_lines / 20) ** 0.5
         width = 12 * (data["max_games"] / data["total_games"]) ** 0.5
+        fn = get_plotter(which)
+        return fn(data, highlight=highlight, figsize=(width, height), **kwargs)
+
+
+DASHBOARD_LEAGUES = ("E0", "E1", "E2", "D1", "I1", "SP1", "SC0", "FR1")
+
+DASHBOARD_STYLE = {
+    **NEUTRAL_STYLE,
+    "font.size": 5,
+    "axes.titlesize": 8,
+    "axes.titlelocation": "left",
+    "xtick.minor.visible": False,
+    "ytick.minor.visible": False,
+}
+
+
+def iter_all_season_data(
+    years,
+    leagues=DASHBOARD_LEAGUES,
+    source="auto",
+    load=None,
+    exclude=(),
+    max_workers=8,
+):
+    """Concurrently load every season of ``leagues`` in ``years``, yielding
+    ``((league, year), data)`` pairs in order, year by year. Only
+    ``max_workers`` seasons are ever loading or waiting to be consumed at
+    once, so memory stays bounded however many there are. Seasons that
+    fail to load, with any of :data:`LOAD_ERRORS`, are skipped with a
+    warning.
+
+    Parameters
+    ----------
+    years : int, str or sequence of int or str
+        The seasons to load.
+    leagues : str or sequence of str, optional
+        The leagues to load.
+    source : str, optional
+        Where to load the seasons from, see :func:`load_season_matches`.
+    load : callable, optional
+        Called as ``load(year, league)`` to load each season, by default
+        :func:`load_season_data` from ``source``.
+    exclude : container of (str, int), optional
+        Any ``(league, year)`` seasons not to load.
+    max_workers : int, optional
+        How many seasons to load at once.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if isinstance(years, (int, str)):
+        years = (years,)
+    if isinstance(leagues, str):
+        leagues = (leagues,)
+    if load is None:
+        load = functools.partial(load_season_data, source=source)
+
+    keys = collections.deque(
+        (league, int(year))
+        for year in years
+        for league in leagues
+        if (league, int(year)) not in exclude
+    )
+    with ThreadPoolExecutor(max_workers) as pool:
+        pending = collections.deque()
+        while keys or pending:
+            while keys and (len(pending) < max_workers):
+                league, year = key = keys.popleft()
+                pending.append((key, pool.submit(load, year, league)))
+            key, future = pending.popleft()
+            try:
+                data = future.result()
+            except LOAD_ERRORS as e:
+                warnings.warn(f"Skipping {key[0]} {key[1]}: {e!r}")
+                continue
+            yield key, data
+
+
+def load_all_season_data(
+    years=CURRENT_YEAR,
+    leagues=DASHBOARD_LEAGUES,
+    source="auto",
+    load=None,
+    max_workers=8,
+):
+    """Concurrently load every season of ``leagues`` in ``years``, see
+    :func:`iter_all_season_data`, returning a dict mapping each
+    ``(league, year)`` to its data, in order.
+    """
+    return dict(
+        iter_all_season_data(
+            years, leagues, source, load=load, max_workers=max_workers
+        )
+    )
+
 
-        if which == "cumulative":
-            fn = plot_cumulative_points
-        elif which == "extrapolated":
-            fn = plot_extrapolated_performance
-        elif which == "position":
-            fn = plot_positions
-        elif which == "relative":
-            fn = plot_relative_performance
-        elif which == "form":
-            fn = plot_form
+def plot_dashboard(
+    year=CURRENT_YEAR,
+    leagues=DASHBOARD_LEAGUES,
+    which=("cumulative", "position", "form"),
+    highlight=None,
+    source="auto",
+    panel_size=(6, 3),
+    show_and_close=True,
+    **kwargs,
+):
+    """Plot a grid of small multiples, with a row for each league and a
+    column for each plot type in ``which``, all in a single figure.
+
+    Parameters
+    ----------
+    year : int or str, optional
+        The season to plot.
+    leagues : sequence of str, optional
+        The leagues to plot, these are loaded concurrently.
+    which : str or sequence of str, optional
+        The plot types, see :func:`autoplot`.
+    highlight : str, optional
+        A team to highlight, in whichever league it plays.
+    source : str, optional
+        Where to get the data from, see :func:`load_season_matches`.
+    panel_size : tuple[float, float], optional
+        The size of each panel in inches.
+    show_and_close : bool, optional
+        Whether to show and close the figure.
+    kwargs
+        Supplied to every plotting function.
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+    axs : numpy.ndarray
+        The axes, with shape ``(len(leagues), len(which))``.
+    """
+    if isinstance(which, str):
+        which = (which,)
+    fns = [get_plotter(w) for w in which]
+    load = functools.partial(
+        load_season_data,
+        source=source,
+        with_stats=any(w in STATS_PLOTTERS for w in which),
+    )
+    datas = {
+        league: data
+        for (league, _), data in load_all_season_data(
+            year, leagues, load=load
+        ).items()
+    }
+    kwargs.setdefault("markersize", 3)
+    kwargs.setdefault("linewidth", 1.5)
+
+    with style_context(DASHBOARD_STYLE):
+        width = panel_size[0] * len(fns)
+        height = panel_size[1] * len(datas)
+        if show_and_close:
+            fig = plt.figure(figsize=(width, height))
         else:
-            raise ValueError(
-                f"Unknown plot type {which}, should be one of "
-                "'cumulative', 'extrapolated', 'position', 'relative', 'form'"
+            fig = new_figure(figsize=(width, height))
+        # fixed margins (in inches) leaving room for the zone and team labels
+        # either side of each panel, since a layout engine would need to
+        # measure every text artist
+        axs = fig.subplots(
+            len(datas),
+            len(fns),
+            squeeze=False,
+            gridspec_kw={
+                "left": 1.0 / width,
+                "right": 1 - 1.2 / width,
+                "bottom": 0.4 / height,
+                "top": 1 - 0.3 / height,
+                "wspace": 2.2 / (panel_size[0] - 2.2),
+                "hspace": 0.7 / (panel_size[1] - 0.7),
+            },
+        )
+        for row, (league, data) in zip(axs, datas.items()):
+            for ax, fn in zip(row, fns):
+                fn(data, ax=ax, highlight=highlight, **kwargs)
+            row[0].set_title(
+                f"{LEAGUE_NAMES.get(league, league)} "
+                f"{data['year']} / {data['year'] + 1}"
             )
 
-        return fn(data, highlight=highlight, figsize=(width, height), **kwargs)
+        if show_and_close:
+            plt.show()
+            plt.close(fig)
+
+    return fig, axs
+
+
+def render_autoplot(
+    year=CURRENT_YEAR,
+    league="E0",
+    which="cumulative",
+    highlight=None,
+    format="svg",
+    compact=True,
+    **kwargs,
+):
+    """Render an :func:`autoplot` figure to bytes in ``format``, without
+    pyplot, so this is safe to call from many threads at once. The data of
+    the live season is downloaded at most once per :func:`download_epoch`.
+    SVG output is passed through :func:`~proggyleg.svg.compact_svg` unless
+    ``compact=False``.
+    """
+    fig, _ = autoplot(
+        year,
+        league,
+        which=which,
+        highlight=highlight,
+        show_and_close=False,
+        **kwargs,
+    )
+    body = render_figure(fig, format=format)
+
+    if compact and format == "svg":
+        from .svg import compact_svg
+
+        return compact_svg(body).encode("utf-8")
+    return body
+
+
+def render_autoplots(
+    seasons,
+    which="cumulative",
+    format="png",
+    max_workers=None,
+    **kwargs,
+):
+    """Render many :func:`autoplot` figures concurrently with a thread pool.
+
+    Parameters
+    ----------
+    seasons : sequence of (int or str, str)
+        The ``(year, league)`` of each figure.
+    which : str, optional
+        The plot type, see :func:`autoplot`.
+    format : str, optional
+        The output format.
+    max_workers : int, optional
+        The number of threads.
+    kwargs
+        Supplied to :func:`render_autoplot`.
+
+    Returns
+    -------
+    dict
+        Mapping each ``(year, league)`` to the rendered bytes. Any that fail
+        are skipped with a warning.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        futures = {
+            (year, league): pool.submit(
+                render_autoplot,
+                year,
+                league,
+                which=which,
+                format=format,
+                **kwargs,
+            )
+            for year, league in seasons
+        }
+        rendered = {}
+        for key, future in futures.items():
+            try:
+                rendered[key] = future.result()
+            except LOAD_ERRORS as e:
+                warnings.warn(f"Failed to render {key}: {e!r}")
+    return rendered
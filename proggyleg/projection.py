@@ -0,0 +1,382 @@
+"""Probabilistic projections of the final table from the remaining fixtures
+and per-fixture outcome probabilities.
+
+The distribution of each team's final points is always computed exactly, by
+convolving the points it can win in each of its remaining fixtures. Final
+positions depend on the joint outcome, but teams only interact through the
+fixtures that connect them, so the fixtures split into independent groups
+(in the last round, every fixture is its own group). Each group's outcomes
+are enumerated, and for any points total the distribution of how many of
+its teams finish below and level with that total is a small 2D table.
+Convolving these tables over the groups gives exact position probabilities,
+as long as no group is too large to enumerate, otherwise outcomes are
+sampled instead. Ties on points are shared evenly between the tied places,
+since goal difference isn't modelled.
+"""
+
+import numpy as np
+
+
+def outcome_points(rules):
+    """The points of the home team and of the away team, for a home win,
+    draw and away win, under the competition ``rules``.
+    """
+    win, draw, loss = rules["points"]
+    if any(p != int(p) for p in (win, draw, loss)):
+        raise ValueError("Projections need whole numbers of points.")
+    home_points = np.array([win, draw, loss], dtype=int)
+    return home_points, home_points[::-1].copy()
+
+
+def remaining_fixtures(data):
+    """Get the ``(home, away)`` fixtures still to be played in a round
+    robin, with home advantage alternating. In leagues that split, the games
+    after the split are only included once it has happened.
+    """
+    teams = data["teams"]
+    n = len(teams)
+    rules = data["rules"]
+    if rules["format"] != "round_robin":
+        raise ValueError("Future pairings are only known for round robins.")
+
+    hosted = {}
+    for home, away, *_ in data["matches"]:
+        hosted[home, away] = hosted.get((home, away), 0) + 1
+
+    rounds = np.full((n, n), rules["cycles"])
+    if rules["split"]:
+        games = data["games_played"]
+        if min(games.values()) - 1 >= rules["cycles"] * (n - 1):
+            ranked = data["ranked_teams"]
+            for half in (ranked[: n // 2], ranked[n // 2 :]):
+                idx = np.array([teams.index(team) for team in half])
+                rounds[np.ix_(idx, idx)] += rules["split"]
+
+    fixtures = []
+    for i, a in enumerate(teams):
+        for j, b in enumerate(teams[i + 1 :], i + 1):
+            ab, ba = hosted.get((a, b), 0), hosted.get((b, a), 0)
+            for _ in range(rounds[i, j] - ab - ba):
+                if ab <= ba:
+                    fixtures.append((a, b))
+                    ab += 1
+                else:
+                    fixtures.append((b, a))
+                    ba += 1
+    return fixtures
+
+
+def fixture_probabilities(data, fixtures, draw_rate=None):
+    """A simple default model of the ``(home win, draw, away win)``
+    probabilities of each fixture: draws happen at the league's rate so
+    far, and otherwise each team wins in proportion to its points per game.
+
+    Returns
+    -------
+    numpy.ndarray
+        With shape ``(len(fixtures), 3)``.
+    """
+    matches = data["matches"]
+    if draw_rate is None:
+        draws = sum(hg == ag for _, _, hg, ag in matches)
+        draw_rate = (draws + 1) / (len(matches) + 4)
+
+    # points per game, with one extra average (1.5 point) game so that it
+    # is sensible early in the season, n.b. from the points won, since any
+    # penalties could make the rate zero or negative
+    rate = {
+        team: (max(sum(data["points"][team]), 0) + 1.5)
+        / data["games_played"][team]
+        for team in data["teams"]
+    }
+    probs = np.empty((len(fixtures), 3))
+    for f, (home, away) in enumerate(fixtures):
+        p_home = rate[home] / (rate[home] + rate[away])
+        probs[f] = (
+            (1 - draw_rate) * p_home,
+            draw_rate,
+            (1 - draw_rate) * (1 - p_home),
+        )
+    return probs
+
+
+def _incidence(teams, fixtures):
+    index = {team: i for i, team in enumerate(teams)}
+    homes = np.array([index[h] for h, _ in fixtures], dtype=int)
+    aways = np.array([index[a] for _, a in fixtures], dtype=int)
+    return homes, aways
+
+
+def final_points_distribution(data, fixtures=None, probabilities=None):
+    """Compute the exact distribution of every team's final points.
+
+    Returns
+    -------
+    points : numpy.ndarray
+        The possible final points totals, from lowest to highest.
+    pmf : numpy.ndarray
+        With shape ``(num_teams, len(points))``, the probability of each
+        team (ordered as ``data["teams"]``) finishing with each total.
+    """
+    if fixtures is None:
+        fixtures = remaining_fixtures(data)
+    if probabilities is None:
+        probabilities = fixture_probabilities(data, fixtures)
+    probabilities = np.asarray(probabilities, dtype=float)
+
+    teams = data["teams"]
+    base = np.array([data["current_points"][t] for t in teams], dtype=int)
+    homes, aways = _incidence(teams, fixtures)
+
+    home_points, away_points = outcome_points(data["rules"])
+
+    # each team's points from its remaining games, by direct convolution
+    gained = [np.ones(1) for _ in teams]
+    for f in range(len(fixtures)):
+        for t, pts in ((homes[f], home_points), (aways[f], away_points)):
+            step = np.zeros(pts.max() + 1)
+            np.add.at(step, pts, probabilities[f])
+            gained[t] = np.convolve(gained[t], step)
+
+    lo = base.min()
+    hi = max(b + len(g) - 1 for b, g in zip(base, gained))
+    pmf = np.zeros((len(teams), hi - lo + 1))
+    for t, g in enumerate(gained):
+        pmf[t, base[t] - lo : base[t] - lo + len(g)] = g
+    return np.arange(lo, hi + 1), pmf
+
+
+def _position_probabilities(finals, weights):
+    """Given final points ``finals``, shape ``(num_outcomes, num_teams)``,
+    with probability ``weights``, compute the probability of each team
+    finishing in each position, with 0 the bottom and ties shared evenly.
+    """
+    num_outcomes, n = finals.shape
+    # each team spreads its weight evenly over [below, below + level),
+    # accumulated as differences then summed along the positions
+    diffs = np.zeros((n, n + 1))
+    # process in chunks to bound the size of the pairwise comparison
+    chunk = max(1, 2**22 // (n * n))
+    for start in range(0, num_outcomes, chunk):
+        pts = finals[start : start + chunk]
+        w = weights[start : start + chunk, None]
+        below = (pts[:, None, :] < pts[:, :, None]).sum(axis=2)
+        level = (pts[:, None, :] == pts[:, :, None]).sum(axis=2)
+        share = np.broadcast_to(w / level, below.shape)
+        teams = np.broadcast_to(np.arange(n), below.shape)
+        np.add.at(diffs, (teams, below), share)
+        np.add.at(diffs, (teams, below + level), -share)
+    return np.cumsum(diffs, axis=1)[:, :n]
+
+
+def _fixture_groups(n, homes, aways):
+    """Split the teams into groups connected by fixtures, returning a list
+    of ``(teams, fixtures)`` index arrays.
+    """
+    parent = list(range(n))
+
+    def find(t):
+        while parent[t] != t:
+            parent[t] = parent[parent[t]]
+            t = parent[t]
+        return t
+
+    for h, a in zip(homes, aways):
+        parent[find(h)] = find(a)
+
+    roots = [find(t) for t in range(n)]
+    groups = []
+    for root in sorted(set(roots)):
+        teams = np.array([t for t in range(n) if roots[t] == root])
+        fixtures = np.flatnonzero(np.isin(homes, teams))
+        groups.append((teams, fixtures))
+    return groups
+
+
+def _enumerate_outcomes(base, homes, aways, probabilities, fixtures, points):
+    """Every combination of outcomes of ``fixtures``, returning the final
+    points of every team in each, and the probability of each.
+    """
+    home_points, away_points = points
+    num_fixtures = len(fixtures)
+    # as indices into home_points and away_points
+    outcomes = np.indices((3,) * num_fixtures)
+    outcomes = outcomes.reshape(num_fixtures, 3**num_fixtures).T
+    weights = np.prod(probabilities[fixtures, outcomes], axis=1)
+    finals = np.tile(base, (len(outcomes), 1))
+    for f, fixture in enumerate(fixtures):
+        finals[:, homes[fixture]] += home_points[outcomes[:, f]]
+        finals[:, aways[fixture]] += away_points[outcomes[:, f]]
+    return finals, weights
+
+
+def _exact_position_probabilities(
+    base, homes, aways, probabilities, groups, points
+):
+    n = len(base)
+    # the (below, level) counts are packed as ``below * stride + level``,
+    # so that 2D convolution is just 1D convolution, level never overflows
+    stride = n + 1
+
+    outcomes = []
+    for teams, fixtures in groups:
+        finals, weights = _enumerate_outcomes(
+            base, homes, aways, probabilities, fixtures, points
+        )
+        outcomes.append((finals[:, teams], weights))
+
+    counts_cache = {}
+
+    def counts(g, v):
+        # distribution of how many teams of group g finish below/level v
+        if (g, v) not in counts_cache:
+            finals, weights = outcomes[g]
+            below = (finals < v).sum(axis=1)
+            level = (finals == v).sum(axis=1)
+            counts_cache[g, v] = np.bincount(
+                below * stride + level, weights=weights
+            )
+        return counts_cache[g, v]
+
+    diffs = np.zeros((n, n + 1))
+    for g, (teams, _) in enumerate(groups):
+        finals, weights = outcomes[g]
+        for i, x in enumerate(teams):
+            others = np.delete(finals, i, axis=1)
+            v = finals[:, i]
+            below = (others < v[:, None]).sum(axis=1)
+            level = (others == v[:, None]).sum(axis=1)
+            for value in np.unique(v):
+                # the rest of the league, independent of this group
+                rest = np.ones(1)
+                for h in range(len(groups)):
+                    if h != g:
+                        rest = np.convolve(rest, counts(h, value))
+                packed = np.flatnonzero(rest)
+                rest_below, rest_level = np.divmod(packed, stride)
+
+                sel = v == value
+                tot_below = below[sel, None] + rest_below[None, :]
+                tot_level = 1 + level[sel, None] + rest_level[None, :]
+                share = (
+                    weights[sel, None] * rest[None, packed] / tot_level
+                ).ravel()
+                np.add.at(diffs[x], tot_below.ravel(), share)
+                np.add.at(diffs[x], (tot_below + tot_level).ravel(), -share)
+
+    return np.cumsum(diffs, axis=1)[:, :n]
+
+
+def project_season(
+    data,
+    fixtures=None,
+    probabilities=None,
+    method="auto",
+    max_outcomes=3**11,
+    num_samples=20_000,
+    seed=None,
+):
+    """Project the final table of a season.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    fixtures : sequence of (str, str), optional
+        The remaining ``(home, away)`` fixtures, by default from
+        :func:`remaining_fixtures`.
+    probabilities : array_like, optional
+        The ``(home win, draw, away win)`` probabilities of each fixture,
+        shape ``(len(fixtures), 3)``, by default from
+        :func:`fixture_probabilities`.
+    method : {"auto", "exact", "sample"}, optional
+        Whether to enumerate every outcome of the remaining fixtures, or
+        sample them. ``"auto"`` is exact when no independent group of
+        fixtures has more than ``max_outcomes`` outcomes.
+    max_outcomes : int, optional
+        The most outcomes of any one group of fixtures to enumerate with
+        ``method="auto"``.
+    num_samples : int, optional
+        The number of samples, if sampling.
+    seed : int, optional
+        The random seed, if sampling.
+
+    Returns
+    -------
+    dict
+        With keys:
+
+        - ``"teams"``: the teams, ordered as ``data["teams"]``.
+        - ``"points"``, ``"points_pmf"``: the exact final points
+          distributions, see :func:`final_points_distribution`.
+        - ``"expected_points"``: the mean final points of each team.
+        - ``"positions"``: shape ``(num_teams, num_teams)``, the probability
+          of each team finishing in each position, with 0 the bottom as in
+          ``data["places"]``.
+        - ``"zones"``: a dict mapping each zone label of
+          :func:`~proggyleg.clinch.get_zones` to the probability of each team
+          finishing in it.
+        - ``"method"``: ``"exact"`` or ``"sample"``.
+    """
+    from .clinch import get_zones
+
+    if fixtures is None:
+        fixtures = remaining_fixtures(data)
+    if probabilities is None:
+        probabilities = fixture_probabilities(data, fixtures)
+    probabilities = np.asarray(probabilities, dtype=float)
+
+    teams = data["teams"]
+    n = len(teams)
+    base = np.array([data["current_points"][t] for t in teams], dtype=int)
+    homes, aways = _incidence(teams, fixtures)
+    num_fixtures = len(fixtures)
+
+    points = outcome_points(data["rules"])
+    home_points, away_points = points
+
+    groups = _fixture_groups(n, homes, aways)
+    if method == "auto":
+        largest = max(len(fixtures) for _, fixtures in groups)
+        method = "exact" if 3**largest <= max_outcomes else "sample"
+
+    if method == "exact":
+        positions = _exact_position_probabilities(
+            base, homes, aways, probabilities, groups, points
+        )
+    elif method == "sample":
+        rng = np.random.default_rng(seed)
+        cumulative = np.cumsum(probabilities, axis=1)
+        u = rng.random((num_samples, num_fixtures, 1))
+        # as indices into home_points and away_points
+        outcomes = (u > cumulative[None, :, :2]).sum(axis=2)
+        finals = np.tile(base, (num_samples, 1))
+        for f in range(num_fixtures):
+            finals[:, homes[f]] += home_points[outcomes[:, f]]
+            finals[:, aways[f]] += away_points[outcomes[:, f]]
+        positions = _position_probabilities(
+            finals, np.full(num_samples, 1 / num_samples)
+        )
+    else:
+        raise ValueError(
+            f"Unknown method {method}, should be 'auto', 'exact' or 'sample'."
+        )
+
+    zones = {}
+    for label, pos in get_zones(data["league"], data["year"]):
+        if pos < 0:
+            zones[label] = positions[:, n + pos :].sum(axis=1)
+        else:
+            zones[label] = positions[:, : pos + 1].sum(axis=1)
+
+    points, pmf = final_points_distribution(data, fixtures, probabilities)
+    return {
+        "teams": teams,
+        "points": points,
+        "points_pmf": pmf,
+        "expected_points": pmf @ points,
+        "positions": positions,
+        "zones": zones,
+        "method": method,
+    }
@@ -0,0 +1,291 @@
+"""Tables of any subset of matches, e.g. home games only, the last 10 games,
+results among the top six, or since a given date, for one season or a
+whole archive of them::
+
+    query = load_match_query(range(2000, 2025))
+    query.table(query.venue("home") & query.last(10))
+    query.table(query.among_top(6) & query.season("E0", 2024))
+
+Every team's matches in every season are flattened into one set of columns,
+one entry per team per match, so that a query is a boolean mask over the
+entries. Masks compose with the usual ``&``, ``|`` and ``~``, and a table
+is a few masked reductions (``bincount``) over team-seasons, followed by a
+single sort that ranks every season at once. Tables are cached per mask.
+Points penalties aren't applied, since they don't belong to any match.
+"""
+
+import collections
+
+import numpy as np
+
+TABLE_COLUMNS = (
+    "league",
+    "year",
+    "position",
+    "team",
+    "played",
+    "won",
+    "drawn",
+    "lost",
+    "goals_for",
+    "goals_against",
+    "goal_difference",
+    "points",
+)
+
+
+class MatchQuery:
+    """A query engine over the matches of one or more seasons.
+
+    Parameters
+    ----------
+    seasons : sequence of dict
+        Each the output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    max_cached : int, optional
+        How many tables to cache, least recently used first out.
+    """
+
+    def __init__(self, seasons, max_cached=128):
+        self.seasons = []
+        # per team-season
+        teams, group_season, group_position, group_games = [], [], [], []
+        # per entry, i.e. team and match
+        columns = collections.defaultdict(list)
+
+        for data in seasons:
+            s = len(self.seasons)
+            self.seasons.append((data["league"], int(data["year"])))
+            n = data["num_teams"]
+            offset = len(teams)
+
+            index = {team: i for i, team in enumerate(data["teams"])}
+            matches = data["matches"]
+            home = np.array([index[m[0]] for m in matches], dtype=int)
+            away = np.array([index[m[1]] for m in matches], dtype=int)
+            goals = np.array([m[2:4] for m in matches], dtype=int)
+            goals = goals.reshape(-1, 2)
+
+            team_ptr, team_matches = data["team_ptr"], data["team_matches"]
+            owner = np.repeat(np.arange(n), np.diff(team_ptr))
+            sides = (home[team_matches] != owner).astype(int)
+            opponent = np.where(
+                sides == 0, away[team_matches], home[team_matches]
+            )
+
+            columns["group"].append(offset + owner)
+            columns["opponent"].append(offset + opponent)
+            columns["away"].append(sides.astype(bool))
+            columns["game"].append(
+                np.arange(len(team_matches)) - team_ptr[owner] + 1
+            )
+            columns["goals_for"].append(goals[team_matches, sides])
+            columns["goals_against"].append(goals[team_matches, 1 - sides])
+            columns["points"].append(
+                np.concatenate(
+                    [[]] + [data["points"][team] for team in data["teams"]]
+                )
+            )
+            if data["dates"] is None:
+                dates = np.full(len(team_matches), "NaT", "datetime64[D]")
+            else:
+                dates = data["dates"][team_matches]
+            columns["date"].append(dates.astype("datetime64[D]"))
+
+            teams.extend(data["teams"])
+            group_season.extend([s] * n)
+            group_position.extend(
+                n - data["places"][team] for team in data["teams"]
+            )
+            group_games.extend(np.diff(team_ptr))
+
+        self.group_teams = teams
+        self.group_season = np.array(group_season, dtype=int)
+        # e.g. for among_top, the position in the full table, 1 the top
+        self.group_position = np.array(group_position, dtype=int)
+        self.group_games = np.array(group_games, dtype=int)
+        # for breaking ties, as the full table does, by reverse name
+        _, self.group_name_rank = np.unique(teams, return_inverse=True)
+
+        def concatenate(key, dtype):
+            return np.concatenate([[]] + columns[key]).astype(dtype)
+
+        self.group = concatenate("group", int)
+        self.opponent = concatenate("opponent", int)
+        self.away = concatenate("away", bool)
+        self.game = concatenate("game", int)
+        self.goals_for = concatenate("goals_for", int)
+        self.goals_against = concatenate("goals_against", int)
+        self.points = concatenate("points", int)
+        self.date = np.concatenate(
+            [np.array([], "datetime64[D]")] + columns["date"]
+        )
+
+        self.max_cached = max_cached
+        self._cache = collections.OrderedDict()
+
+    def __len__(self):
+        """The number of entries, i.e. every team's matches."""
+        return len(self.group)
+
+    def all(self):
+        """Every game."""
+        return np.ones(len(self), dtype=bool)
+
+    def venue(self, venue):
+        """Only ``"home"`` or ``"away"`` games."""
+        if venue not in ("home", "away"):
+            raise ValueError(
+                f"Unknown venue {venue}, should be 'home' or 'away'."
+            )
+        return self.away if venue == "away" else ~self.away
+
+    def between(self, start=None, end=None):
+        """Only games on or after ``start`` and before ``end`` (dates or
+        ``"YYYY-MM-DD"`` strings), undated games never match.
+        """
+        mask = ~np.isnat(self.date)
+        if start is not None:
+            mask &= self.date >= np.datetime64(start, "D")
+        if end is not None:
+            mask &= self.date < np.datetime64(end, "D")
+        return mask
+
+    def rounds(self, start=1, stop=None):
+        """Only each team's games ``start`` to ``stop``, inclusive, counting
+        from 1.
+        """
+        mask = self.game >= start
+        if stop is not None:
+            mask &= self.game <= stop
+        return mask
+
+    def last(self, num_games):
+        """Only each team's last ``num_games`` games so far."""
+        return self.game > self.group_games[self.group] - num_games
+
+    def _in_teams(self, groups, teams):
+        names = np.array(self.group_teams, dtype=object)
+        return np.isin(names[groups], list(teams))
+
+    def teams(self, teams):
+        """Only the games of ``teams``."""
+        return self._in_teams(self.group, teams)
+
+    def against(self, teams):
+        """Only games against ``teams``."""
+        return self._in_teams(self.opponent, teams)
+
+    def among(self, teams):
+        """Only games between ``teams``, i.e. their mini-league."""
+        return self.teams(teams) & self.against(teams)
+
+    def among_top(self, k):
+        """Only games between the top ``k`` teams of each season's table
+        (as it stands).
+        """
+        top = self.group_position <= k
+        return top[self.group] & top[self.opponent]
+
+    def season(self, league, year):
+        """Only the games of one season."""
+        s = self.seasons.index((league, int(year)))
+        return self.group_season[self.group] == s
+
+    def table(self, mask=None):
+        """The table of the games in ``mask`` (by default all), for every
+        season, of the teams with any such games.
+
+        Returns
+        -------
+        dict
+            Mapping each of :data:`TABLE_COLUMNS` to an array with an entry
+            per team-season, ordered by season then position, 1 the top.
+            Ties are broken by goal difference, goals scored, then reverse
+            name, as in the full table. The arrays are shared with the
+            cache, so are read-only, copy them to modify them.
+        """
+        if mask is None:
+            mask = self.all()
+        mask = np.asarray(mask, dtype=bool)
+        key = np.packbits(mask).tobytes() + len(mask).to_bytes(8, "little")
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return dict(self._cache[key])
+
+        num_groups = len(self.group_teams)
+        group = self.group[mask]
+        goals_for = self.goals_for[mask]
+        goals_against = self.goals_against[mask]
+
+        def total(weights=None, where=None):
+            g = group if where is None else group[where]
+            w = None
+            if weights is not None:
+                w = weights if where is None else weights[where]
+            return np.bincount(g, w, minlength=num_groups).astype(int)
+
+        played = total()
+        columns = {
+            "played": played,
+            "won": total(where=goals_for > goals_against),
+            "drawn": total(where=goals_for == goals_against),
+            "lost": total(where=goals_for < goals_against),
+            "goals_for": total(goals_for),
+            "goals_against": total(goals_against),
+            "points": total(self.points[mask]),
+        }
+        columns["goal_difference"] = (
+            columns["goals_for"] - columns["goals_against"]
+        )
+
+        # rank every season at once, only of the teams with any games
+        (groups,) = np.nonzero(played)
+        order = np.lexsort(
+            (
+                -self.group_name_rank[groups],
+                -columns["goals_for"][groups],
+                -columns["goal_difference"][groups],
+                -columns["points"][groups],
+                self.group_season[groups],
+            )
+        )
+        groups = groups[order]
+        seasons = self.group_season[groups]
+        first = np.searchsorted(seasons, seasons)
+
+        table = {
+            "league": np.array(
+                [self.seasons[s][0] for s in seasons], dtype=object
+            ),
+            "year": np.array([self.seasons[s][1] for s in seasons], dtype=int),
+            "position": np.arange(len(groups)) - first + 1,
+            "team": np.array(self.group_teams, dtype=object)[groups],
+            **{name: values[groups] for name, values in columns.items()},
+        }
+        table = {name: table[name] for name in TABLE_COLUMNS}
+        for values in table.values():
+            values.flags.writeable = False
+
+        self._cache[key] = table
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return dict(table)
+
+
+def load_match_query(
+    years,
+    leagues=("E0",),
+    source="auto",
+    max_workers=8,
+):
+    """Load every season of ``leagues`` in ``years``, in parallel, into a
+    :class:`MatchQuery`. Seasons that fail to load are skipped with a
+    warning.
+    """
+    from .proggyleg import load_all_season_data
+
+    seasons = load_all_season_data(
+        years, leagues, source, max_workers=max_workers
+    )
+    return MatchQuery(list(seasons.values()))
@@ -0,0 +1,163 @@
+"""Schedule-aware Massey and Colley ratings of every team after every
+matchday, e.g. for the ``"ratings"`` plot.
+
+Both are linear systems over the graph of results, where each match
+between teams ``i`` and ``j`` adds ``u u^T``, with ``u = e_i - e_j``, to
+the system's matrix (the graph Laplacian):
+
+- Colley ratings solve ``(2 I + L) r = 1 + (wins - losses) / 2``. The
+  matrix starts as ``2 I`` and every match is a rank-1 update, so its
+  inverse is kept up to date match by match with the Sherman-Morrison
+  formula, and the ratings after each matchday are one matrix-vector
+  product.
+- Massey ratings solve ``(L + 1 1^T) r = p``, with ``p`` every team's goal
+  difference, pinning the mean rating to zero. The Laplacian is applied
+  sparsely, straight from the match arrays, and each matchday is solved
+  by conjugate gradients warm-started from the previous matchday's
+  ratings, which are already close, so only a few iterations are needed.
+"""
+
+import functools
+
+import numpy as np
+
+
+def _match_arrays(data):
+    """The home and away team indices, and goals, of every match."""
+    index = {team: i for i, team in enumerate(data["teams"])}
+    matches = data["matches"]
+    home = np.array([index[m[0]] for m in matches], dtype=int)
+    away = np.array([index[m[1]] for m in matches], dtype=int)
+    goals = np.array([m[2:4] for m in matches], dtype=int).reshape(-1, 2)
+    return home, away, goals
+
+
+def _ends(data, ends):
+    from .proggyleg import matchday_ends
+
+    if ends is None:
+        ends = matchday_ends(data)
+    # n.b. the current ratings, after every match so far, come last
+    return np.append(ends, len(data["matches"]))
+
+
+def colley_ratings(data, ends=None):
+    """Colley ratings after each number of matches ``ends``, by default
+    after every matchday, see
+    :func:`~proggyleg.proggyleg.matchday_ends`, then after every match.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape ``(num_teams, len(ends) + 2)``, the ratings before any
+        matches, after each of ``ends``, and currently.
+    """
+    n = data["num_teams"]
+    home, away, goals = _match_arrays(data)
+    result = np.sign(goals[:, 0] - goals[:, 1])
+
+    inverse = np.eye(n) / 2
+    b = np.ones(n)
+    ratings = [inverse @ b]
+    start = 0
+    for end in _ends(data, ends):
+        for m in range(start, end):
+            i, j = home[m], away[m]
+            # Sherman-Morrison, for the update u u^T with u = e_i - e_j
+            v = inverse[:, i] - inverse[:, j]
+            inverse -= np.outer(v, v) / (1 + v[i] - v[j])
+            b[i] += result[m] / 2
+            b[j] -= result[m] / 2
+        start = end
+        ratings.append(inverse @ b)
+    return np.array(ratings).T
+
+
+def _conjugate_gradient(matvec, b, x, tol=1e-10, max_iter=None):
+    """Solve the symmetric positive semi-definite (and consistent) system
+    ``matvec(x) = b`` from the initial guess ``x``, returning the solution
+    and the number of iterations taken.
+    """
+    max_iter = max_iter or 10 * len(b)
+    r = b - matvec(x)
+    p = r.copy()
+    rr = r @ r
+    threshold = (tol * max(np.linalg.norm(b), 1.0)) ** 2
+    for iteration in range(max_iter):
+        if rr <= threshold:
+            return x, iteration
+        Ap = matvec(p)
+        alpha = rr / (p @ Ap)
+        x = x + alpha * p
+        r = r - alpha * Ap
+        rr, rr_old = r @ r, rr
+        p = r + (rr / rr_old) * p
+    return x, max_iter
+
+
+def _massey_matvec(x, home, away, n):
+    # the Laplacian, straight from the match arrays, plus 1 1^T
+    e = x[home] - x[away]
+    return np.bincount(home, e, n) - np.bincount(away, e, n) + x.sum()
+
+
+def massey_ratings(data, ends=None, tol=1e-10, return_iterations=False):
+    """Massey ratings after each number of matches ``ends``, see
+    :func:`colley_ratings`, each solved by conjugate gradients warm-started
+    from the last. With ``return_iterations=True`` also return the number
+    of iterations each took.
+    """
+    n = data["num_teams"]
+    home, away, goals = _match_arrays(data)
+    margin = (goals[:, 0] - goals[:, 1]).astype(float)
+
+    x = np.zeros(n)
+    ratings = [x]
+    iterations = []
+    for end in _ends(data, ends):
+        h, a = home[:end], away[:end]
+        p = np.bincount(h, margin[:end], n) - np.bincount(a, margin[:end], n)
+        matvec = functools.partial(_massey_matvec, home=h, away=a, n=n)
+        x, its = _conjugate_gradient(matvec, p, x, tol)
+        ratings.append(x)
+        iterations.append(its)
+
+    ratings = np.array(ratings).T
+    if return_iterations:
+        return ratings, np.array(iterations)
+    return ratings
+
+
+RATINGS = {
+    "massey": massey_ratings,
+    "colley": colley_ratings,
+}
+
+
+def compute_ratings(data, method="massey"):
+    """Compute every team's ``method`` (``"massey"`` or ``"colley"``)
+    rating after every matchday.
+
+    Returns
+    -------
+    dict
+        Mapping each team to its ratings, before any matches, after every
+        matchday, see :func:`~proggyleg.proggyleg.matchday_ends`, and then
+        after every match so far (if any teams have games in hand).
+    """
+    from .proggyleg import matchday_ends
+
+    try:
+        fn = RATINGS[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown ratings {method}, should be one of "
+            + ", ".join(f"'{m}'" for m in RATINGS)
+        ) from None
+
+    ends = matchday_ends(data)
+    ratings = fn(data, ends)
+    if len(ends) and (ends[-1] == len(data["matches"])):
+        # every team has played the same number of games
+        ratings = ratings[:, :-1]
+    return {team: ratings[i] for i, team in enumerate(data["teams"])}
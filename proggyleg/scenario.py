@@ -0,0 +1,277 @@
+"""What-if scenarios, e.g. "what if Arsenal v Chelsea had finished 0-2" or
+"what if these five fixtures go this way", applied to a season as deltas.
+
+Changing one result only shifts the cumulative points, goal difference and
+goals scored of its two teams, from that game onwards, so a scenario copies
+and patches just those arrays, re-inserts just those teams into the table,
+and recomputes positions only from the earliest changed game. The result
+has the same form as
+:func:`~proggyleg.proggyleg.compute_cumulative_quantities`, so every plot
+works on it directly::
+
+    season = Season(load_season_data(2024, "E0"))
+    data = season.apply({("Arsenal", "Chelsea"): (0, 2)})
+    plot_positions(data)
+
+Many scenarios can be compared at once with :meth:`Season.evaluate`, which
+only computes their final tables.
+"""
+
+import bisect
+
+import numpy as np
+
+
+def match_points(home_goals, away_goals, points=(3, 1, 0)):
+    """The ``(home, away)`` points for a result, given the ``(win, draw,
+    loss)`` points scheme.
+    """
+    win, draw, loss = points
+    if home_goals > away_goals:
+        return win, loss
+    if away_goals > home_goals:
+        return loss, win
+    return draw, draw
+
+
+def _table_key(data, team):
+    # as for ``ranked_teams`` in compute_cumulative_quantities
+    return (
+        data["cumpoints"][team][-1],
+        data["cumgoaldiff"][team][-1],
+        data["cumgoalsscored"][team][-1],
+        team,
+    )
+
+
+class Season:
+    """The state of a season, from which what-if scenarios can be applied.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    """
+
+    def __init__(self, data):
+        from .proggyleg import compute_positions
+
+        self.data = data
+        self.teams = data["teams"]
+        self._index = {team: i for i, team in enumerate(self.teams)}
+
+        # the game number of each match for its home and away team
+        played = dict.fromkeys(self.teams, 0)
+        self._slots = []
+        self._latest = {}
+        for m, (home, away, *_) in enumerate(data["matches"]):
+            self._slots.append((played[home], played[away]))
+            played[home] += 1
+            played[away] += 1
+            self._latest[home, away] = m
+
+        self.positions = compute_positions(data)
+
+    def locate(self, fixture):
+        """Find the match index of ``fixture``, either already an index into
+        ``data["matches"]``, or ``(home, away)`` for their latest meeting.
+        Returns ``None`` if the fixture hasn't been played yet.
+        """
+        if isinstance(fixture, (int, np.integer)):
+            return int(fixture)
+        home, away = fixture
+        for team in (home, away):
+            if team not in self._index:
+                raise KeyError(f"Unknown team {team!r}.")
+        return self._latest.get((home, away), None)
+
+    def reversed_result(self, home, away):
+        """The override that reverses the result of ``home`` v ``away``,
+        e.g. to pass to :meth:`apply`.
+        """
+        m = self.locate((home, away))
+        if m is None:
+            raise KeyError(f"{home} v {away} hasn't been played.")
+        _, _, hg, ag = self.data["matches"][m]
+        return {m: (ag, hg)}
+
+    def _changes(self, results):
+        """Resolve ``results`` into per team lists of ``(slot, points,
+        goals for, goals against)`` changes relative to the original, with
+        slot ``None`` for games added on the end, and the new match list.
+        """
+        base = self.data
+        points = base["rules"]["points"]
+        matches = list(base["matches"])
+        changes = {}
+        for fixture, (hg, ag) in results.items():
+            m = self.locate(fixture)
+            hp, ap = match_points(hg, ag, points)
+            if m is None:
+                home, away = fixture
+                matches.append((home, away, hg, ag))
+                hslot = aslot = None
+                hp0 = ap0 = hg0 = ag0 = 0
+            else:
+                home, away, hg0, ag0 = matches[m]
+                matches[m] = (home, away, hg, ag)
+                hslot, aslot = self._slots[m]
+                hp0, ap0 = match_points(hg0, ag0, points)
+            changes.setdefault(home, []).append(
+                (hslot, hp - hp0, hg - hg0, ag - ag0)
+            )
+            changes.setdefault(away, []).append(
+                (aslot, ap - ap0, ag - ag0, hg - hg0)
+            )
+        return changes, matches
+
+    def apply(self, results):
+        """Apply a scenario.
+
+        Parameters
+        ----------
+        results : dict
+            Mapping fixtures, either ``(home, away)`` or an index into
+            ``data["matches"]``, to ``(home_goals, away_goals)``. A
+            ``(home, away)`` fixture overrides their latest meeting, or is
+            added as a new game if they haven't met yet.
+
+        Returns
+        -------
+        dict
+            A new season, as from
+            :func:`~proggyleg.proggyleg.compute_cumulative_quantities` but
+            also with ``"positions"``, sharing all unchanged arrays with the
+            original.
+        """
+        from .proggyleg import compute_positions, compute_team_matches
+
+        base = self.data
+        changes, matches = self._changes(results)
+
+        new = dict(base, matches=matches)
+        # e.g. if this season is itself a scenario
+        new.pop("positions", None)
+        # the match statistics no longer line up with the matches
+        new.pop("cumstats", None)
+        for key in (
+            "points",
+            "cumpoints",
+            "cumgoaldiff",
+            "cumgoalsscored",
+            "current_points",
+            "games_played",
+        ):
+            new[key] = dict(base[key])
+
+        # the earliest column of the positions array that changes
+        start = base["max_games"]
+        for team, team_changes in changes.items():
+            pts = np.array(base["points"][team])
+            cpts = np.array(base["cumpoints"][team])
+            cgd = np.array(base["cumgoaldiff"][team])
+            cgs = np.array(base["cumgoalsscored"][team])
+            added = []
+            for slot, p, gf, ga in team_changes:
+                if slot is None:
+                    added.append((p, gf, ga))
+                    continue
+                # cumulative arrays start with the 0th game
+                pts[slot] += p
+                cpts[slot + 1 :] += p
+                cgd[slot + 1 :] += gf - ga
+                cgs[slot + 1 :] += gf
+                start = min(start, slot + 1)
+            if added:
+                start = min(start, len(cpts))
+                p, gf, ga = map(np.array, zip(*added))
+                pts = np.concatenate([pts, p])
+                cpts = np.concatenate([cpts, cpts[-1] + np.cumsum(p)])
+                cgd = np.concatenate([cgd, cgd[-1] + np.cumsum(gf - ga)])
+                cgs = np.concatenate([cgs, cgs[-1] + np.cumsum(gf)])
+            new["points"][team] = pts
+            new["cumpoints"][team] = cpts
+            new["cumgoaldiff"][team] = cgd
+            new["cumgoalsscored"][team] = cgs
+            new["current_points"][team] = cpts[-1]
+            new["games_played"][team] = len(cpts)
+
+        num_added = len(matches) - len(base["matches"])
+        if num_added:
+            new["team_ptr"], new["team_matches"], _ = compute_team_matches(
+                np.array([self._index[m[0]] for m in matches]),
+                np.array([self._index[m[1]] for m in matches]),
+                len(self.teams),
+            )
+            # added games have no date
+            new["dates"] = new["cumdates"] = None
+
+        new["max_points"] = max(new["current_points"].values())
+        new["max_games"] = max(new["games_played"].values())
+
+        # re-insert just the changed teams into the table
+        ranked_teams = [t for t in base["ranked_teams"] if t not in changes]
+        keys = [_table_key(new, t) for t in ranked_teams]
+        for team in changes:
+            key = _table_key(new, team)
+            i = bisect.bisect_right(keys, key)
+            keys.insert(i, key)
+            ranked_teams.insert(i, team)
+        new["ranked_teams"] = ranked_teams
+        new["places"] = {team: i for i, team in enumerate(ranked_teams)}
+
+        new["positions"] = compute_positions(new, start, self.positions)
+        return new
+
+    def evaluate(self, scenarios):
+        """Compute just the final tables of many scenarios at once.
+
+        Parameters
+        ----------
+        scenarios : sequence of dict
+            Each as for :meth:`apply`.
+
+        Returns
+        -------
+        dict
+            With keys ``"teams"`` (ordered as ``data["teams"]``), and
+            ``"points"``, ``"goaldiff"``, ``"goalsscored"`` and ``"places"``
+            (0 the bottom, as ``data["places"]``), each with shape
+            ``(len(scenarios), num_teams)``.
+        """
+        base = self.data
+        n = len(self.teams)
+        num_scenarios = len(scenarios)
+
+        def finals(quantity):
+            x = np.array([base[quantity][t][-1] for t in self.teams])
+            return np.tile(x, (num_scenarios, 1))
+
+        points = finals("cumpoints")
+        goaldiff = finals("cumgoaldiff")
+        goalsscored = finals("cumgoalsscored")
+
+        for s, results in enumerate(scenarios):
+            changes, _ = self._changes(results)
+            for team, team_changes in changes.items():
+                i = self._index[team]
+                for _, p, gf, ga in team_changes:
+                    points[s, i] += p
+                    goaldiff[s, i] += gf - ga
+                    goalsscored[s, i] += gf
+
+        # ties are finally broken by name, as for ``ranked_teams``
+        names = np.broadcast_to(np.arange(n), points.shape)
+        order = np.lexsort((names, goalsscored, goaldiff, points), axis=1)
+        places = np.empty_like(order)
+        np.put_along_axis(
+            places, order, np.broadcast_to(np.arange(n), order.shape), axis=1
+        )
+        return {
+            "teams": self.teams,
+            "points": points,
+            "goaldiff": goaldiff,
+            "goalsscored": goalsscored,
+            "places": places,
+        }
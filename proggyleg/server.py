@@ -0,0 +1,306 @@
+"""A small local HTTP service for up-to-date plots, e.g. for embedding in a
+dashboard. Plots are served at::
+
+    /{league}/{year}/{which}.{svg,png}?highlight={team}
+
+Rendered figures are kept in an in-memory LRU cache with a byte budget,
+served with ETags (so clients can revalidate with ``If-None-Match`` and get a
+``304``), and concurrent identical requests are coalesced into a single
+render. Rendering happens in a worker pool so the event loop never blocks.
+Figures of the live season expire with the download cache of the workers,
+see :func:`~proggyleg.proggyleg.download_epoch`, so whichever worker
+renders a figure, it never uses data older than the figure's epoch.
+
+Run with ``python -m proggyleg.server``.
+"""
+
+import asyncio
+import collections
+import contextlib
+import functools
+import hashlib
+import urllib.parse
+
+from .proggyleg import download_epoch, render_autoplot
+
+CONTENT_TYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+}
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class RenderCache:
+    """LRU cache of rendered figures, evicting the least recently used
+    entries once the total size of their bodies exceeds ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= len(entry["body"])
+        return entry
+
+    def put(self, key, entry):
+        self.pop(key)
+        if len(entry["body"]) > self.max_bytes:
+            # would evict everything else and still not fit
+            return
+        self._entries[key] = entry
+        self.nbytes += len(entry["body"])
+        while self.nbytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= len(old["body"])
+
+
+def _init_worker(ttl):
+    import matplotlib
+
+    from . import proggyleg
+
+    matplotlib.use("Agg")
+    proggyleg.DOWNLOAD_TTL = ttl
+
+
+class PlotServer:
+    """Serve :func:`~proggyleg.proggyleg.autoplot` figures over HTTP.
+
+    Parameters
+    ----------
+    host, port : str, int
+        Where to listen.
+    max_bytes : int, optional
+        The byte budget of the rendered figure cache.
+    ttl : float, optional
+        How many seconds the downloads and figures of the current (live)
+        season are cached for, see
+        :func:`~proggyleg.proggyleg.download_epoch`. Past seasons never
+        expire.
+    executor : concurrent.futures.Executor, optional
+        Where to render figures. Rendering is thread-safe, but matplotlib
+        draws one figure at a time per process, so this defaults to a
+        process pool. A custom executor's workers should use a
+        ``DOWNLOAD_TTL`` of ``ttl``.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8050,
+        max_bytes=64 * 2**20,
+        ttl=600.0,
+        executor=None,
+        max_workers=None,
+    ):
+        self.host = host
+        self.port = port
+        self.ttl = ttl
+        self.cache = RenderCache(max_bytes)
+        if executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # don't fork, the workers would inherit open client sockets
+            executor = ProcessPoolExecutor(
+                max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(ttl,),
+            )
+        self.executor = executor
+        self._inflight = {}
+        self.num_renders = 0
+
+    def _is_stale(self, key, entry):
+        return entry["epoch"] != download_epoch(key[1], self.ttl)
+
+    async def _render(self, key):
+        league, year, which, highlight, fmt = key
+        # n.b. taken before rendering, so the figure expires no later than
+        # the data it was rendered with
+        epoch = download_epoch(year, self.ttl)
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(
+            self.executor,
+            functools.partial(
+                render_autoplot,
+                year,
+                league,
+                which=which,
+                highlight=highlight,
+                format=fmt,
+            ),
+        )
+        self.num_renders += 1
+        entry = {
+            "body": body,
+            "etag": f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+            "content_type": CONTENT_TYPES[fmt],
+            "epoch": epoch,
+        }
+        self.cache.put(key, entry)
+        return entry
+
+    async def get_figure(self, key):
+        """Get the rendered figure for ``key``, which is ``(league, year,
+        which, highlight, format)``, rendering it if needed. Concurrent
+        calls for the same key share a single render.
+        """
+        entry = self.cache.get(key)
+        if (entry is not None) and not self._is_stale(key, entry):
+            return entry
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def parse_path(self, target):
+        url = urllib.parse.urlsplit(target)
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 3:
+            return None
+        league, year, filename = parts
+        which, _, fmt = filename.rpartition(".")
+        if (fmt not in CONTENT_TYPES) or (not year.isdigit()) or not which:
+            return None
+        query = urllib.parse.parse_qs(url.query)
+        highlight = query.get("highlight", [None])[0]
+        return league, year, which, highlight, fmt
+
+    async def handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                method, target, _ = request.decode("latin-1").split()
+            except ValueError:
+                return await self.respond(writer, 400)
+            if method not in ("GET", "HEAD"):
+                return await self.respond(writer, 405)
+
+            key = self.parse_path(target)
+            if key is None:
+                return await self.respond(writer, 404)
+
+            try:
+                entry = await self.get_figure(key)
+            except ValueError as e:
+                # e.g. unknown plot type
+                return await self.respond(writer, 400, str(e).encode())
+            except Exception as e:  # noqa: BLE001
+                # whatever else went wrong, the client still gets a response
+                return await self.respond(writer, 500, repr(e).encode())
+
+            extra = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+            if headers.get("if-none-match") == entry["etag"]:
+                return await self.respond(writer, 304, headers=extra)
+
+            return await self.respond(
+                writer,
+                200,
+                entry["body"],
+                content_type=entry["content_type"],
+                headers=extra,
+                head=(method == "HEAD"),
+            )
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def respond(
+        self,
+        writer,
+        status,
+        body=b"",
+        content_type="text/plain; charset=utf-8",
+        headers=None,
+        head=False,
+    ):
+        lines = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            f"Content-Length: {len(body)}",
+            "Connection: close",
+        ]
+        if status != 304:
+            lines.append(f"Content-Type: {content_type}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body and not head and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+    async def start(self):
+        return await asyncio.start_server(self.handle, self.host, self.port)
+
+    async def serve_forever(self):
+        server = await self.start()
+        print(f"Serving plots on http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+
+
+def serve(host="127.0.0.1", port=8050, **kwargs):
+    """Run a :class:`PlotServer` until interrupted."""
+    server = PlotServer(host, port, **kwargs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--max-bytes", type=int, default=64 * 2**20)
+    parser.add_argument("--ttl", type=float, default=600.0)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+    serve(
+        args.host,
+        args.port,
+        max_bytes=args.max_bytes,
+        ttl=args.ttl,
+        max_workers=args.max_workers,
+    )
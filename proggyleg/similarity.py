@@ -0,0 +1,231 @@
+"""Which past seasons looked most like this one? A nearest-neighbour index
+over every team-season's cumulative points (or position) curve, aligned by
+games played, e.g.::
+
+    index = load_trajectory_index(range(2000, 2025))
+    similar = index.query_season(load_season_data(2025, "E0"), k=10)
+    similar["Arsenal"]["final_position"]
+
+All curves are stored as rows of one normalised matrix, along with the
+running sum of their squares, so the distances from a batch of query
+prefixes of length ``L`` to every team-season are a single matrix product
+with the first ``L`` columns, for any ``L``.
+"""
+
+import json
+import pathlib
+
+import numpy as np
+
+
+def normalised_curves(data, which="cumulative"):
+    """Every team's curve, starting before any games, normalised to be
+    comparable between leagues: cumulative points in units of a win, or
+    position as the fraction of the way up the table (1 the top).
+    """
+    from .proggyleg import compute_positions
+
+    if which == "cumulative":
+        win = max(data["rules"]["points"])
+        return {
+            team: np.asarray(cpts, dtype=float) / win
+            for team, cpts in data["cumpoints"].items()
+        }
+    if which == "position":
+        positions = compute_positions(data) / max(data["num_teams"] - 1, 1)
+        return {
+            team: positions[i, : data["games_played"][team]]
+            for i, team in enumerate(data["teams"])
+        }
+    raise ValueError(
+        f"Unknown curve {which}, should be 'cumulative' or 'position'."
+    )
+
+
+class TrajectoryIndex:
+    """A nearest-neighbour index over team-season curves.
+
+    Parameters
+    ----------
+    seasons : sequence of dict
+        Each the output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    which : {"cumulative", "position"}, optional
+        Which curve to index, see :func:`normalised_curves`.
+    """
+
+    def __init__(self, seasons=(), which="cumulative"):
+        self.which = which
+        self.seasons = []
+        keys, curves, season_ids = [], [], []
+        final_points, final_position, num_teams = [], [], []
+        for data in seasons:
+            self.seasons.append((data["league"], int(data["year"])))
+            for team, ys in normalised_curves(data, which).items():
+                keys.append((data["league"], int(data["year"]), team))
+                curves.append(ys)
+                season_ids.append(len(self.seasons) - 1)
+                final_points.append(data["current_points"][team])
+                final_position.append(data["num_teams"] - data["places"][team])
+                num_teams.append(data["num_teams"])
+        self._build(
+            keys,
+            curves,
+            np.array(season_ids, dtype=int),
+            np.array(final_points, dtype=float),
+            np.array(final_position, dtype=int),
+            np.array(num_teams, dtype=int),
+        )
+
+    def _build(
+        self, keys, curves, season_ids, final_points, final_position, num_teams
+    ):
+        self.keys = keys
+        self.season_ids = season_ids
+        self.final_points = final_points
+        self.final_position = final_position
+        self.num_teams = num_teams
+        self.lengths = np.array([len(ys) for ys in curves], dtype=int)
+        max_length = self.lengths.max(initial=0)
+        self.curves = np.zeros((len(curves), max_length))
+        for i, ys in enumerate(curves):
+            self.curves[i, : len(ys)] = ys
+        # the squared norm of every prefix of every curve
+        self.prefix_norms = np.cumsum(self.curves**2, axis=1)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def query(self, curves, k=10, exclude=()):
+        """Find the ``k`` team-seasons whose curves were closest to each of
+        ``curves`` over the same games.
+
+        Parameters
+        ----------
+        curves : array_like
+            Shape ``(num_queries, length)``, normalised curves all starting
+            before any games, see :func:`normalised_curves`.
+        k : int, optional
+            How many neighbours to find.
+        exclude : sequence of tuple, optional
+            ``(league, year)`` seasons to leave out, e.g. the query's own.
+
+        Returns
+        -------
+        dict
+            With keys ``"keys"``, the ``(league, year, team)`` of each
+            neighbour, and arrays with shape ``(num_queries, k)``:
+            ``"index"``, ``"distance"`` (root mean square, per game),
+            ``"final_points"``, ``"final_position"`` (1 the top) and
+            ``"num_teams"``.
+        """
+        curves = np.atleast_2d(np.asarray(curves, dtype=float))
+        length = curves.shape[1]
+        if length > self.curves.shape[1]:
+            raise ValueError(
+                f"Curves of length {length} are longer than any indexed."
+            )
+
+        d2 = (
+            (curves**2).sum(axis=1)[:, None]
+            + self.prefix_norms[:, length - 1]
+            - 2 * curves @ self.curves[:, :length].T
+        )
+        invalid = self.lengths < length
+        if exclude:
+            excluded = [
+                i for i, s in enumerate(self.seasons) if s in set(exclude)
+            ]
+            invalid |= np.isin(self.season_ids, excluded)
+        d2[:, invalid] = np.inf
+
+        k = min(k, int((~invalid).sum()))
+        index = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        d2 = np.take_along_axis(d2, index, axis=1)
+        order = np.argsort(d2, axis=1)
+        index = np.take_along_axis(index, order, axis=1)
+        d2 = np.take_along_axis(d2, order, axis=1)
+
+        return {
+            "keys": [[self.keys[i] for i in row] for row in index],
+            "index": index,
+            # n.b. clipping any rounding error below zero
+            "distance": np.sqrt(np.clip(d2, 0, None) / length),
+            "final_points": self.final_points[index],
+            "final_position": self.final_position[index],
+            "num_teams": self.num_teams[index],
+        }
+
+    def query_season(self, data, k=10, exclude_self=True):
+        """Find the ``k`` most similar team-seasons for every team in
+        ``data`` so far, batching together teams that have played the same
+        number of games.
+
+        Returns
+        -------
+        dict
+            Mapping each team to its neighbours, as for :meth:`query`
+            without the leading axis.
+        """
+        curves = normalised_curves(data, self.which)
+        exclude = [(data["league"], int(data["year"]))] if exclude_self else ()
+
+        by_length = {}
+        for team, ys in curves.items():
+            by_length.setdefault(len(ys), []).append(team)
+
+        results = {}
+        for teams in by_length.values():
+            found = self.query([curves[t] for t in teams], k, exclude)
+            for i, team in enumerate(teams):
+                results[team] = {key: value[i] for key, value in found.items()}
+        return results
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            which=self.which,
+            seasons=json.dumps(self.seasons),
+            keys=json.dumps(self.keys),
+            curves=self.curves,
+            lengths=self.lengths,
+            season_ids=self.season_ids,
+            final_points=self.final_points,
+            final_position=self.final_position,
+            num_teams=self.num_teams,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(pathlib.Path(path)) as f:
+            self = cls(which=str(f["which"]))
+            self.seasons = [tuple(s) for s in json.loads(str(f["seasons"]))]
+            lengths = f["lengths"]
+            self._build(
+                [tuple(key) for key in json.loads(str(f["keys"]))],
+                [ys[:n] for ys, n in zip(f["curves"], lengths)],
+                f["season_ids"],
+                f["final_points"],
+                f["final_position"],
+                f["num_teams"],
+            )
+        return self
+
+
+def load_trajectory_index(
+    years,
+    leagues=("E0",),
+    which="cumulative",
+    source="auto",
+    max_workers=8,
+):
+    """Load every season of ``leagues`` in ``years``, in parallel, and
+    build a :class:`TrajectoryIndex` of them. Seasons that fail to load
+    are skipped with a warning.
+    """
+    from .proggyleg import load_all_season_data
+
+    seasons = load_all_season_data(
+        years, leagues, source, max_workers=max_workers
+    )
+    return TrajectoryIndex(list(seasons.values()), which)
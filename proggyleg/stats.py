@@ -0,0 +1,189 @@
+"""Match statistics from football-data (shots, corners, cards and half-time
+scores), as a columnar store of ``(num_matches, 2)`` home and away arrays.
+
+Older files lack some or all of these columns, so each season's store only
+has the statistics its file records, and blank entries are ``nan``. Aligned
+with a season's matches, every statistic is accumulated for and against
+each team with the same team-match incidence as the points, so cumulative
+and rolling versions of all of them cost a few array operations, e.g. for
+the ``"shots"``, ``"discipline"`` and ``"comebacks"`` plots.
+"""
+
+import numpy as np
+
+# the home and away football-data columns of each statistic
+STATS = {
+    "shots": ("HS", "AS"),
+    "shots_on_target": ("HST", "AST"),
+    "corners": ("HC", "AC"),
+    "yellow_cards": ("HY", "AY"),
+    "red_cards": ("HR", "AR"),
+    "half_time_goals": ("HTHG", "HTAG"),
+}
+
+
+def parse_footballdata_stats(contents):
+    """Extract the statistics of every played match in a football-data csv,
+    in the same order as
+    :func:`~proggyleg.proggyleg.parse_footballdata_data`.
+
+    Returns
+    -------
+    dict
+        With keys ``"home"`` and ``"away"`` (lists of team names), and
+        ``"stats"``, mapping the name of each statistic of :data:`STATS`
+        the file records to its home and away values, shape
+        ``(num_matches, 2)``, ``nan`` where blank.
+    """
+    from .proggyleg import (
+        canonical_team_name,
+        columns_to_float,
+        read_footballdata_table,
+    )
+
+    rows, col = read_footballdata_table(contents)
+    names = [
+        name
+        for name, columns in STATS.items()
+        if all(c in col for c in columns)
+    ]
+    columns = [col[c] for name in names for c in STATS[name]]
+    values = columns_to_float(rows, columns).reshape(len(rows), len(names), 2)
+
+    return {
+        "home": [canonical_team_name(row[col["HomeTeam"]]) for row in rows],
+        "away": [canonical_team_name(row[col["AwayTeam"]]) for row in rows],
+        "stats": {name: values[:, i] for i, name in enumerate(names)},
+    }
+
+
+def load_season_stats(year, league="E0"):
+    """Load the statistics store of a single season."""
+    from .proggyleg import get_footballdata
+
+    return parse_footballdata_stats(get_footballdata(str(year), league))
+
+
+def align_stats(data, store):
+    """Align the statistics in ``store`` with ``data["matches"]``, matching
+    each fixture by its teams (and occurrence), with ``nan`` for matches
+    the store lacks.
+
+    Returns
+    -------
+    dict
+        Mapping each statistic to its home and away values, shape
+        ``(num_matches, 2)``.
+    """
+    from .proggyleg import count_meetings
+
+    lookup = {
+        key: i
+        for i, key in enumerate(
+            count_meetings(list(zip(store["home"], store["away"])))
+        )
+    }
+    rows = np.array(
+        [
+            lookup.get(key, -1)
+            for key in count_meetings([(h, a) for h, a, *_ in data["matches"]])
+        ],
+        dtype=int,
+    )
+    found = (rows >= 0)[:, None]
+    return {
+        name: np.where(found, values[np.maximum(rows, 0)], np.nan).reshape(
+            -1, 2
+        )
+        for name, values in store["stats"].items()
+    }
+
+
+def second_half_points(data, half_time_goals):
+    """The points each side gained (or lost) after half-time in each match,
+    i.e. its points from the final score minus those it would have got
+    from the half-time score, shape ``(num_matches, 2)``.
+    """
+    win, draw, loss = data["rules"]["points"]
+
+    def points(goals):
+        home, away = goals[:, 0], goals[:, 1]
+        home_points = np.where(
+            home > away, win, np.where(home < away, loss, draw)
+        )
+        away_points = np.where(
+            away > home, win, np.where(away < home, loss, draw)
+        )
+        return np.stack([home_points, away_points], axis=1).astype(float)
+
+    goals = np.array([m[2:4] for m in data["matches"]], dtype=float)
+    half_time = points(half_time_goals)
+    # n.b. nan comparisons are all false, so mask unknown half-time scores
+    known = np.isfinite(half_time_goals).all(axis=1)[:, None]
+    return np.where(known, points(goals.reshape(-1, 2)) - half_time, np.nan)
+
+
+def compute_cumulative_stats(data, store=None):
+    """Accumulate every statistic for and against every team, as the
+    points are, along with ``"second_half_points"`` if half-time scores
+    are recorded.
+
+    Parameters
+    ----------
+    data : dict
+        The output of
+        :func:`~proggyleg.proggyleg.compute_cumulative_quantities`.
+    store : dict, optional
+        A statistics store of this season, by default loaded with
+        :func:`load_season_stats`.
+
+    Returns
+    -------
+    dict
+        Mapping each statistic to ``{"for": ..., "against": ...}``, each
+        mapping every team to its cumulative values, aligned with
+        ``data["cumpoints"]`` (i.e. starting with 0 before any games).
+        Unrecorded values count as 0.
+    """
+    if store is None:
+        store = load_season_stats(data["year"], data["league"])
+    stats = align_stats(data, store)
+    if "half_time_goals" in stats:
+        stats["second_half_points"] = second_half_points(
+            data, stats["half_time_goals"]
+        )
+
+    teams = data["teams"]
+    index = {team: i for i, team in enumerate(teams)}
+    team_ptr, team_matches = data["team_ptr"], data["team_matches"]
+    owner = np.repeat(np.arange(len(teams)), np.diff(team_ptr))
+    home = np.array([index[m[0]] for m in data["matches"]], dtype=int)
+    # whether each team was home (0) or away (1) in each of its matches
+    sides = (home[team_matches] != owner).astype(int)
+
+    def per_team(flat):
+        # one cumulative sum over every team's matches, then offset
+        total = np.concatenate([[0.0], np.cumsum(np.nan_to_num(flat))])
+        return {
+            team: total[team_ptr[i] : team_ptr[i + 1] + 1] - total[team_ptr[i]]
+            for i, team in enumerate(teams)
+        }
+
+    return {
+        name: {
+            "for": per_team(values[team_matches, sides]),
+            "against": per_team(values[team_matches, 1 - sides]),
+        }
+        for name, values in stats.items()
+    }
+
+
+def rolling(cumulative, window_size=5):
+    """The mean per game over the last ``window_size`` games (or all games
+    so far, if fewer) after each game, from ``cumulative`` values starting
+    with 0 before any games.
+    """
+    cumulative = np.asarray(cumulative, dtype=float)
+    games = np.arange(1, len(cumulative))
+    start = np.maximum(games - window_size, 0)
+    return (cumulative[games] - cumulative[start]) / (games - start)
@@ -0,0 +1,180 @@
+"""Streaming download and parsing of match data, so that a usable table of
+the live season is available while the rest of the file is still arriving,
+e.g.::
+
+    for data in stream_season_data(2025, "E0", every=50):
+        plot_positions(data)
+
+The response is read line by line as chunks arrive, each played match is
+parsed as soon as its line is complete, and inserted into columns kept
+sorted by date. The files are already nearly in date order, so almost every
+insertion is an append, and the matches are available in the same order as
+:func:`~proggyleg.proggyleg.parse_footballdata_data` would give, at any
+point.
+"""
+
+import bisect
+
+import numpy as np
+
+
+def iter_url_lines(url, chunk_size=2**14, timeout=30):
+    """Stream the lines of the text at ``url``, decoded, as they arrive."""
+    import requests
+
+    with requests.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        if response.encoding is None:
+            response.encoding = "utf-8"
+        yield from response.iter_lines(
+            chunk_size=chunk_size, decode_unicode=True
+        )
+
+
+class MatchColumns:
+    """Played matches as columns, kept sorted by the time of each match,
+    with matches at the same time in the order they were inserted.
+    """
+
+    def __init__(self):
+        self.times = []
+        self.home = []
+        self.away = []
+        self.home_goals = []
+        self.away_goals = []
+        # how many insertions weren't appends, i.e. were out of order
+        self.num_moved = 0
+
+    def __len__(self):
+        return len(self.times)
+
+    def insert(self, time, home, away, home_goals, away_goals):
+        i = bisect.bisect_right(self.times, time)
+        if i == len(self.times):
+            self.times.append(time)
+            self.home.append(home)
+            self.away.append(away)
+            self.home_goals.append(home_goals)
+            self.away_goals.append(away_goals)
+        else:
+            self.times.insert(i, time)
+            self.home.insert(i, home)
+            self.away.insert(i, away)
+            self.home_goals.insert(i, home_goals)
+            self.away_goals.insert(i, away_goals)
+            self.num_moved += 1
+
+    def to_matches(self, with_dates=False):
+        """The matches as tuples, as from
+        :func:`~proggyleg.proggyleg.parse_footballdata_data`.
+        """
+        columns = (self.home, self.away, self.home_goals, self.away_goals)
+        if with_dates:
+            columns = ([t.date() for t in self.times], *columns)
+        return list(zip(*columns))
+
+    def to_arrays(self):
+        """The columns as arrays, with keys ``"dates"``, ``"home"``,
+        ``"away"`` and ``"goals"``, the last with shape ``(num_matches, 2)``.
+        """
+        return {
+            "dates": np.array(self.times, dtype="datetime64[D]"),
+            "home": np.array(self.home, dtype=str),
+            "away": np.array(self.away, dtype=str),
+            "goals": np.array(
+                [self.home_goals, self.away_goals], dtype=int
+            ).T.reshape(-1, 2),
+        }
+
+
+def _get_row_parser(source):
+    from .proggyleg import iter_fixturedownload_rows, iter_footballdata_rows
+
+    parsers = {
+        "footballdata": iter_footballdata_rows,
+        "fixturedownload": iter_fixturedownload_rows,
+    }
+    try:
+        return parsers[source]
+    except KeyError:
+        raise ValueError(
+            f"Unknown source {source}, should be 'footballdata' or "
+            "'fixturedownload'."
+        ) from None
+
+
+def stream_matches(lines, source="footballdata", every=None, columns=None):
+    """Parse ``lines`` of a ``source`` CSV as they arrive, inserting every
+    played match into ``columns``.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        The lines, e.g. from :func:`iter_url_lines`.
+    source : {"footballdata", "fixturedownload"}, optional
+        The format of the lines.
+    every : int, optional
+        Also yield the columns after every ``every`` matches parsed.
+    columns : MatchColumns, optional
+        Where to insert the matches, by default new columns.
+
+    Yields
+    ------
+    MatchColumns
+        The same columns, updated in place, after every ``every`` matches
+        and once at the end.
+    """
+    if columns is None:
+        columns = MatchColumns()
+    for i, row in enumerate(_get_row_parser(source)(lines), 1):
+        columns.insert(*row)
+        if every and (i % every == 0):
+            yield columns
+    yield columns
+
+
+def stream_season_data(
+    year,
+    league="E0",
+    source="footballdata",
+    every=None,
+    url=None,
+    chunk_size=2**14,
+):
+    """Download and parse a season, yielding its cumulative quantities,
+    as from :func:`~proggyleg.proggyleg.load_season_data`, for the matches
+    parsed so far after every ``every`` matches, and then for them all.
+
+    ``url`` overrides where to download ``source`` from, otherwise the
+    usual url of the ``league`` and ``year``.
+    """
+    from .proggyleg import (
+        PENALTIES,
+        compute_cumulative_quantities,
+        fixturedownload_url,
+        footballdata_url,
+    )
+
+    year = str(year)
+    if url is None:
+        if source == "fixturedownload":
+            url = fixturedownload_url(year, league)
+        else:
+            url = footballdata_url(year, league)
+
+    penalties = PENALTIES.get((year, league), {})
+    lines = iter_url_lines(url, chunk_size=chunk_size)
+    for columns in stream_matches(lines, source, every):
+        if len(columns):
+            teams = set(columns.home) | set(columns.away)
+            yield compute_cumulative_quantities(
+                columns.to_matches(with_dates=True),
+                # n.b. only of the teams that have played so far
+                penalties={
+                    team: penalty
+                    for team, penalty in penalties.items()
+                    if team in teams
+                },
+                league=league,
+                year=year,
+            )
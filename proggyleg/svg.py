@@ -0,0 +1,428 @@
+"""Compact SVG output. Matplotlib's SVG writer repeats the full style and
+full precision coordinates on every marker instance, defines identical marker
+glyphs once per line, and wraps every artist in its own group. The rewriting
+here keeps the rendering identical while:
+
+- defining each distinct marker glyph once, and drawing all the instances
+  of a team's markers as a single ``<marker>`` placed at the vertices of one
+  invisible path, so that each instance costs only its coordinates,
+- rounding all coordinates to display precision, and writing path data with
+  relative offsets and implicit commands where shorter,
+- merging adjacent line segments with identical style (and that don't
+  overlap, so that any transparency still composites identically),
+- dropping metadata, unreferenced ids and redundant groups, and shortening
+  the remaining ids.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+HREF = f"{{{XLINK_NS}}}href"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN = re.compile(r"[A-Za-z]|" + _NUMBER.pattern)
+_URL_REF = re.compile(r"url\(#([^)]+)\)")
+_TRANSLATE = re.compile(r"translate\([^)]*\)")
+_PATH_ARITY = {"M": 2, "L": 2, "Q": 4, "C": 6, "Z": 0, "z": 0}
+
+
+def _tag(el):
+    return el.tag.rpartition("}")[2]
+
+
+def _format_number(x, precision):
+    s = f"{float(x):.{precision}f}".rstrip("0").rstrip(".")
+    return "0" if s in ("-0", "") else s
+
+
+def _round_numbers(s, precision):
+    return _NUMBER.sub(lambda m: _format_number(m.group(), precision), s)
+
+
+def _join_numbers(numbers):
+    out = []
+    for s in numbers:
+        if out and not s.startswith("-"):
+            out.append(" ")
+        out.append(s)
+    return "".join(out)
+
+
+def _compact_path_data(d, precision):
+    """Round the path data ``d`` and write it as briefly as possible: line
+    segments become relative wherever that is shorter, and repeated commands
+    are implicit. Relative offsets are computed between *rounded* absolute
+    coordinates so that no rounding error accumulates along a path.
+    """
+    tokens = _PATH_TOKEN.findall(d)
+    if any(t.isalpha() and t not in _PATH_ARITY for t in tokens):
+        # not written by matplotlib, just round the numbers
+        return _round_numbers(d, precision)
+
+    commands = []
+    for token in tokens:
+        if token.isalpha():
+            commands.append((token.upper(), []))
+        else:
+            commands[-1][1].append(round(float(token), precision))
+
+    out = []
+    prev = None
+    cx = cy = sx = sy = 0.0
+    for cmd, nums in commands:
+        if cmd == "Z":
+            cmd, args = "z", ""
+            cx, cy = sx, sy
+        else:
+            args = _join_numbers([_format_number(x, precision) for x in nums])
+            if cmd == "L":
+                dx = _format_number(nums[0] - cx, precision)
+                dy = _format_number(nums[1] - cy, precision)
+                rel = _join_numbers([dx, dy])
+                if len(rel) < len(args):
+                    cmd, args = "l", rel
+            elif cmd == "M":
+                sx, sy = nums[:2]
+            cx, cy = nums[-2:]
+
+        if cmd == prev and cmd in "LlCQ":
+            # implicit repetition of the previous command
+            out.append(args if args.startswith("-") else " " + args)
+        else:
+            out.append(cmd + args)
+        prev = cmd
+    return "".join(out)
+
+
+def _parse_style(style):
+    props = {}
+    for item in style.split(";"):
+        name, _, value = item.partition(":")
+        if name.strip():
+            props[name.strip()] = value.strip()
+    return props
+
+
+def _format_style(props):
+    return ";".join(f"{k}:{v}" for k, v in props.items())
+
+
+def _path_bbox(d, pad):
+    xy = [float(x) for x in _NUMBER.findall(d)]
+    xs, ys = xy[0::2], xy[1::2]
+    if not ys:
+        return None
+    return (min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+
+
+def _overlaps(a, b):
+    return not (a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1])
+
+
+def _dedupe_markers(root, parents):
+    """Define each distinct marker path once, moving its style onto the
+    ``<use>`` elements that reference it.
+    """
+    canonical = {}
+    replacements = {}
+    def_styles = {}
+    for defs in root.iter(f"{{{SVG_NS}}}defs"):
+        for el in list(defs):
+            if (_tag(el) != "path") or not {"id", "d"} <= set(el.keys()):
+                continue
+            el_id = el.attrib["id"]
+            def_styles[el_id] = _parse_style(el.attrib.pop("style", ""))
+            key = el.attrib["d"]
+            if key in canonical:
+                replacements[el_id] = canonical[key]
+                defs.remove(el)
+            else:
+                canonical[key] = el_id
+
+    for use in root.iter(f"{{{SVG_NS}}}use"):
+        ref = use.attrib.get(HREF, "")[1:]
+        if ref not in def_styles:
+            continue
+        # the def's own style takes precedence over the inherited use style
+        props = _parse_style(use.attrib.get("style", ""))
+        props.update(def_styles[ref])
+        if props:
+            use.attrib["style"] = _format_style(props)
+        use.attrib[HREF] = "#" + replacements.get(ref, ref)
+
+    # drop any now empty defs
+    for defs in list(root.iter(f"{{{SVG_NS}}}defs")):
+        if len(defs) == 0:
+            parents[defs].remove(defs)
+
+
+def _unwrap_groups(el):
+    """Remove attribute-less groups, splicing their children into the
+    parent, and merge runs of mergeable sibling paths.
+    """
+    new_children = []
+    for child in list(el):
+        _unwrap_groups(child)
+        if _tag(child) == "g" and not child.attrib:
+            new_children.extend(child)
+        else:
+            new_children.append(child)
+    el[:] = _merge_paths(new_children)
+
+
+def _merge_paths(children):
+    merged = []
+    bboxes = []
+    for child in children:
+        prev = merged[-1] if merged else None
+        if (
+            _tag(child) == "path"
+            and prev is not None
+            and _tag(prev) == "path"
+            and "id" not in child.attrib
+            and "id" not in prev.attrib
+            and {k: v for k, v in child.attrib.items() if k != "d"}
+            == {k: v for k, v in prev.attrib.items() if k != "d"}
+        ):
+            style = _parse_style(child.attrib.get("style", ""))
+            if style.get("fill", "none") == "none":
+                pad = float(style.get("stroke-width", "1"))
+                bbox = _path_bbox(child.attrib["d"], pad)
+                if (bbox is not None) and all(
+                    b is not None and not _overlaps(bbox, b) for b in bboxes
+                ):
+                    prev.attrib["d"] += child.attrib["d"]
+                    bboxes.append(bbox)
+                    continue
+
+        merged.append(child)
+        if _tag(child) == "path":
+            style = _parse_style(child.attrib.get("style", ""))
+            pad = float(style.get("stroke-width", "1"))
+            bboxes = [_path_bbox(child.attrib.get("d", ""), pad)]
+        else:
+            bboxes = []
+    return merged
+
+
+def _group_uses(el):
+    """Wrap each run of sibling ``<use>`` elements sharing the same style in
+    a group carrying that style once.
+    """
+    children = []
+    run = []
+
+    def flush():
+        if len(run) > 1:
+            g = ET.Element(f"{{{SVG_NS}}}g", style=run[0].attrib["style"])
+            for use in run:
+                del use.attrib["style"]
+            g[:] = run
+            children.append(g)
+        else:
+            children.extend(run)
+        run.clear()
+
+    for child in el:
+        _group_uses(child)
+        style = child.attrib.get("style")
+        if _tag(child) == "use" and style is not None:
+            if run and run[0].attrib["style"] != style:
+                flush()
+            run.append(child)
+        else:
+            flush()
+            children.append(child)
+    flush()
+    el[:] = children
+
+
+def _markers_to_vertices(root):
+    """Replace each group of identically styled ``<use>`` marker instances
+    with a single invisible path through the marker positions, with the
+    marker drawn at every vertex by an SVG ``<marker>``. This leaves just
+    the coordinates per instance.
+    """
+    markers = {}
+    defs = None
+    for g in list(root.iter(f"{{{SVG_NS}}}g")):
+        uses = list(g)
+        if (
+            len(uses) < 2
+            or "style" not in g.attrib
+            or not set(g.keys()) <= {"style", "clip-path"}
+            or any(
+                _tag(u) != "use" or set(u.keys()) != {HREF, "x", "y"}
+                for u in uses
+            )
+            or len({u.attrib[HREF] for u in uses}) != 1
+        ):
+            continue
+
+        key = (uses[0].attrib[HREF], g.attrib["style"])
+        if key not in markers:
+            if defs is None:
+                defs = ET.Element(f"{{{SVG_NS}}}defs")
+                root.insert(0, defs)
+            marker_id = f"vertex-marker-{len(markers)}"
+            marker = ET.SubElement(
+                defs,
+                f"{{{SVG_NS}}}marker",
+                id=marker_id,
+                markerUnits="userSpaceOnUse",
+                overflow="visible",
+                style=key[1],
+            )
+            ET.SubElement(marker, f"{{{SVG_NS}}}use", {HREF: key[0]})
+            markers[key] = marker_id
+
+        url = f"url(#{markers[key]})"
+        g.tag = f"{{{SVG_NS}}}path"
+        g.attrib["style"] = _format_style(
+            {
+                "fill": "none",
+                "stroke": "none",
+                "marker-start": url,
+                "marker-mid": url,
+                "marker-end": url,
+            }
+        )
+        g.attrib["d"] = "M" + "L".join(
+            f"{u.attrib['x']} {u.attrib['y']}" for u in uses
+        )
+        g[:] = []
+
+
+def _to_base36(i):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    s = ""
+    while True:
+        i, r = divmod(i, 36)
+        s = digits[r] + s
+        if i == 0:
+            return s
+
+
+def _shorten_ids(root):
+    ids = {}
+    for el in root.iter():
+        if "id" in el.attrib:
+            ids[el.attrib["id"]] = "i" + _to_base36(len(ids))
+            el.attrib["id"] = ids[el.attrib["id"]]
+
+    def sub(m):
+        return f"url(#{ids.get(m.group(1), m.group(1))})"
+
+    for el in root.iter():
+        for name, value in el.attrib.items():
+            if name == HREF and value[1:] in ids:
+                el.attrib[name] = "#" + ids[value[1:]]
+            elif "url(#" in value:
+                el.attrib[name] = _URL_REF.sub(sub, value)
+
+
+def compact_svg(svg, precision=2):
+    """Rewrite the matplotlib generated ``svg`` (str or bytes) into a more
+    compact but visually identical form.
+
+    Parameters
+    ----------
+    svg : str or bytes
+        The SVG document.
+    precision : int, optional
+        The number of decimal places to keep for coordinates, which are in
+        units of points, so the default of 2 is well below display
+        resolution.
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(svg, bytes):
+        svg = svg.decode("utf-8")
+    root = ET.fromstring(svg)
+    parents = {c: p for p in root.iter() for c in p}
+
+    for el in list(root):
+        if _tag(el) == "metadata":
+            root.remove(el)
+
+    _dedupe_markers(root, parents)
+
+    referenced = set()
+    for el in root.iter():
+        for name, value in el.attrib.items():
+            if name == HREF:
+                referenced.add(value[1:])
+            else:
+                referenced.update(_URL_REF.findall(value))
+
+    for el in root.iter():
+        if el.attrib.get("id") not in referenced:
+            el.attrib.pop("id", None)
+        if "style" in el.attrib:
+            el.attrib["style"] = _format_style(
+                _parse_style(el.attrib["style"])
+            )
+        if el.text is not None and not el.text.strip():
+            el.text = None
+        el.tail = None
+
+    _unwrap_groups(root)
+    _group_uses(root)
+    _markers_to_vertices(root)
+
+    for el in root.iter():
+        if "d" in el.attrib:
+            el.attrib["d"] = _compact_path_data(el.attrib["d"], precision)
+        for name in ("x", "y", "points"):
+            if name in el.attrib:
+                el.attrib[name] = _round_numbers(el.attrib[name], precision)
+        if "transform" in el.attrib:
+            # only offsets are in display units, scales etc. are not
+            el.attrib["transform"] = _TRANSLATE.sub(
+                lambda m: _round_numbers(m.group(), precision),
+                el.attrib["transform"],
+            )
+
+    _shorten_ids(root)
+
+    return ET.tostring(root, encoding="unicode").replace(" />", "/>")
+
+
+def figure_to_svg(fig, compact=True, precision=2, **kwargs):
+    """Render ``fig`` to an SVG string, optionally compacted with
+    :func:`compact_svg`. Extra ``kwargs`` are passed to ``savefig``.
+    """
+    from .proggyleg import render_figure
+
+    svg = render_figure(fig, format="svg", **kwargs).decode("utf-8")
+    if compact:
+        svg = compact_svg(svg, precision=precision)
+    return svg
+
+
+def use_compact_svg(precision=2):
+    """Make IPython display matplotlib figures as compact SVG, i.e. as
+    ``%config InlineBackend.figure_formats = ['svg']`` does, but passing the
+    output through :func:`compact_svg`.
+    """
+    from IPython import get_ipython
+    from matplotlib.figure import Figure
+
+    ip = get_ipython()
+    if ip is None:
+        return
+
+    formatter = ip.display_formatter.formatters["image/svg+xml"]
+    formatter.for_type(
+        Figure,
+        lambda fig: figure_to_svg(
+            fig, precision=precision, bbox_inches="tight"
+        ),
+    )